@@ -1,17 +1,58 @@
 """
 Authentication dependencies (Neo4j version)
 """
-from typing import Optional
+from typing import Any, Dict
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from app.core.security import decode_token
+from app.core.config import settings
+from app.schemas.auth import Principal
+from app.services.token_service import TokenService
 from app.services.user_service import UserService
 from app.models.user_neo4j import User
 
 security = HTTPBearer()
 
 
-def get_current_user(
+def _unauthorized(detail: str = "Could not validate credentials") -> HTTPException:
+    """401 with a bearer challenge"""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _inactive() -> HTTPException:
+    """403 for a deactivated user"""
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Inactive user"
+    )
+
+
+def _validated_payload(credentials: HTTPAuthorizationCredentials) -> Dict[str, Any]:
+    """Access token payload that is valid and not revoked"""
+    payload = TokenService.decode_access(credentials.credentials)
+    if payload is None:
+        raise _unauthorized()
+    if TokenService.is_revoked(payload["sub"], payload.get("ver", 0)):
+        raise _unauthorized("Token has been revoked")
+    return payload
+
+
+async def _load_user(payload: Dict[str, Any]) -> User:
+    """User a validated payload identifies, checked against the stored token version"""
+    user = await UserService.get_by_id_async(payload["sub"])
+    if user is None:
+        raise _unauthorized("User not found")
+    if (user.token_version or 0) != payload.get("ver", 0):
+        raise _unauthorized("Token has been revoked")
+    if not user.is_active:
+        raise _inactive()
+    return user
+
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> User:
     """
@@ -26,46 +67,7 @@ def get_current_user(
     Raises:
         HTTPException: If authentication fails
     """
-    token = credentials.credentials
-    payload = decode_token(token)
-
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    if payload.get("type") != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token type",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    user_id: Optional[str] = payload.get("sub")
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    user = UserService.get_by_id(user_id)
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Inactive user"
-        )
-
-    return user
+    return await _load_user(_validated_payload(credentials))
 
 
 def get_current_active_user(
@@ -73,8 +75,28 @@ def get_current_active_user(
 ) -> User:
     """Get current active user"""
     if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Inactive user"
-        )
+        raise _inactive()
     return current_user
+
+
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Principal:
+    """
+    Get the current active identity without loading the user
+
+    For endpoints that need only the user's uid. The token's claims and the
+    revocation table stand in for the database; tokens without claims, or
+    all tokens when CLAIMS_PRINCIPALS is off, fall back to loading the user.
+
+    Raises:
+        HTTPException: If authentication fails
+    """
+    payload = _validated_payload(credentials)
+    if not settings.CLAIMS_PRINCIPALS or "ver" not in payload or "active" not in payload:
+        user = await _load_user(payload)
+        return Principal(uid=user.uid, is_active=user.is_active, token_version=user.token_version or 0)
+
+    if not payload["active"]:
+        raise _inactive()
+    return Principal(uid=payload["sub"], is_active=True, token_version=payload["ver"])
@@ -2,11 +2,23 @@
 Astrology API endpoints for Flutter app
 Provides birth chart, transits, and cosmic influence calculations
 """
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
+from app.api.v1.dependencies.auth import get_current_principal
+from app.core.config import settings
+from app.schemas.auth import Principal
 from app.services.astrology_service import AstrologyService
+from app.services.birth_chart_service import BirthChartService
+from app.services.chart_batch_service import ChartBatchService
+from app.services.chart_executor import ExecutorSaturated
+from app.services.cosmic_influence_service import CosmicInfluenceService
+from app.services.timeline_service import TimelineService
+from app.services.transit_service import TransitService
+from app.utils.responses import APIJSONResponse
 
 router = APIRouter()
 
@@ -45,6 +57,16 @@ class BirthChartResponse(BaseModel):
     house_positions: List[int] = []  # Placeholder
 
 
+class BirthChartBatchRequest(BaseModel):
+    """Batch birth chart calculation request"""
+    items: List[BirthChartRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.ASTROLOGY_BATCH_MAX_ITEMS,
+        description="Birth chart requests; results are tagged with their index in this list"
+    )
+
+
 class TransitPlanet(BaseModel):
     """Current planetary transit"""
     planet: str
@@ -72,10 +94,46 @@ class CosmicInfluenceResponse(BaseModel):
     active_transits: List[TransitPlanet]
     lucky_raag: Optional[str] = None
     overall_score: float
+    snapshot_at: Optional[str] = None  # When the active transits were computed
+
+
+PLANET_FIELDS = tuple(PlanetData.model_fields)
+HOUSE_POSITIONS = list(range(1, 13))
+
+
+def birth_chart_response_content(chart_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert AstrologyService chart data to BirthChartResponse content
+
+    The service already produces correctly typed planets, so the content is
+    built as plain dictionaries in the model's field order and returned
+    through APIJSONResponse without validation.
+    """
+    planets = [{field: planet.get(field) for field in PLANET_FIELDS} for planet in chart_data['planets']]
+
+    # Extract ascendant degree (first planet in list should be Asc)
+    ascendant_degree = 0.0
+    for planet in chart_data['planets']:
+        if planet['name'].lower() == 'asc' and planet['degree']:
+            ascendant_degree = planet['degree']
+            break
+
+    return {
+        'lagna': chart_data['lagna'],
+        'lagna_hindi': chart_data['lagna_hindi'],
+        'sun_sign': chart_data['sun_sign'],
+        'sun_sign_hindi': chart_data['sun_sign_hindi'],
+        'moon_sign': chart_data['moon_sign'],
+        'moon_sign_hindi': chart_data['moon_sign_hindi'],
+        'planets': planets,
+        'suggested_raag': chart_data['suggested_raag'],
+        'ascendant_degree': ascendant_degree,
+        'house_positions': HOUSE_POSITIONS,  # Houses 1-12
+    }
 
 
 @router.post("/birth-chart", response_model=BirthChartResponse)
-def calculate_birth_chart(request: BirthChartRequest):
+async def calculate_birth_chart(request: BirthChartRequest):
     """
     Calculate Vedic birth chart
 
@@ -85,6 +143,10 @@ def calculate_birth_chart(request: BirthChartRequest):
     - Planetary positions
     - Raag recommendations
 
+    The calculation runs on the dedicated chart executor. When its queue
+    is full the request is rejected immediately with 503 and a
+    Retry-After header.
+
     Args:
         request: Birth chart request with date, time, and location
 
@@ -96,7 +158,7 @@ def calculate_birth_chart(request: BirthChartRequest):
         birth_date = datetime.fromisoformat(request.birth_date.replace('Z', '+00:00'))
 
         # Calculate birth chart using AstrologyService
-        chart_data = AstrologyService.calculate_birth_chart(
+        chart_data = await AstrologyService.calculate_birth_chart_async(
             birth_date=birth_date,
             birth_time=request.birth_time,
             latitude=request.birth_latitude,
@@ -104,29 +166,14 @@ def calculate_birth_chart(request: BirthChartRequest):
             timezone=request.timezone
         )
 
-        # Convert to response format
-        planets = [PlanetData(**planet) for planet in chart_data['planets']]
-
-        # Extract ascendant degree (first planet in list should be Asc)
-        ascendant_degree = 0.0
-        for planet in chart_data['planets']:
-            if planet['name'].lower() == 'asc' and planet['degree']:
-                ascendant_degree = planet['degree']
-                break
-
-        return BirthChartResponse(
-            lagna=chart_data['lagna'],
-            lagna_hindi=chart_data['lagna_hindi'],
-            sun_sign=chart_data['sun_sign'],
-            sun_sign_hindi=chart_data['sun_sign_hindi'],
-            moon_sign=chart_data['moon_sign'],
-            moon_sign_hindi=chart_data['moon_sign_hindi'],
-            planets=planets,
-            suggested_raag=chart_data['suggested_raag'],
-            ascendant_degree=ascendant_degree,
-            house_positions=list(range(1, 13))  # Houses 1-12
-        )
+        return APIJSONResponse(birth_chart_response_content(chart_data))
 
+    except ExecutorSaturated as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Chart computation is busy, please retry shortly",
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -139,42 +186,53 @@ def calculate_birth_chart(request: BirthChartRequest):
         )
 
 
+@router.post("/birth-charts:batch")
+async def calculate_birth_charts_batch(request: BirthChartBatchRequest):
+    """
+    Calculate many Vedic birth charts in one request
+
+    Charts are computed on a pool of worker processes and streamed back as
+    newline-delimited JSON in completion order. Each line carries the
+    `index` of its input item and either `"status": "ok"` with a `chart`
+    in the single-chart response format, or `"status": "error"` with an
+    `error` message. One bad item never fails the rest of the batch.
+
+    Args:
+        request: Batch of birth chart requests
+
+    Returns:
+        NDJSON stream of per-item results
+    """
+    items = [item.model_dump() for item in request.items]
+
+    async def ndjson_lines():
+        async for result in ChartBatchService.stream(items):
+            if result['status'] == 'ok':
+                try:
+                    result['chart'] = birth_chart_response_content(result['chart'])
+                except Exception as e:
+                    result = {'index': result['index'], 'status': 'error', 'error': str(e)}
+            yield orjson.dumps(result) + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/transits", response_model=List[TransitPlanet])
-def get_current_transits():
+def get_current_transits(response: Response):
     """
     Get current planetary transits
 
     Returns current positions of all major planets and their influences.
+    All requests within a time bucket share one computed snapshot; its
+    timestamp is returned in the X-Transit-Snapshot-At header.
 
     Returns:
         List of current planetary transits
     """
     try:
-        # Calculate transits for current time
-        now = datetime.now()
-
-        # Use current location (can be made configurable)
-        # Using Delhi coordinates as default
-        chart_data = AstrologyService.calculate_birth_chart(
-            birth_date=now,
-            birth_time=now.strftime("%H:%M"),
-            latitude=28.7041,
-            longitude=77.1025,
-            timezone="Asia/Kolkata"
-        )
-
-        transits = []
-        for planet in chart_data['planets']:
-            if planet['name'].lower() not in ['asc', 'mc']:  # Exclude angles
-                transits.append(TransitPlanet(
-                    planet=planet['name'],
-                    current_sign=planet['sign'] or "Unknown",
-                    description=f"{planet['name']} in {planet['sign']}",
-                    influence="Neutral",  # Can be enhanced with aspects
-                    intensity=0.5
-                ))
-
-        return transits
+        snapshot = TransitService.get_snapshot()
+        response.headers["X-Transit-Snapshot-At"] = snapshot['snapshot_at'].isoformat()
+        return [TransitPlanet(**transit) for transit in snapshot['transits']]
 
     except Exception as e:
         raise HTTPException(
@@ -183,8 +241,48 @@ def get_current_transits():
         )
 
 
+@router.get("/transits/timeline")
+def get_transit_timeline(
+    start: datetime = Query(..., description="Range start, ISO 8601 (UTC if no offset)"),
+    end: datetime = Query(..., description="Range end, ISO 8601 (UTC if no offset)")
+):
+    """
+    Get transit events over a date range
+
+    Streams each planet's sign ingresses, nakshatra changes and retrograde
+    stations between start and end as newline-delimited JSON in time order.
+    Event times are accurate to the minute.
+
+    Args:
+        start: Range start
+        end: Range end
+
+    Returns:
+        NDJSON stream of transit events
+    """
+    start = start if start.tzinfo else start.replace(tzinfo=timezone.utc)
+    end = end if end.tzinfo else end.replace(tzinfo=timezone.utc)
+
+    if end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must be after start"
+        )
+    if (end - start).days > settings.TRANSIT_TIMELINE_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range is limited to {settings.TRANSIT_TIMELINE_MAX_DAYS} days"
+        )
+
+    def ndjson_lines():
+        for event in TimelineService.iter_events(start, end):
+            yield orjson.dumps(event) + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.post("/cosmic-influence", response_model=CosmicInfluenceResponse)
-def calculate_cosmic_influence(request: CosmicInfluenceRequest):
+def calculate_cosmic_influence(request: CosmicInfluenceRequest, response: Response):
     """
     Calculate today's cosmic influence
 
@@ -201,39 +299,59 @@ def calculate_cosmic_influence(request: CosmicInfluenceRequest):
         Cosmic influence analysis
     """
     try:
-        # Get current transits
-        transits = get_current_transits()
-
-        # Extract birth chart info
-        sun_sign = request.birth_chart.get('sun_sign', '')
-        moon_sign = request.birth_chart.get('moon_sign', '')
-        ascendant = request.birth_chart.get('ascendant', '')
-
-        # Get raag recommendations
-        raags = AstrologyService.get_recommended_raags(
-            lagna=ascendant,
-            moon_sign=moon_sign
-        )
-        lucky_raag = raags[0] if raags else None
+        # Get current transits from the shared snapshot
+        snapshot = TransitService.get_snapshot()
+        snapshot_at = snapshot['snapshot_at'].isoformat()
+        response.headers["X-Transit-Snapshot-At"] = snapshot_at
 
-        # Generate cosmic influence analysis
-        return CosmicInfluenceResponse(
+        return CosmicInfluenceResponse(**CosmicInfluenceService.compute(
             user_id=request.user_id,
+            birth_chart=request.birth_chart,
             date=request.date,
-            energy_level="Moderate",  # Can be enhanced with actual transit analysis
-            dominant_moods=["Calm", "Focused"],
-            overall_description=f"Today's cosmic energy is favorable for introspection and creative pursuits. "
-                              f"Your {ascendant} ascendant is well-supported by current planetary positions.",
-            recommendations=[
-                f"Listen to {lucky_raag} to harmonize with cosmic energies",
-                "Practice meditation during sunset",
-                "Focus on creative projects today"
-            ],
-            active_transits=transits,
-            lucky_raag=lucky_raag,
-            overall_score=75.0
+            transits=snapshot['transits'],
+            snapshot_at=snapshot_at
+        ))
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error calculating cosmic influence: {str(e)}"
         )
 
+
+@router.get("/cosmic-influence/today", response_model=CosmicInfluenceResponse)
+def get_todays_cosmic_influence(
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    Get the current user's cosmic influence for their local today
+
+    Influences are precomputed nightly, so this is normally a single
+    indexed read. If today's influence hasn't been precomputed yet it is
+    computed from the user's birth chart and stored.
+
+    Args:
+        current_user: Current authenticated user
+
+    Returns:
+        Cosmic influence analysis
+
+    Raises:
+        HTTPException: If the user has no birth chart
+    """
+    influence = CosmicInfluenceService.get_today(current_user.uid)
+    if influence is not None:
+        return CosmicInfluenceResponse(**influence)
+
+    chart = BirthChartService.get_by_user_id(current_user.uid)
+    if not chart:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Birth chart not found. Please create one first."
+        )
+
+    try:
+        return CosmicInfluenceResponse(**CosmicInfluenceService.compute_today(current_user.uid, chart))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,57 +1,94 @@
 """
 Authentication endpoints (Neo4j version)
 """
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
+from app.core.config import settings
 from app.schemas.auth import Token, LoginRequest, RefreshTokenRequest
-from app.schemas.user import UserCreate, User
-from app.services.user_service import UserService
-from app.core.security import create_access_token, create_refresh_token, decode_token
+from app.schemas.user import UserCreate, User, user_content
+from app.services.user_service import EmailAlreadyRegistered, UserService
+from app.services.auth_rate_limiter import RateLimited, get_rate_limiter
+from app.services.hash_executor import HashExecutorSaturated
+from app.services.token_service import TokenService
+from app.core.security import decode_token
+from app.utils.responses import APIJSONResponse
 
 router = APIRouter()
 
 
+def _hashing_busy(e: HashExecutorSaturated) -> HTTPException:
+    """503 for a full password hashing queue"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, please retry shortly",
+        headers={"Retry-After": str(e.retry_after)},
+    )
+
+
+async def _limit_attempts(action: str, request: Request, email: str) -> None:
+    """429 once a client or an email has used up its attempts, before any hashing"""
+    if not settings.AUTH_RATE_LIMIT_ENABLED:
+        return
+    try:
+        await get_rate_limiter().check(action, request, email)
+    except RateLimited as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts, please retry later",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate):
+async def register(user_data: UserCreate, request: Request):
     """
     Register a new user
 
     Args:
         user_data: User registration data
+        request: Incoming request (for the client address)
 
     Returns:
         Created user
 
     Raises:
-        HTTPException: If email already exists
+        HTTPException: If email already exists or too many attempts were made
     """
-    # Check if user already exists
-    existing_user = UserService.get_by_email(user_data.email)
-    if existing_user:
+    await _limit_attempts("register", request, user_data.email)
+
+    # One CREATE; the unique email constraint rejects duplicates
+    try:
+        user = await UserService.create_async(user_data)
+    except EmailAlreadyRegistered:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
-
-    # Create user
-    user = UserService.create(user_data)
-    return user
+    except HashExecutorSaturated as e:
+        raise _hashing_busy(e)
+    return APIJSONResponse(user_content(user), status_code=status.HTTP_201_CREATED)
 
 
 @router.post("/login", response_model=Token)
-def login(login_data: LoginRequest):
+async def login(login_data: LoginRequest, request: Request):
     """
     Login with email and password
 
     Args:
         login_data: Login credentials
+        request: Incoming request (for the client address)
 
     Returns:
         Access and refresh tokens
 
     Raises:
-        HTTPException: If authentication fails
+        HTTPException: If authentication fails or too many attempts were made
     """
-    user = UserService.authenticate(login_data.email, login_data.password)
+    await _limit_attempts("login", request, login_data.email)
+
+    try:
+        user = await UserService.authenticate_async(login_data.email, login_data.password)
+    except HashExecutorSaturated as e:
+        raise _hashing_busy(e)
 
     if not user:
         raise HTTPException(
@@ -66,15 +103,7 @@ def login(login_data: LoginRequest):
             detail="Inactive user"
         )
 
-    # Create tokens
-    access_token = create_access_token(data={"sub": user.id})
-    refresh_token = create_refresh_token(data={"sub": user.id})
-
-    return Token(
-        access_token=access_token,
-        refresh_token=refresh_token,
-        token_type="bearer"
-    )
+    return TokenService.issue(user)
 
 
 @router.post("/refresh", response_model=Token)
@@ -117,12 +146,12 @@ def refresh_token(refresh_data: RefreshTokenRequest):
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Create new tokens
-    access_token = create_access_token(data={"sub": user.id})
-    new_refresh_token = create_refresh_token(data={"sub": user.id})
+    # Tokens issued before a password change or deactivation are revoked
+    if (user.token_version or 0) != payload.get("ver", 0):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-    return Token(
-        access_token=access_token,
-        refresh_token=new_refresh_token,
-        token_type="bearer"
-    )
+    return TokenService.issue(user)
@@ -1,11 +1,19 @@
 """
 Birth Chart endpoints (Neo4j version)
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from app.schemas.birth_chart import BirthChart, BirthChartCreate, BirthChartData
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from app.core.config import settings
+from app.schemas.auth import Principal
+from app.schemas.birth_chart import (
+    BirthChart, BirthChartCreate, BirthChartData, RecommendedRaag, SimilarChart, birth_chart_content
+)
 from app.services.birth_chart_service import BirthChartService
-from app.api.v1.dependencies.auth import get_current_active_user
+from app.services.raag_recommendation_service import RaagRecommendationService
+from app.services.similarity_service import ChartSimilarityService
+from app.api.v1.dependencies.auth import get_current_active_user, get_current_principal
 from app.models.user_neo4j import User
+from app.utils.responses import APIJSONResponse
 
 router = APIRouter()
 
@@ -26,12 +34,12 @@ def create_birth_chart(
         Created/updated birth chart
     """
     chart = BirthChartService.create_or_update(current_user, chart_data)
-    return chart
+    return APIJSONResponse(birth_chart_content(chart, current_user.uid), status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/me", response_model=BirthChart)
 def get_my_birth_chart(
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Get birth chart for current user
@@ -45,7 +53,7 @@ def get_my_birth_chart(
     Raises:
         HTTPException: If birth chart not found
     """
-    chart = BirthChartService.get_by_user(current_user)
+    chart = BirthChartService.get_by_user_id(current_user.uid, with_detail=True)
 
     if not chart:
         raise HTTPException(
@@ -53,12 +61,12 @@ def get_my_birth_chart(
             detail="Birth chart not found. Please create one first."
         )
 
-    return chart
+    return APIJSONResponse(birth_chart_content(chart, current_user.uid))
 
 
 @router.get("/me/data", response_model=BirthChartData)
 def get_my_birth_chart_data(
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Get parsed birth chart data for current user
@@ -72,7 +80,7 @@ def get_my_birth_chart_data(
     Raises:
         HTTPException: If birth chart not found
     """
-    chart = BirthChartService.get_by_user(current_user)
+    chart = BirthChartService.get_by_user_id(current_user.uid, with_detail=True)
 
     if not chart:
         raise HTTPException(
@@ -96,9 +104,67 @@ def get_my_birth_chart_data(
     )
 
 
+@router.get("/me/raags", response_model=List[RecommendedRaag])
+def get_my_recommended_raags(
+    limit: int = Query(10, ge=1, le=50),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    Get raags recommended for the current user's birth chart
+
+    Args:
+        limit: Maximum number of raags
+        current_user: Current authenticated user
+
+    Returns:
+        Recommended raags, highest score first
+
+    Raises:
+        HTTPException: If birth chart not found
+    """
+    raags = RaagRecommendationService.get_for_user(current_user.uid, limit)
+
+    if not raags and not BirthChartService.get_by_user_id(current_user.uid):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Birth chart not found. Please create one first."
+        )
+
+    return raags
+
+
+@router.get("/me/similar", response_model=List[SimilarChart])
+def get_similar_birth_charts(
+    k: int = Query(10, ge=1, le=settings.SIMILARITY_MAX_K),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    Find users whose charts are most similar to the current user's
+
+    Args:
+        k: Number of users to return
+        current_user: Current authenticated user
+
+    Returns:
+        Similar users, most similar first
+
+    Raises:
+        HTTPException: If birth chart not found
+    """
+    chart = BirthChartService.get_by_user_id(current_user.uid, with_detail=True)
+
+    if not chart:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Birth chart not found. Please create one first."
+        )
+
+    return ChartSimilarityService.similar(chart, k)
+
+
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 def delete_my_birth_chart(
-    current_user: User = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Delete birth chart for current user
@@ -109,7 +175,7 @@ def delete_my_birth_chart(
     Raises:
         HTTPException: If birth chart not found
     """
-    chart = BirthChartService.get_by_user(current_user)
+    chart = BirthChartService.get_by_user_id(current_user.uid)
 
     if not chart:
         raise HTTPException(
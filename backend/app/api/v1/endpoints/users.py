@@ -2,11 +2,12 @@
 User endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from app.schemas.user import User, UserUpdate, UserWithChartStatus
+from app.schemas.user import User, UserUpdate, UserWithChartStatus, user_content
 from app.services.user_service import UserService
 from app.services.birth_chart_service import BirthChartService
 from app.api.v1.dependencies.auth import get_current_active_user
 from app.models.user_neo4j import User as UserModel
+from app.utils.responses import APIJSONResponse
 
 router = APIRouter()
 
@@ -25,12 +26,9 @@ async def get_current_user_info(
         User information with birth chart status
     """
     # Check if user has birth chart
-    birth_chart = BirthChartService.get_by_user_id(current_user.uid)
+    has_birth_chart = await BirthChartService.has_chart_async(current_user.uid)
 
-    return UserWithChartStatus(
-        **current_user.to_dict(),
-        has_birth_chart=birth_chart is not None
-    )
+    return APIJSONResponse(user_content(current_user, has_birth_chart=has_birth_chart))
 
 
 @router.put("/me", response_model=User)
@@ -50,15 +48,15 @@ async def update_current_user(
     """
     # If email is being updated, check if it's already taken
     if user_data.email and user_data.email != current_user.email:
-        existing_user = UserService.get_by_email(user_data.email)
+        existing_user = await UserService.get_by_email_async(user_data.email)
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already in use"
             )
 
-    updated_user = UserService.update(current_user, user_data)
-    return updated_user
+    updated_user = await UserService.update_async(current_user, user_data)
+    return APIJSONResponse(user_content(updated_user))
 
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
@@ -71,4 +69,4 @@ async def delete_current_user(
     Args:
         current_user: Current authenticated user
     """
-    UserService.delete(current_user)
+    await UserService.delete_async(current_user)
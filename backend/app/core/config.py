@@ -1,7 +1,7 @@
 """
 Core configuration for AstroMusic API
 """
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -24,12 +24,37 @@ class Settings(BaseSettings):
     NEO4J_USER: str = "neo4j"
     NEO4J_PASSWORD: str
     NEO4J_DATABASE: str = "neo4j"
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = 100  # Per driver (sync and async)
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = 60.0  # Seconds to wait for a pooled connection
+    NEO4J_MAX_CONNECTION_LIFETIME: float = 3600.0  # Seconds before a pooled connection is replaced
+    NEO4J_KEEP_ALIVE: bool = True  # TCP keep-alive on Bolt connections
+    NEO4J_HEALTH_CHECK_TIMEOUT: float = 2.0  # Seconds allowed for the /health RETURN 1
+    SCHEMA_BOOTSTRAP_ON_STARTUP: bool = True  # Install constraints/indexes and seed reference data
 
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000  # 0 disables the authenticated-user cache
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000  # 0 disables the validated-token cache
+    CLAIMS_PRINCIPALS: bool = True  # Identity-only endpoints trust token claims instead of loading the user
+    BCRYPT_ROUNDS: int = 12  # Hashes with fewer rounds are upgraded on login
+    PASSWORD_HASH_WORKERS: int = 0  # 0 = one thread per CPU core
+    PASSWORD_HASH_QUEUE_SIZE: int = 256  # Hashes waiting beyond the busy threads
+
+    # Login/registration rate limiting (token buckets, checked before any hashing)
+    AUTH_RATE_LIMIT_ENABLED: bool = True
+    AUTH_RATE_LIMIT_BACKEND: Literal["memory", "redis"] = "memory"  # redis shares buckets across workers
+    AUTH_RATE_LIMIT_REDIS_URL: str = "redis://localhost:6379/0"
+    AUTH_RATE_LIMIT_IP_BURST: int = 20
+    AUTH_RATE_LIMIT_IP_PER_MINUTE: float = 10.0
+    AUTH_RATE_LIMIT_EMAIL_BURST: int = 5
+    AUTH_RATE_LIMIT_EMAIL_PER_MINUTE: float = 2.0
+    AUTH_RATE_LIMIT_SHARDS: int = 64
+    AUTH_RATE_LIMIT_MAX_KEYS: int = 100000  # Memory backend; least recently used buckets are dropped
+    AUTH_RATE_LIMIT_TRUST_FORWARDED: bool = False  # Take the client IP from X-Forwarded-For
 
     # CORS
     CORS_ORIGINS: List[str] = [
@@ -37,6 +62,51 @@ class Settings(BaseSettings):
         "http://localhost:8080",
     ]
 
+    # Astrology
+    # vedicastro needs flatlib's sidereal branch (flatlib.const.AY_LAHIRI);
+    # with the PyPI flatlib 0.2.3 every chart falls back to the default
+    ASTROLOGY_ENGINE: Literal["vedicastro", "swisseph"] = "swisseph"
+    ASTROLOGY_CACHE_MAX_ENTRIES: int = 2048  # 0 disables the chart cache
+    ASTROLOGY_CACHE_TTL_SECONDS: int = 86400
+    ASTROLOGY_CACHE_COORD_PRECISION: int = 4  # Decimal places (~11m)
+    ASTROLOGY_PROCESS_WORKERS: int = 0  # 0 = one worker per CPU core
+    ASTROLOGY_EXECUTOR_QUEUE_SIZE: int = 64  # Jobs waiting beyond the busy workers
+    ASTROLOGY_BATCH_MAX_ITEMS: int = 10000
+
+    # Ephemeris (precomputed transit positions)
+    EPHEMERIS_PATH: str = "./data/ephemeris.npy"
+    EPHEMERIS_START_YEAR: int = 2000
+    EPHEMERIS_END_YEAR: int = 2060
+    EPHEMERIS_STEP_HOURS: float = 6.0
+    EPHEMERIS_BUILD_ON_STARTUP: bool = True
+
+    # Transit snapshot
+    TRANSIT_SNAPSHOT_BUCKET_SECONDS: int = 300
+    TRANSIT_SNAPSHOT_REFRESH_AHEAD_SECONDS: int = 30
+    TRANSIT_TIMELINE_MAX_DAYS: int = 3660
+
+    # Daily cosmic influence precomputation
+    DAILY_INFLUENCE_PAGE_SIZE: int = 500
+    DAILY_INFLUENCE_CHECKPOINT_PATH: str = "./data/daily_influence.checkpoint.json"
+    DAILY_INFLUENCE_RETENTION_DAYS: int = 30  # Older influences are pruned after each run; 0 keeps them
+    DAILY_INFLUENCE_PRUNE_BATCH_SIZE: int = 1000
+    DAILY_INFLUENCE_PRUNE_MAX_BATCHES: int = 100  # Per run
+
+    # Chart similarity index
+    SIMILARITY_INDEX_LISTS: int = 0  # 0 = square root of the chart count
+    SIMILARITY_INDEX_PROBES: int = 8
+    SIMILARITY_MAX_K: int = 50
+    SIMILARITY_REFRESH_SECONDS: int = 30  # How often a worker pulls charts written by other workers; 0 = never
+
+    # Orphan sweeper
+    ORPHAN_SWEEP_INTERVAL_SECONDS: int = 3600  # 0 = disabled
+    ORPHAN_SWEEP_BATCH_SIZE: int = 500
+    ORPHAN_SWEEP_MAX_BATCHES: int = 20  # Per kind per sweep
+
+    # Bulk import/export
+    BULK_BATCH_SIZE: int = 500
+    BULK_CHECKPOINT_DIR: str = "./data"
+
     # File Storage
     UPLOAD_DIR: str = "./uploads"
     MAX_UPLOAD_SIZE: int = 52428800  # 50MB
@@ -1,31 +1,163 @@
 """
 Neo4j database configuration
 """
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+from neo4j import AsyncDriver, AsyncGraphDatabase, Driver, GraphDatabase, Record, RoutingControl
 from neomodel import config, db
 from app.core.config import settings
 
+_async_driver: Optional[AsyncDriver] = None
+
+
+def _driver_options() -> Dict[str, Any]:
+    """Credentials and connection pool settings shared by both drivers"""
+    return {
+        'auth': (settings.NEO4J_USER, settings.NEO4J_PASSWORD) if settings.NEO4J_USER else None,
+        'max_connection_pool_size': settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+        'connection_acquisition_timeout': settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+        'max_connection_lifetime': settings.NEO4J_MAX_CONNECTION_LIFETIME,
+        'keep_alive': settings.NEO4J_KEEP_ALIVE,
+    }
+
 
 def init_neo4j():
-    """Initialize Neo4j connection"""
-    # Set Neo4j connection
-    config.DATABASE_URL = settings.NEO4J_URI
-
-    # Set credentials if provided
-    if settings.NEO4J_USER and settings.NEO4J_PASSWORD:
-        config.DATABASE_URL = config.DATABASE_URL.replace(
-            "bolt://",
-            f"bolt://{settings.NEO4J_USER}:{settings.NEO4J_PASSWORD}@"
-        )
+    """
+    Initialize Neo4j connection
 
-    print(f"📊 Connected to Neo4j at {settings.NEO4J_URI}")
+    Creates one pooled driver and hands it to neomodel. neomodel keeps its
+    connection per thread, so without a shared driver every threadpool
+    worker would open its own driver and pool.
+    """
+    if getattr(config, 'DRIVER', None) is None:
+        config.DRIVER = GraphDatabase.driver(settings.NEO4J_URI, **_driver_options())
+        config.DATABASE_NAME = settings.NEO4J_DATABASE
+
+    print(f"📊 Connected to Neo4j at {settings.NEO4J_URI} "
+          f"(pool size {settings.NEO4J_MAX_CONNECTION_POOL_SIZE})")
 
 
 def close_neo4j():
     """Close Neo4j connection"""
-    # Neomodel handles connection pooling automatically
+    driver: Optional[Driver] = getattr(config, 'DRIVER', None)
+    if driver is not None:
+        config.DRIVER = None
+        db.driver = None
+        driver.close()
     print("📊 Neo4j connection closed")
 
 
 def get_neo4j_driver():
     """Get Neo4j driver instance"""
     return db
+
+
+def deflate_properties(model, obj, values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert Python values to their stored form using the model's property types
+
+    Only the given properties are converted, so defaults (e.g. a fresh uid)
+    are never written for properties that aren't being changed.
+    """
+    properties = model.defined_properties(aliases=False, rels=False)
+    return {
+        properties[name].db_property or name: None if value is None else properties[name].deflate(value, obj)
+        for name, value in values.items()
+    }
+
+
+def pool_stats(driver: Optional[Any]) -> Dict[str, Any]:
+    """
+    Connection counts of a driver's pool
+
+    The driver has no public pool API, so this reads its pool internals and
+    reports nothing rather than failing if they change.
+    """
+    pool = getattr(driver, '_pool', None)
+    if pool is None:
+        return {}
+    try:
+        connections = [connection for queue in list(pool.connections.values()) for connection in list(queue)]
+        in_use = sum(1 for connection in connections if connection.in_use)
+        return {
+            'max_size': pool.pool_config.max_connection_pool_size,
+            'in_use': in_use,
+            'idle': len(connections) - in_use,
+        }
+    except Exception:
+        return {}
+
+
+def neo4j_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Connection counts of the async and the neomodel (sync) driver pools"""
+    return {'async': pool_stats(_async_driver), 'sync': pool_stats(getattr(config, 'DRIVER', None))}
+
+
+async def check_neo4j() -> Dict[str, Any]:
+    """
+    Time a RETURN 1 round trip and report both connection pools
+
+    The check is unhealthy if the query fails, exceeds
+    NEO4J_HEALTH_CHECK_TIMEOUT, or the async pool has no free connection.
+
+    Returns:
+        Dictionary with 'ok', 'latency_ms', 'error' and 'pools'
+    """
+    driver = get_async_driver()
+    started = time.perf_counter()
+    error = None
+    try:
+        await asyncio.wait_for(
+            driver.execute_query("RETURN 1", database_=settings.NEO4J_DATABASE, routing_=RoutingControl.READ),
+            timeout=settings.NEO4J_HEALTH_CHECK_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        error = f"RETURN 1 timed out after {settings.NEO4J_HEALTH_CHECK_TIMEOUT}s"
+    except Exception as e:
+        error = str(e) or e.__class__.__name__
+    latency_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    pools = neo4j_pool_stats()
+    async_pool = pools['async']
+    if error is None and async_pool and async_pool['in_use'] >= async_pool['max_size']:
+        error = "Connection pool exhausted"
+
+    return {'ok': error is None, 'latency_ms': latency_ms, 'error': error, 'pools': pools}
+
+
+def get_async_driver() -> AsyncDriver:
+    """
+    Get the shared async driver, creating it on first use
+
+    The driver owns a pool of Bolt connections sized by
+    NEO4J_MAX_CONNECTION_POOL_SIZE; sessions borrow from it.
+    """
+    global _async_driver
+    if _async_driver is None:
+        _async_driver = AsyncGraphDatabase.driver(settings.NEO4J_URI, **_driver_options())
+    return _async_driver
+
+
+async def close_async_driver() -> None:
+    """Close the async driver and its connection pool"""
+    global _async_driver
+    if _async_driver is not None:
+        driver, _async_driver = _async_driver, None
+        await driver.close()
+
+
+async def read_query(query: str, **params: Any) -> List[Record]:
+    """Run a read query in a managed (retried) transaction"""
+    records, _, _ = await get_async_driver().execute_query(
+        query, params, database_=settings.NEO4J_DATABASE, routing_=RoutingControl.READ
+    )
+    return records
+
+
+async def write_query(query: str, **params: Any) -> List[Record]:
+    """Run a write query in a managed (retried) transaction"""
+    records, _, _ = await get_async_driver().execute_query(
+        query, params, database_=settings.NEO4J_DATABASE, routing_=RoutingControl.WRITE
+    )
+    return records
@@ -0,0 +1,152 @@
+"""
+Reference data seeded into Neo4j: zodiac signs, planets, raags and nakshatras
+"""
+from app.services.astrology_service import AstrologyService
+
+# (name_english, element, quality, ruling_planet); Hindi names come from AstrologyService
+_SIGN_ATTRIBUTES = [
+    ("Aries", "Fire", "Cardinal", "Mars"),
+    ("Taurus", "Earth", "Fixed", "Venus"),
+    ("Gemini", "Air", "Mutable", "Mercury"),
+    ("Cancer", "Water", "Cardinal", "Moon"),
+    ("Leo", "Fire", "Fixed", "Sun"),
+    ("Virgo", "Earth", "Mutable", "Mercury"),
+    ("Libra", "Air", "Cardinal", "Venus"),
+    ("Scorpio", "Water", "Fixed", "Mars"),
+    ("Sagittarius", "Fire", "Mutable", "Jupiter"),
+    ("Capricorn", "Earth", "Cardinal", "Saturn"),
+    ("Aquarius", "Air", "Fixed", "Saturn"),
+    ("Pisces", "Water", "Mutable", "Jupiter"),
+]
+
+ZODIAC_SIGNS = [
+    {
+        'name_english': name,
+        'name_hindi': AstrologyService.ZODIAC_SIGNS_HINDI[name],
+        'element': element,
+        'quality': quality,
+        'ruling_planet': ruler,
+    }
+    for name, element, quality, ruler in _SIGN_ATTRIBUTES
+]
+
+# Every raag AstrologyService can recommend
+_RAAG_ATTRIBUTES = [
+    {
+        'name': "Bhairav", 'name_hindi': "भैरव", 'thaat': "Bhairav", 'time_of_day': "Dawn",
+        'moods': ["Devotional", "Serious"], 'description': "Powerful morning raag",
+    },
+    {
+        'name': "Bhairavi", 'name_hindi': "भैरवी", 'thaat': "Bhairavi", 'time_of_day': "Morning",
+        'moods': ["Devotional", "Compassionate"], 'description': "Tender raag traditionally sung to close a concert",
+    },
+    {
+        'name': "Desh", 'name_hindi': "देश", 'thaat': "Khamaj", 'time_of_day': "Night",
+        'moods': ["Romantic", "Uplifting"], 'description': "Monsoon raag of longing and joy",
+    },
+    {
+        'name': "Malkauns", 'name_hindi': "मालकौंस", 'thaat': "Bhairavi", 'time_of_day': "Late night",
+        'moods': ["Meditative", "Serious"], 'description': "Deep pentatonic raag for introspection",
+    },
+    {
+        'name': "Khamaj", 'name_hindi': "खमाज", 'thaat': "Khamaj", 'time_of_day': "Night",
+        'moods': ["Romantic", "Playful"], 'description': "Light, lyrical raag",
+    },
+    {
+        'name': "Yaman", 'name_hindi': "यमन", 'thaat': "Kalyan", 'time_of_day': "Evening",
+        'moods': ["Calm", "Romantic"], 'description': "Soothing evening raag",
+    },
+    {
+        'name': "Darbari Kanada", 'name_hindi': "दरबारी कान्हड़ा", 'thaat': "Asavari", 'time_of_day': "Late night",
+        'moods': ["Grave", "Majestic"], 'description': "Stately court raag",
+    },
+    {
+        'name': "Kafi", 'name_hindi': "काफ़ी", 'thaat': "Kafi", 'time_of_day': "Night",
+        'moods': ["Romantic", "Playful"], 'description': "Folk-tinged raag of spring festivities",
+    },
+    {
+        'name': "Basant", 'name_hindi': "बसंत", 'thaat': "Purvi", 'time_of_day': "Night",
+        'moods': ["Joyful", "Celebratory"], 'description': "Raag of spring",
+    },
+    {
+        'name': "Marwa", 'name_hindi': "मारवा", 'thaat': "Marwa", 'time_of_day': "Sunset",
+        'moods': ["Restless", "Introspective"], 'description': "Twilight raag of anticipation",
+    },
+    {
+        'name': "Shree", 'name_hindi': "श्री", 'thaat': "Purvi", 'time_of_day': "Sunset",
+        'moods': ["Devotional", "Grave"], 'description': "Ancient, solemn sunset raag",
+    },
+    {
+        'name': "Todi", 'name_hindi': "तोड़ी", 'thaat': "Todi", 'time_of_day': "Late morning",
+        'moods': ["Devotional", "Yearning"], 'description': "Poignant morning raag",
+    },
+]
+
+# Raags traditionally associated with each graha
+PLANET_RAAGS = {
+    "Sun": ["Bhairav", "Shree"],
+    "Moon": ["Yaman", "Desh"],
+    "Mars": ["Marwa"],
+    "Mercury": ["Khamaj"],
+    "Jupiter": ["Darbari Kanada"],
+    "Venus": ["Kafi", "Basant"],
+    "Saturn": ["Malkauns"],
+    "Rahu": ["Todi"],
+    "Ketu": ["Bhairavi"],
+}
+
+PLANETS = [{'name': name} for name in PLANET_RAAGS]
+
+RAAGS = [
+    {
+        **raag,
+        'associated_signs': [sign for sign, name in AstrologyService.ZODIAC_RAAGAS.items() if name == raag['name']],
+        'associated_planets': [planet for planet, names in PLANET_RAAGS.items() if raag['name'] in names],
+    }
+    for raag in _RAAG_ATTRIBUTES
+]
+
+# (name_hindi, ruling planet, deity, symbol) in order; names come from AstrologyService
+_NAKSHATRA_ATTRIBUTES = [
+    ("अश्विनी", "Ketu", "Ashvins", "Horse's head"),
+    ("भरणी", "Venus", "Yama", "Yoni"),
+    ("कृत्तिका", "Sun", "Agni", "Razor"),
+    ("रोहिणी", "Moon", "Prajapati", "Chariot"),
+    ("मृगशिरा", "Mars", "Soma", "Deer's head"),
+    ("आर्द्रा", "Rahu", "Rudra", "Teardrop"),
+    ("पुनर्वसु", "Jupiter", "Aditi", "Bow and quiver"),
+    ("पुष्य", "Saturn", "Brihaspati", "Cow's udder"),
+    ("आश्लेषा", "Mercury", "Nagas", "Coiled serpent"),
+    ("मघा", "Ketu", "Pitrs", "Royal throne"),
+    ("पूर्वाफाल्गुनी", "Venus", "Bhaga", "Front legs of a bed"),
+    ("उत्तराफाल्गुनी", "Sun", "Aryaman", "Back legs of a bed"),
+    ("हस्त", "Moon", "Savitr", "Hand"),
+    ("चित्रा", "Mars", "Tvashtr", "Bright jewel"),
+    ("स्वाति", "Rahu", "Vayu", "Young shoot"),
+    ("विशाखा", "Jupiter", "Indra and Agni", "Triumphal arch"),
+    ("अनुराधा", "Saturn", "Mitra", "Lotus"),
+    ("ज्येष्ठा", "Mercury", "Indra", "Earring"),
+    ("मूल", "Ketu", "Nirriti", "Bunch of roots"),
+    ("पूर्वाषाढ़ा", "Venus", "Apas", "Fan"),
+    ("उत्तराषाढ़ा", "Sun", "Vishvadevas", "Elephant tusk"),
+    ("श्रवण", "Moon", "Vishnu", "Ear"),
+    ("धनिष्ठा", "Mars", "Vasus", "Drum"),
+    ("शतभिषा", "Rahu", "Varuna", "Empty circle"),
+    ("पूर्वभाद्रपदा", "Jupiter", "Aja Ekapada", "Front legs of a funeral cot"),
+    ("उत्तरभाद्रपदा", "Saturn", "Ahir Budhnya", "Back legs of a funeral cot"),
+    ("रेवती", "Mercury", "Pushan", "Fish"),
+]
+
+NAKSHATRAS = [
+    {
+        'name': name,
+        'name_hindi': hindi,
+        'number': number,
+        'ruling_deity': deity,
+        'symbol': symbol,
+        'characteristics': {'ruling_planet': ruler},
+    }
+    for number, (name, (hindi, ruler, deity, symbol)) in enumerate(
+        zip(AstrologyService.NAKSHATRAS, _NAKSHATRA_ATTRIBUTES), start=1
+    )
+]
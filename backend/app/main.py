@@ -1,12 +1,28 @@
 """
 AstroMusic API - Main application
 """
+import asyncio
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.api.v1.api import api_router
-from app.db.neo4j_base import init_neo4j, close_neo4j
+from app.db.neo4j_base import init_neo4j, close_neo4j, get_async_driver, close_async_driver, check_neo4j, neo4j_pool_stats
+from app.services.astrology_service import AstrologyService
+from app.services.ephemeris_service import EphemerisService
+from app.services.schema_service import SchemaService
+from app.services.similarity_service import ChartSimilarityService
+from app.services.sweeper_service import SweeperService
+from app.services.transit_service import TransitService
+from app.services.warmup_service import WarmupService
+from app.services.chart_executor import start_chart_executor, shutdown_chart_executor, get_chart_executor
+from app.services.hash_executor import start_hash_executor, shutdown_hash_executor, get_hash_executor
+from app.services.auth_rate_limiter import start_rate_limiter, shutdown_rate_limiter, get_rate_limiter
+from app.services.user_service import UserService
+from app.services.token_service import TokenService
+from app.utils.identity_map import IdentityMapMiddleware
+from app.utils.responses import APIJSONResponse
 
 
 @asynccontextmanager
@@ -15,9 +31,23 @@ async def lifespan(app: FastAPI):
     # Startup: Initialize Neo4j connection
     print("🚀 Starting AstroMusic API...")
     init_neo4j()
+    get_async_driver()
+    start_chart_executor()
+    start_hash_executor()
+    start_rate_limiter()
+    if settings.EPHEMERIS_BUILD_ON_STARTUP:
+        EphemerisService.start_background_build()
+    WarmupService.start()
+    SweeperService.start()
     yield
     # Shutdown: Close Neo4j connection
     print("👋 Shutting down AstroMusic API...")
+    await WarmupService.stop()
+    await SweeperService.stop()
+    shutdown_chart_executor()
+    shutdown_hash_executor()
+    await shutdown_rate_limiter()
+    await close_async_driver()
     close_neo4j()
 
 
@@ -29,6 +59,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=APIJSONResponse,
 )
 
 # Setup CORS
@@ -40,6 +71,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# One identity map per request, so a node is loaded at most once
+app.add_middleware(IdentityMapMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
@@ -52,14 +86,51 @@ async def root():
         "version": settings.APP_VERSION,
         "description": "AstroMusic API - Vedic astrology meets AI-generated Indian classical music",
         "docs": "/docs",
-        "health": "/health"
+        "health": "/health",
+        "ready": "/ready"
     }
 
 
 @app.get("/health")
 async def health():
-    """Health check endpoint"""
+    """Health check endpoint: 503 if Neo4j doesn't answer or its pool is exhausted"""
+    database = await check_neo4j()
+    return JSONResponse(
+        status_code=200 if database["ok"] else 503,
+        content={
+            "status": "healthy" if database["ok"] else "unhealthy",
+            "environment": settings.ENVIRONMENT,
+            "database": database,
+        },
+    )
+
+
+@app.get("/ready")
+async def ready():
+    """Readiness check: 200 once warm-up has finished, Neo4j is healthy and every index exists"""
+    report = WarmupService.report()
+    database = await check_neo4j()
+    schema_ok = report["finished"] and database["ok"] and await asyncio.to_thread(SchemaService.verify)
+    report["ready"] = report["ready"] and database["ok"] and schema_ok
+    report["database"] = database
+    report["schema"] = SchemaService.status()
+    status_code = 200 if report["ready"] else 503
+    return JSONResponse(status_code=status_code, content=report)
+
+
+@app.get("/metrics")
+async def metrics():
+    """Runtime metrics for the executors and caches"""
     return {
-        "status": "healthy",
-        "environment": settings.ENVIRONMENT
+        "neo4j_pool": neo4j_pool_stats(),
+        "chart_executor": get_chart_executor().stats(),
+        "password_hashing": get_hash_executor().stats(),
+        "auth_rate_limit": get_rate_limiter().stats(),
+        "chart_cache": AstrologyService.cache_stats(),
+        "principal_cache": UserService.cache_stats(),
+        "token_cache": TokenService.stats(),
+        "ephemeris": EphemerisService.info(),
+        "transit_snapshot": TransitService.stats(),
+        "similarity_index": ChartSimilarityService.stats(),
+        "orphan_sweeper": SweeperService.stats(),
     }
@@ -7,11 +7,13 @@ from neomodel import (
     FloatProperty,
     BooleanProperty,
     IntegerProperty,
+    DateTimeProperty,
     JSONProperty,
     UniqueIdProperty,
     RelationshipTo,
     RelationshipFrom
 )
+from datetime import datetime
 
 
 class Planet(StructuredNode):
@@ -29,8 +31,8 @@ class Planet(StructuredNode):
 
     # Relationships
     in_sign = RelationshipTo('ZodiacSign', 'IN_SIGN')
-    birth_charts = RelationshipFrom('BirthChart', 'HAS_PLANET')
-    associated_raags = RelationshipTo('Raag', 'ASSOCIATED_WITH_RAAG')
+    birth_charts = RelationshipFrom('app.models.birth_chart_neo4j.BirthChart', 'HAS_PLANET')
+    associated_raags = RelationshipTo('app.models.music_neo4j.Raag', 'ASSOCIATED_WITH_RAAG')
 
     def __str__(self):
         return f"<Planet: {self.name}>"
@@ -60,11 +62,11 @@ class ZodiacSign(StructuredNode):
     ruling_planet = StringProperty()
 
     # Relationships
-    birth_charts_ascendant = RelationshipFrom('BirthChart', 'HAS_ASCENDANT')
-    birth_charts_sun = RelationshipFrom('BirthChart', 'SUN_IN')
-    birth_charts_moon = RelationshipFrom('BirthChart', 'MOON_IN')
+    birth_charts_ascendant = RelationshipFrom('app.models.birth_chart_neo4j.BirthChart', 'HAS_ASCENDANT')
+    birth_charts_sun = RelationshipFrom('app.models.birth_chart_neo4j.BirthChart', 'SUN_IN')
+    birth_charts_moon = RelationshipFrom('app.models.birth_chart_neo4j.BirthChart', 'MOON_IN')
     planets = RelationshipFrom('Planet', 'IN_SIGN')
-    suggested_raag = RelationshipTo('Raag', 'SUGGESTED_RAAG')
+    suggested_raag = RelationshipTo('app.models.music_neo4j.Raag', 'SUGGESTED_RAAG')
 
     def __str__(self):
         return f"<ZodiacSign: {self.name_english}>"
@@ -107,3 +109,41 @@ class Nakshatra(StructuredNode):
             'symbol': self.symbol,
             'characteristics': self.characteristics,
         }
+
+
+class DailyInfluence(StructuredNode):
+    """Precomputed cosmic influence for one user on one local date"""
+
+    key = StringProperty(required=True, unique_index=True)  # "<user uid>:<YYYY-MM-DD>"
+    user_uid = StringProperty(required=True, index=True)
+    date = StringProperty(required=True, index=True)  # User's local date, YYYY-MM-DD
+    timezone = StringProperty()  # Timezone the local date was taken in
+    energy_level = StringProperty()
+    dominant_moods = JSONProperty()
+    overall_description = StringProperty()
+    recommendations = JSONProperty()
+    active_transits = JSONProperty()
+    lucky_raag = StringProperty()
+    overall_score = FloatProperty()
+    snapshot_at = StringProperty()  # Moment the transits were computed for
+    computed_at = DateTimeProperty(default=datetime.utcnow)
+
+    # Relationships
+    user = RelationshipFrom('app.models.user_neo4j.User', 'HAS_DAILY_INFLUENCE')
+
+    def __str__(self):
+        return f"<DailyInfluence: {self.key}>"
+
+    def to_dict(self):
+        return {
+            'user_id': self.user_uid,
+            'date': self.date,
+            'energy_level': self.energy_level,
+            'dominant_moods': self.dominant_moods or [],
+            'overall_description': self.overall_description,
+            'recommendations': self.recommendations or [],
+            'active_transits': self.active_transits or [],
+            'lucky_raag': self.lucky_raag,
+            'overall_score': self.overall_score,
+            'snapshot_at': self.snapshot_at,
+        }
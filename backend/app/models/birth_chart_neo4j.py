@@ -3,6 +3,7 @@ Birth Chart Neo4j model
 """
 from neomodel import (
     StructuredNode,
+    StructuredRel,
     StringProperty,
     FloatProperty,
     DateTimeProperty,
@@ -11,14 +12,35 @@ from neomodel import (
     UniqueIdProperty,
     RelationshipFrom,
     RelationshipTo,
-    One
+    One,
+    ZeroOrOne
 )
 from datetime import datetime
 
 
+class Recommendation(StructuredRel):
+    """Materialized raag recommendation score of a chart"""
+
+    score = FloatProperty(required=True)
+
+
+class BirthChartDetail(StructuredNode):
+    """Heavy calculated payloads of a birth chart, loaded only when returned"""
+
+    chart_uid = StringProperty(required=True, unique_index=True)
+    planets_data = JSONProperty()  # All planet positions
+    houses_data = JSONProperty()  # House positions
+    chart_data = JSONProperty()  # Full chart data
+
+    chart = RelationshipFrom('BirthChart', 'HAS_DETAIL', cardinality=One)
+
+
 class BirthChart(StructuredNode):
     """Birth Chart node in Neo4j"""
 
+    # Names of the payloads kept on the BirthChartDetail node
+    DETAIL_FIELDS = ('planets_data', 'houses_data', 'chart_data')
+
     # Properties
     uid = UniqueIdProperty()
 
@@ -34,24 +56,36 @@ class BirthChart(StructuredNode):
     lagna = StringProperty()  # Ascendant sign
     sun_sign = StringProperty()
     moon_sign = StringProperty()
-    planets_data = JSONProperty()  # All planet positions
-    houses_data = JSONProperty()  # House positions
-    chart_data = JSONProperty()  # Full chart data
+
+    # Detail payloads; None until attach_detail() is called
+    planets_data = None
+    houses_data = None
+    chart_data = None
+    detail_loaded = False
 
     # Metadata
     calculated_at = DateTimeProperty(default=datetime.utcnow)
-    updated_at = DateTimeProperty(default=datetime.utcnow)
+    updated_at = DateTimeProperty(default=datetime.utcnow, index=True)  # Similarity index refresh
 
     # Relationships
-    user = RelationshipFrom('User', 'HAS_BIRTH_CHART', cardinality=One)
-    planets = RelationshipTo('Planet', 'HAS_PLANET')
-    ascendant_sign = RelationshipTo('ZodiacSign', 'HAS_ASCENDANT', cardinality=One)
-    sun_in_sign = RelationshipTo('ZodiacSign', 'SUN_IN', cardinality=One)
-    moon_in_sign = RelationshipTo('ZodiacSign', 'MOON_IN', cardinality=One)
+    user = RelationshipFrom('app.models.user_neo4j.User', 'HAS_BIRTH_CHART', cardinality=One)
+    planets = RelationshipTo('app.models.astrology_neo4j.Planet', 'HAS_PLANET')
+    ascendant_sign = RelationshipTo('app.models.astrology_neo4j.ZodiacSign', 'HAS_ASCENDANT', cardinality=One)
+    sun_in_sign = RelationshipTo('app.models.astrology_neo4j.ZodiacSign', 'SUN_IN', cardinality=One)
+    moon_in_sign = RelationshipTo('app.models.astrology_neo4j.ZodiacSign', 'MOON_IN', cardinality=One)
+    detail = RelationshipTo('BirthChartDetail', 'HAS_DETAIL', cardinality=ZeroOrOne)
+    recommended_raags = RelationshipTo('app.models.music_neo4j.Raag', 'RECOMMENDED', model=Recommendation)
 
     def __str__(self):
         return f"<BirthChart: {self.lagna} Ascendant>"
 
+    def attach_detail(self, detail):
+        """Copy the payloads of a BirthChartDetail (or None) onto this chart"""
+        for field in self.DETAIL_FIELDS:
+            setattr(self, field, getattr(detail, field, None))
+        self.detail_loaded = True
+        return self
+
     def to_dict(self):
         """Convert to dictionary"""
         return {
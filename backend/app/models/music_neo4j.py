@@ -36,8 +36,9 @@ class Raag(StructuredNode):
     benefits = JSONProperty()  # Healing properties
 
     # Relationships
-    zodiac_signs = RelationshipFrom('ZodiacSign', 'SUGGESTED_RAAG')
-    planets = RelationshipFrom('Planet', 'ASSOCIATED_WITH_RAAG')
+    zodiac_signs = RelationshipFrom('app.models.astrology_neo4j.ZodiacSign', 'SUGGESTED_RAAG')
+    planets = RelationshipFrom('app.models.astrology_neo4j.Planet', 'ASSOCIATED_WITH_RAAG')
+    recommended_for = RelationshipFrom('app.models.birth_chart_neo4j.BirthChart', 'RECOMMENDED')
     tracks = RelationshipTo('Track', 'RAAG_OF_TRACK')
 
     def __str__(self):
@@ -89,7 +90,7 @@ class Track(StructuredNode):
     updated_at = DateTimeProperty(default=datetime.utcnow)
 
     # Relationships
-    user = RelationshipFrom('User', 'HAS_TRACK')
+    user = RelationshipFrom('app.models.user_neo4j.User', 'HAS_TRACK')
     raag = RelationshipFrom('Raag', 'RAAG_OF_TRACK')
     playlists = RelationshipFrom('Playlist', 'CONTAINS_TRACK')
 
@@ -146,7 +147,7 @@ class Playlist(StructuredNode):
     updated_at = DateTimeProperty(default=datetime.utcnow)
 
     # Relationships
-    user = RelationshipFrom('User', 'CREATED_PLAYLIST')
+    user = RelationshipFrom('app.models.user_neo4j.User', 'CREATED_PLAYLIST')
     tracks = RelationshipTo('Track', 'CONTAINS_TRACK')
 
     def __str__(self):
@@ -5,6 +5,7 @@ from neomodel import (
     StructuredNode,
     StringProperty,
     BooleanProperty,
+    IntegerProperty,
     DateTimeProperty,
     UniqueIdProperty,
     RelationshipTo,
@@ -23,13 +24,15 @@ class User(StructuredNode):
     hashed_password = StringProperty(required=True)
     is_active = BooleanProperty(default=True)
     is_superuser = BooleanProperty(default=False)
+    token_version = IntegerProperty(default=0)  # Bumped to revoke issued tokens
     created_at = DateTimeProperty(default=datetime.utcnow)
     updated_at = DateTimeProperty(default=datetime.utcnow)
 
     # Relationships
-    birth_chart = RelationshipTo('BirthChart', 'HAS_BIRTH_CHART', cardinality=One)
-    playlists = RelationshipTo('Playlist', 'CREATED_PLAYLIST')
-    tracks = RelationshipTo('Track', 'HAS_TRACK')
+    birth_chart = RelationshipTo('app.models.birth_chart_neo4j.BirthChart', 'HAS_BIRTH_CHART', cardinality=One)
+    playlists = RelationshipTo('app.models.music_neo4j.Playlist', 'CREATED_PLAYLIST')
+    tracks = RelationshipTo('app.models.music_neo4j.Track', 'HAS_TRACK')
+    daily_influences = RelationshipTo('app.models.astrology_neo4j.DailyInfluence', 'HAS_DAILY_INFLUENCE')
 
     def __str__(self):
         return f"<User: {self.email}>"
@@ -0,0 +1,28 @@
+"""
+Async birth chart repository on the Neo4j async driver
+"""
+from typing import Optional
+from app.db.neo4j_base import read_query
+from app.models.birth_chart_neo4j import BirthChart
+
+
+class BirthChartRepository:
+    """Async data access for BirthChart nodes; results are inflated neomodel instances"""
+
+    @staticmethod
+    async def get_by_user_uid(user_uid: str) -> Optional[BirthChart]:
+        """Get the birth chart of a user"""
+        records = await read_query(
+            "MATCH (:User {uid: $uid})-[:HAS_BIRTH_CHART]->(c:BirthChart) RETURN c LIMIT 1",
+            uid=user_uid,
+        )
+        return BirthChart.inflate(records[0]['c']) if records else None
+
+    @staticmethod
+    async def exists_for_user(user_uid: str) -> bool:
+        """Whether a user has a birth chart, without loading it"""
+        records = await read_query(
+            "RETURN EXISTS { MATCH (:User {uid: $uid})-[:HAS_BIRTH_CHART]->(:BirthChart) } AS has_chart",
+            uid=user_uid,
+        )
+        return bool(records and records[0]['has_chart'])
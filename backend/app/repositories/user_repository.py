@@ -0,0 +1,97 @@
+"""
+Async user repository on the Neo4j async driver
+"""
+from typing import Any, Dict, List, Optional
+from neo4j.exceptions import ConstraintError
+from app.db.neo4j_base import deflate_properties, read_query, write_query
+from app.models.user_neo4j import User
+
+# Everything a user owns goes with them in one statement (one transaction).
+# Charts take their detail node; a track goes only if nothing else links to
+# it, so catalog tracks (from a raag, another user or a playlist not being
+# deleted) stay. Shared nodes (planets, signs, raags) only lose their
+# relationships.
+DELETE_USER_QUERY = """
+MATCH (u:User {uid: $uid})
+OPTIONAL MATCH (u)-[:HAS_BIRTH_CHART]->(c:BirthChart)
+OPTIONAL MATCH (c)-[:HAS_DETAIL]->(d:BirthChartDetail)
+WITH u, collect(DISTINCT c) AS charts, collect(DISTINCT d) AS details
+OPTIONAL MATCH (u)-[:CREATED_PLAYLIST|HAS_DAILY_INFLUENCE]->(owned)
+WITH u, charts, details, collect(DISTINCT owned) AS owned
+OPTIONAL MATCH (u)-[:HAS_TRACK]->(t:Track)
+WHERE NOT EXISTS { MATCH (:Raag)-[:RAAG_OF_TRACK]->(t) }
+  AND NOT EXISTS { MATCH (other:User)-[:HAS_TRACK]->(t) WHERE other <> u }
+  AND NOT EXISTS { MATCH (p:Playlist)-[:CONTAINS_TRACK]->(t) WHERE NOT p IN owned }
+WITH u, charts, details, owned, collect(DISTINCT t) AS tracks
+WITH [chart IN charts | chart.uid] AS chart_uids, [u] + charts + details + owned + tracks AS doomed
+UNWIND doomed AS n
+DETACH DELETE n
+RETURN chart_uids, count(n) AS deleted
+"""
+
+
+class EmailAlreadyRegistered(Exception):
+    """Raised when a user with the same email already exists"""
+
+
+class UserRepository:
+    """Async data access for User nodes; results are inflated neomodel instances"""
+
+    @staticmethod
+    async def get_by_uid(uid: str) -> Optional[User]:
+        """Get user by uid"""
+        records = await read_query("MATCH (u:User {uid: $uid}) RETURN u", uid=uid)
+        return User.inflate(records[0]['u']) if records else None
+
+    @staticmethod
+    async def get_by_email(email: str) -> Optional[User]:
+        """Get user by email"""
+        records = await read_query("MATCH (u:User {email: $email}) RETURN u", email=email)
+        return User.inflate(records[0]['u']) if records else None
+
+    @staticmethod
+    async def create(user: User) -> User:
+        """
+        Store a new, unsaved user with its default uid and timestamps
+
+        One CREATE with no existence check: the unique constraint on
+        User.email rejects a duplicate atomically, even when two sign-ups
+        for the same email race.
+
+        Raises:
+            EmailAlreadyRegistered: If the email is taken
+        """
+        try:
+            records = await write_query(
+                "CREATE (u:User $props) RETURN u",
+                props=User.deflate(user.__properties__, user),
+            )
+        except ConstraintError as e:
+            # The only other constraint on User is its random uid
+            raise EmailAlreadyRegistered(user.email) from e
+        return User.inflate(records[0]['u'])
+
+    @staticmethod
+    async def update(user: User, values: Dict[str, Any]) -> User:
+        """
+        Set properties on a user
+
+        Args:
+            user: User to update
+            values: Property name -> new Python value
+
+        Returns:
+            The user as stored after the update
+        """
+        records = await write_query(
+            "MATCH (u:User {uid: $uid}) SET u += $props RETURN u",
+            uid=user.uid,
+            props=deflate_properties(User, user, values),
+        )
+        return User.inflate(records[0]['u']) if records else user
+
+    @staticmethod
+    async def delete(uid: str) -> List[str]:
+        """Delete a user with their chart, playlists, tracks and daily influences; returns deleted chart uids"""
+        records = await write_query(DELETE_USER_QUERY, uid=uid)
+        return records[0]['chart_uids'] if records else []
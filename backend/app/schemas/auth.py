@@ -17,6 +17,13 @@ class TokenData(BaseModel):
     user_id: Optional[str] = None
 
 
+class Principal(BaseModel):
+    """Authenticated identity as carried in access token claims"""
+    uid: str
+    is_active: bool = True
+    token_version: int = 0
+
+
 class LoginRequest(BaseModel):
     """Login request schema"""
     email: EmailStr
@@ -61,6 +61,59 @@ class BirthChart(BaseModel):
         from_attributes = True
 
 
+class SimilarChart(BaseModel):
+    """Another user's chart in a similarity search"""
+    user_id: str
+    name: str
+    lagna: Optional[str]
+    sun_sign: Optional[str]
+    moon_sign: Optional[str]
+    similarity: float = Field(..., ge=-1, le=1)
+
+
+class RecommendedRaag(BaseModel):
+    """Raag recommended for a birth chart, with its score"""
+    id: str
+    name: str
+    name_hindi: Optional[str] = None
+    description: Optional[str] = None
+    thaat: Optional[str] = None
+    time_of_day: Optional[str] = None
+    moods: Optional[List[str]] = None
+    score: float
+
+
 class BirthChartWithData(BirthChart):
     """Birth chart with parsed data"""
     parsed_data: Optional[BirthChartData] = None
+
+
+def birth_chart_content(chart: Any, user_id: str) -> Dict[str, Any]:
+    """
+    Response content for a stored birth chart in the field order of BirthChart
+
+    For returning through APIJSONResponse without validation; the chart's
+    detail must be loaded.
+
+    Args:
+        chart: BirthChart node
+        user_id: uid of the chart's owner
+    """
+    return {
+        'id': chart.uid,
+        'user_id': user_id,
+        'birth_date': chart.birth_date,
+        'birth_time': time.fromisoformat(chart.birth_time),
+        'birth_latitude': chart.birth_latitude,
+        'birth_longitude': chart.birth_longitude,
+        'birth_place': chart.birth_place,
+        'timezone': chart.timezone,
+        'lagna': chart.lagna,
+        'sun_sign': chart.sun_sign,
+        'moon_sign': chart.moon_sign,
+        'planets_data': chart.planets_data,
+        'houses_data': chart.houses_data,
+        'chart_data': chart.chart_data,
+        'calculated_at': chart.calculated_at,
+        'updated_at': chart.updated_at,
+    }
@@ -2,7 +2,7 @@
 User Pydantic schemas for API requests/responses
 """
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime
 
 
@@ -44,3 +44,26 @@ class User(UserInDB):
 class UserWithChartStatus(User):
     """User with birth chart status"""
     has_birth_chart: bool = False
+
+
+def user_content(user: Any, **extra: Any) -> Dict[str, Any]:
+    """
+    Response content for a stored user in the field order of User
+
+    For returning through APIJSONResponse without validation; datetimes
+    stay datetime objects for orjson to encode.
+
+    Args:
+        user: User node
+        **extra: Additional fields (e.g. has_birth_chart)
+    """
+    return {
+        'email': user.email,
+        'name': user.name,
+        'id': user.uid,
+        'is_active': user.is_active,
+        'is_superuser': user.is_superuser,
+        'created_at': user.created_at,
+        'updated_at': user.updated_at,
+        **extra,
+    }
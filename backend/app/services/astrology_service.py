@@ -1,13 +1,27 @@
 """
 Vedic Astrology Service using vedicastro library
+
+A native Swiss Ephemeris engine can be selected with ASTROLOGY_ENGINE.
 """
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+import copy
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List, Sequence, Tuple
+from zoneinfo import ZoneInfo
+import numpy as np
+from app.core.config import settings
+from app.services.chart_executor import ExecutorSaturated, get_chart_executor
+from app.utils.cache import TTLCache
 
 
 class AstrologyService:
     """Service for Vedic astrology calculations"""
 
+    # Memoized chart results keyed on normalized birth inputs
+    _chart_cache = TTLCache(
+        maxsize=settings.ASTROLOGY_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.ASTROLOGY_CACHE_TTL_SECONDS,
+    )
+
     # English-Hindi zodiac mapping
     ZODIAC_SIGNS_HINDI = {
         "Aries": "मेष",
@@ -24,6 +38,27 @@ class AstrologyService:
         "Pisces": "मीन"
     }
 
+    # Sidereal signs in zodiac order (index = longitude // 30)
+    ZODIAC_SIGNS = list(ZODIAC_SIGNS_HINDI)
+
+    # Nakshatras in order from 0° sidereal (vedicastro spelling)
+    NAKSHATRAS = [
+        'Ashwini', 'Bharani', 'Krittika', 'Rohini', 'Mrigashīrsha', 'Ardra', 'Punarvasu',
+        'Pushya', 'Āshleshā', 'Maghā', 'PūrvaPhalgunī', 'UttaraPhalgunī', 'Hasta', 'Chitra',
+        'Svati', 'Vishakha', 'Anuradha', 'Jyeshtha', 'Mula', 'PurvaAshadha', 'UttaraAshadha',
+        'Shravana', 'Dhanishta', 'Shatabhisha', 'PurvaBhādrapadā', 'UttaraBhādrapadā', 'Revati'
+    ]
+    NAKSHATRA_SPAN = 360.0 / 27
+    PADA_SPAN = NAKSHATRA_SPAN / 4
+
+    # Chart engines selectable with ASTROLOGY_ENGINE
+    ENGINES = ("vedicastro", "swisseph")
+
+    # Objects computed by the swisseph engine, in vedicastro naming
+    SWISSEPH_OBJECTS = [
+        "Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto", "Rahu"
+    ]
+
     # Zodiac to Raag mapping
     ZODIAC_RAAGAS = {
         'Aries': 'Bhairav',
@@ -40,6 +75,67 @@ class AstrologyService:
         'Pisces': 'Todi'
     }
 
+    @staticmethod
+    def _parse_birth_time(birth_time: str) -> Tuple[int, int]:
+        """Parse an "HH:MM" (or "HH:MM:SS") string into hour and minute"""
+        time_parts = birth_time.strip().split(':')
+        hour = int(time_parts[0])
+        minute = int(time_parts[1])
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise ValueError(f"Invalid birth time: {birth_time}")
+        return hour, minute
+
+    @staticmethod
+    def _utc_offset(birth_date: datetime, hour: int, minute: int, timezone: str) -> timedelta:
+        """
+        Resolve the UTC offset in effect at the birth moment
+
+        Args:
+            timezone: IANA name (e.g. 'Asia/Kolkata') or fixed offset (e.g. '+05:30')
+        """
+        tz = timezone.strip()
+        if tz[:1] in ('+', '-'):
+            sign = -1 if tz[0] == '-' else 1
+            hours, _, minutes = tz[1:].partition(':')
+            return sign * timedelta(hours=int(hours), minutes=int(minutes or 0))
+
+        local = datetime(birth_date.year, birth_date.month, birth_date.day, hour, minute, tzinfo=ZoneInfo(tz))
+        return local.utcoffset()
+
+    @staticmethod
+    def _format_utc_offset(offset: timedelta) -> str:
+        """Format an offset as "+HH:MM" for vedicastro"""
+        total_minutes = int(offset.total_seconds() // 60)
+        sign = '-' if total_minutes < 0 else '+'
+        hours, minutes = divmod(abs(total_minutes), 60)
+        return f"{sign}{hours:02d}:{minutes:02d}"
+
+    @classmethod
+    def _chart_cache_key(
+        cls,
+        birth_date: datetime,
+        birth_time: str,
+        latitude: float,
+        longitude: float,
+        timezone: str
+    ) -> Tuple:
+        """
+        Build a canonical fingerprint of the birth inputs
+
+        Only the calendar date of birth_date is used (the time of day comes
+        from birth_time), and coordinates are rounded to
+        ASTROLOGY_CACHE_COORD_PRECISION decimal places.
+        """
+        precision = settings.ASTROLOGY_CACHE_COORD_PRECISION
+        hour, minute = cls._parse_birth_time(birth_time)
+        return (
+            birth_date.strftime('%Y-%m-%d'),
+            f"{hour:02d}:{minute:02d}",
+            round(float(latitude), precision) + 0.0,  # + 0.0 folds -0.0 into 0.0
+            round(float(longitude), precision) + 0.0,
+            timezone.strip(),
+        )
+
     @classmethod
     def calculate_birth_chart(
         cls,
@@ -52,6 +148,9 @@ class AstrologyService:
         """
         Calculate Vedic birth chart
 
+        Falls back to default chart data if the calculation fails. See
+        compute_birth_chart for the raising variant.
+
         Args:
             birth_date: Date of birth
             birth_time: Time of birth in HH:MM format
@@ -63,82 +162,317 @@ class AstrologyService:
             Dictionary containing birth chart data
         """
         try:
-            # Lazy import to avoid issues if vedicastro has dependency problems
-            from vedicastro.VedicAstro import VedicHoroscopeData
-
-            # Parse birth time
-            time_parts = birth_time.split(':')
-            hour = int(time_parts[0])
-            minute = int(time_parts[1])
-
-            # Create horoscope data
-            my_chart = VedicHoroscopeData(
-                year=birth_date.year,
-                month=birth_date.month,
-                day=birth_date.day,
-                hour=hour,
-                minute=minute,
-                second=0,
+            return cls.compute_birth_chart(
+                birth_date=birth_date,
+                birth_time=birth_time,
                 latitude=latitude,
                 longitude=longitude,
-                tz=timezone
+                timezone=timezone
             )
+        except ImportError as e:
+            print(f"Warning: vedicastro import failed: {e}")
+            # Return default values if vedicastro is not available
+            return cls._get_default_chart_data()
+        except Exception as e:
+            print(f"Error calculating birth chart: {e}")
+            return cls._get_default_chart_data()
 
-            # Generate chart and planet data
-            chart = my_chart.generate_chart()
-            planets_data = my_chart.get_planets_data_from_chart(chart)
-
-            # Extract Lagna, Sun sign, Moon sign
-            lagna = None
-            sun_sign = None
-            moon_sign = None
-            planets_list = []
-
-            for obj in planets_data:
-                if hasattr(obj, 'Object'):
-                    planet_data = {
-                        'name': str(obj.Object) if hasattr(obj, 'Object') else 'Unknown',
-                        'sign': str(obj.Rasi) if hasattr(obj, 'Rasi') else None,
-                        'degree': float(obj.Degree) if hasattr(obj, 'Degree') else None,
-                        'house': int(obj.House) if hasattr(obj, 'House') else None,
-                        'nakshatra': str(obj.Nakshatra) if hasattr(obj, 'Nakshatra') else None,
-                        'pada': int(obj.Pada) if hasattr(obj, 'Pada') else None,
-                    }
-
-                    planets_list.append(planet_data)
-
-                    # Extract specific signs
-                    obj_name = str(obj.Object).lower() if hasattr(obj, 'Object') else ''
-                    if obj_name == "asc":
-                        lagna = str(obj.Rasi) if hasattr(obj, 'Rasi') else None
-                    elif obj_name == "sun":
-                        sun_sign = str(obj.Rasi) if hasattr(obj, 'Rasi') else None
-                    elif obj_name == "moon":
-                        moon_sign = str(obj.Rasi) if hasattr(obj, 'Rasi') else None
-
-            # Get suggested raag
-            suggested_raag = cls.ZODIAC_RAAGAS.get(lagna, "Yaman")
-
-            return {
-                'lagna': lagna or "Unknown",
-                'lagna_hindi': cls.ZODIAC_SIGNS_HINDI.get(lagna, ''),
-                'sun_sign': sun_sign or "Unknown",
-                'sun_sign_hindi': cls.ZODIAC_SIGNS_HINDI.get(sun_sign, ''),
-                'moon_sign': moon_sign or "Unknown",
-                'moon_sign_hindi': cls.ZODIAC_SIGNS_HINDI.get(moon_sign, ''),
-                'planets': planets_list,
-                'chart_raw': str(chart),  # Raw chart data
-                'suggested_raag': suggested_raag,
-            }
+    @classmethod
+    async def calculate_birth_chart_async(
+        cls,
+        birth_date: datetime,
+        birth_time: str,
+        latitude: float,
+        longitude: float,
+        timezone: str
+    ) -> Dict[str, Any]:
+        """
+        Calculate Vedic birth chart on the chart executor
+
+        Same contract as calculate_birth_chart, but cache misses are computed
+        on the dedicated process pool instead of the calling thread.
 
+        Raises:
+            ExecutorSaturated: If the chart executor queue is full
+        """
+        try:
+            cache_key = cls._chart_cache_key(birth_date, birth_time, latitude, longitude, timezone)
+            cached = cls._chart_cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+            chart_data = await get_chart_executor().submit(
+                cls._compute_birth_chart, birth_date, birth_time, latitude, longitude, timezone
+            )
+
+        except ExecutorSaturated:
+            raise
         except ImportError as e:
             print(f"Warning: vedicastro import failed: {e}")
-            # Return default values if vedicastro is not available
             return cls._get_default_chart_data()
         except Exception as e:
             print(f"Error calculating birth chart: {e}")
             return cls._get_default_chart_data()
 
+        cls._chart_cache.set(cache_key, chart_data)
+        return copy.deepcopy(chart_data)
+
+    @classmethod
+    def compute_birth_chart(
+        cls,
+        birth_date: datetime,
+        birth_time: str,
+        latitude: float,
+        longitude: float,
+        timezone: str
+    ) -> Dict[str, Any]:
+        """
+        Calculate Vedic birth chart, raising on failure
+
+        Results are memoized on the normalized birth inputs. The returned
+        dictionary is always a private copy and may be mutated freely.
+
+        Raises:
+            ImportError: If vedicastro is not available
+            Exception: Any error raised while building the chart
+        """
+        cache_key = cls._chart_cache_key(birth_date, birth_time, latitude, longitude, timezone)
+        cached = cls._chart_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        chart_data = cls._compute_birth_chart(
+            birth_date=birth_date,
+            birth_time=birth_time,
+            latitude=latitude,
+            longitude=longitude,
+            timezone=timezone
+        )
+
+        cls._chart_cache.set(cache_key, chart_data)
+        return copy.deepcopy(chart_data)
+
+    @classmethod
+    def _compute_birth_chart(
+        cls,
+        birth_date: datetime,
+        birth_time: str,
+        latitude: float,
+        longitude: float,
+        timezone: str,
+        engine: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the chart calculation without caching or fallback
+
+        Args:
+            engine: One of ENGINES; defaults to ASTROLOGY_ENGINE
+        """
+        engine = engine or settings.ASTROLOGY_ENGINE
+        if engine == "swisseph":
+            return cls._compute_swisseph(birth_date, birth_time, latitude, longitude, timezone)
+        if engine == "vedicastro":
+            return cls._compute_vedicastro(birth_date, birth_time, latitude, longitude, timezone)
+        raise ValueError(f"Unknown astrology engine: {engine}")
+
+    @classmethod
+    def _compute_vedicastro(
+        cls,
+        birth_date: datetime,
+        birth_time: str,
+        latitude: float,
+        longitude: float,
+        timezone: str
+    ) -> Dict[str, Any]:
+        """Calculate a chart with vedicastro"""
+        # Lazy import to avoid issues if vedicastro has dependency problems
+        from vedicastro.VedicAstro import VedicHoroscopeData
+
+        # Parse birth time
+        hour, minute = cls._parse_birth_time(birth_time)
+        utc_offset = cls._utc_offset(birth_date, hour, minute, timezone)
+
+        # Create horoscope data
+        my_chart = VedicHoroscopeData(
+            year=birth_date.year,
+            month=birth_date.month,
+            day=birth_date.day,
+            hour=hour,
+            minute=minute,
+            second=0,
+            utc=cls._format_utc_offset(utc_offset),
+            latitude=latitude,
+            longitude=longitude
+        )
+
+        # Generate chart and planet data
+        chart = my_chart.generate_chart()
+        planets_data = my_chart.get_planets_data_from_chart(chart)
+
+        names = []
+        longitudes = []
+        ascendant = 0.0
+        for obj in planets_data:
+            names.append(str(obj.Object))
+            longitudes.append(float(obj.LonDecDeg))
+            if names[-1].lower() == "asc":
+                ascendant = longitudes[-1]
+
+        planets_list = cls.planets_from_longitudes(names, longitudes, ascendant)
+        return cls._assemble_chart_data(planets_list, chart_raw=str(chart))
+
+    @classmethod
+    def _compute_swisseph(
+        cls,
+        birth_date: datetime,
+        birth_time: str,
+        latitude: float,
+        longitude: float,
+        timezone: str
+    ) -> Dict[str, Any]:
+        """
+        Calculate a chart directly with Swiss Ephemeris
+
+        Uses the same Lahiri ayanamsa and mean lunar node as vedicastro, and
+        skips building flatlib chart objects.
+        """
+        import swisseph as swe
+
+        hour, minute = cls._parse_birth_time(birth_time)
+        utc_offset = cls._utc_offset(birth_date, hour, minute, timezone)
+        utc = datetime(birth_date.year, birth_date.month, birth_date.day, hour, minute) - utc_offset
+        jd = swe.julday(utc.year, utc.month, utc.day, utc.hour + utc.minute / 60.0)
+
+        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL
+        bodies = [swe.SUN, swe.MOON, swe.MERCURY, swe.VENUS, swe.MARS, swe.JUPITER,
+                  swe.SATURN, swe.URANUS, swe.NEPTUNE, swe.PLUTO, swe.MEAN_NODE]
+
+        ascendant = swe.houses_ex(jd, latitude, longitude, b'E', swe.FLG_SIDEREAL)[1][0]
+        names = ["Asc"] + cls.SWISSEPH_OBJECTS + ["Ketu"]
+        longitudes = [ascendant] + [swe.calc_ut(jd, body, flags)[0][0] for body in bodies]
+        longitudes.append((longitudes[-1] + 180.0) % 360.0)  # Ketu opposite Rahu
+
+        planets_list = cls.planets_from_longitudes(names, longitudes, ascendant)
+        chart_raw = " ".join(f"{name}:{lon:.6f}" for name, lon in zip(names, longitudes))
+        return cls._assemble_chart_data(planets_list, chart_raw=f"<Chart {utc.isoformat()}Z {chart_raw}>")
+
+    @classmethod
+    def _assemble_chart_data(cls, planets_list: List[Dict[str, Any]], chart_raw: str) -> Dict[str, Any]:
+        """Build the chart result dictionary from the planets list"""
+        # Extract Lagna, Sun sign, Moon sign
+        signs = {planet['name'].lower(): planet['sign'] for planet in planets_list}
+        lagna = signs.get("asc")
+        sun_sign = signs.get("sun")
+        moon_sign = signs.get("moon")
+
+        # Get suggested raag
+        suggested_raag = cls.ZODIAC_RAAGAS.get(lagna, "Yaman")
+
+        return {
+            'lagna': lagna or "Unknown",
+            'lagna_hindi': cls.ZODIAC_SIGNS_HINDI.get(lagna, ''),
+            'sun_sign': sun_sign or "Unknown",
+            'sun_sign_hindi': cls.ZODIAC_SIGNS_HINDI.get(sun_sign, ''),
+            'moon_sign': moon_sign or "Unknown",
+            'moon_sign_hindi': cls.ZODIAC_SIGNS_HINDI.get(moon_sign, ''),
+            'planets': planets_list,
+            'chart_raw': chart_raw,  # Raw chart data
+            'suggested_raag': suggested_raag,
+        }
+
+    @classmethod
+    def derive_positions(cls, longitudes: np.ndarray, ascendants: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Derive rasi, nakshatra, pada and whole-sign house for many charts at once
+
+        Args:
+            longitudes: Sidereal longitudes in degrees, shape (charts, objects)
+            ascendants: Sidereal ascendant longitude per chart, shape (charts,)
+
+        Returns:
+            Arrays shaped like longitudes: 'rasi' (0-11, int8), 'sign_degree'
+            (degrees within the sign, float64), 'nakshatra' (0-26, int8),
+            'pada' (1-4, int8) and 'house' (1-12, int8)
+        """
+        lon = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+        asc = np.mod(np.asarray(ascendants, dtype=np.float64), 360.0)
+
+        # np.minimum guards against floating point landing exactly on 360
+        rasi = np.minimum(lon // 30.0, 11).astype(np.int8)
+        sign_degree = lon - rasi * 30.0
+        nakshatra = np.minimum(lon // cls.NAKSHATRA_SPAN, 26).astype(np.int8)
+        pada = (np.minimum((lon - nakshatra * cls.NAKSHATRA_SPAN) // cls.PADA_SPAN, 3) + 1).astype(np.int8)
+        asc_rasi = np.minimum(asc // 30.0, 11).astype(np.int8)
+        house = (np.mod(rasi - asc_rasi[..., np.newaxis], 12) + 1).astype(np.int8)
+
+        return {
+            'rasi': rasi,
+            'sign_degree': sign_degree,
+            'nakshatra': nakshatra,
+            'pada': pada,
+            'house': house,
+        }
+
+    @classmethod
+    def planets_from_longitudes(
+        cls,
+        names: Sequence[str],
+        longitudes: Sequence[float],
+        ascendant: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the chart 'planets' list for one chart from sidereal longitudes
+
+        Args:
+            names: Object names (e.g. "Asc", "Sun", "Moon")
+            longitudes: Sidereal longitude of each object in degrees
+            ascendant: Sidereal ascendant longitude in degrees
+
+        Returns:
+            List of planet dictionaries in the calculate_birth_chart format
+        """
+        derived = cls.derive_positions(np.asarray([longitudes]), np.asarray([ascendant]))
+        return [
+            {
+                'name': name,
+                'sign': cls.ZODIAC_SIGNS[rasi],
+                'degree': round(degree, 4),
+                'house': house,
+                'nakshatra': cls.NAKSHATRAS[nakshatra],
+                'pada': pada,
+            }
+            for name, rasi, degree, house, nakshatra, pada in zip(
+                names,
+                derived['rasi'][0].tolist(),
+                derived['sign_degree'][0].tolist(),
+                derived['house'][0].tolist(),
+                derived['nakshatra'][0].tolist(),
+                derived['pada'][0].tolist(),
+            )
+        ]
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """Import the configured engine and compute one throwaway chart"""
+        cls._compute_birth_chart(
+            birth_date=datetime(2000, 1, 1),
+            birth_time="12:00",
+            latitude=28.6139,
+            longitude=77.2090,
+            timezone="+05:30"
+        )
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters for the chart cache"""
+        return cls._chart_cache.stats()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all memoized charts"""
+        cls._chart_cache.clear()
+
     @classmethod
     def _get_default_chart_data(cls) -> Dict[str, Any]:
         """Return default chart data when calculation fails"""
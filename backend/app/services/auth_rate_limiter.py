@@ -0,0 +1,134 @@
+"""
+Rate limiting for credential endpoints
+"""
+import math
+from typing import Any, Dict, Optional
+from fastapi import Request
+from app.core.config import settings
+from app.utils.rate_limit import MemoryBackend, RateLimitBackend, RedisBackend
+
+
+class RateLimited(Exception):
+    """Raised when a client or an email has made too many attempts"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Too many attempts")
+        self.retry_after = retry_after
+
+
+class AuthRateLimiter:
+    """
+    Token buckets per client IP and per normalized email for login and
+    registration
+
+    Checked before any Neo4j lookup or bcrypt work, so a credential-stuffing
+    run costs a bucket update per attempt rather than a password hash. The
+    IP bucket stops one client trying many emails; the email bucket stops
+    many clients trying one account. Each action has its own buckets.
+    If the backend fails the attempt is admitted and counted as an error,
+    so an unreachable Redis does not lock everyone out.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        ip_burst: float,
+        ip_per_minute: float,
+        email_burst: float,
+        email_per_minute: float,
+        trust_forwarded: bool = False
+    ):
+        self.backend = backend
+        self.rules = {
+            'ip': (ip_burst, ip_per_minute / 60.0),
+            'email': (email_burst, email_per_minute / 60.0),
+        }
+        self.trust_forwarded = trust_forwarded
+        self.admitted = 0
+        self.rejected = {'ip': 0, 'email': 0}
+        self.backend_errors = 0
+
+    @staticmethod
+    def normalize_email(email: str) -> str:
+        """Email as a bucket key: trimmed and case-folded"""
+        return email.strip().casefold()
+
+    def client_ip(self, request: Request) -> str:
+        """Client address, from X-Forwarded-For when behind a trusted proxy"""
+        if self.trust_forwarded:
+            forwarded = request.headers.get("x-forwarded-for")
+            if forwarded:
+                return forwarded.split(",")[0].strip()
+        return request.client.host if request.client else "unknown"
+
+    async def check(self, action: str, request: Request, email: str) -> None:
+        """
+        Take one attempt from the IP and email buckets of action
+
+        Raises:
+            RateLimited: If either bucket is empty
+        """
+        keys = (('ip', self.client_ip(request)), ('email', self.normalize_email(email)))
+        for rule, value in keys:
+            capacity, rate = self.rules[rule]
+            try:
+                admitted, retry_after = await self.backend.take(f"{action}:{rule}:{value}", capacity, rate)
+            except Exception as e:
+                self.backend_errors += 1
+                print(f"Warning: rate limit backend failed, admitting attempt: {e}")
+                break
+            if not admitted:
+                self.rejected[rule] += 1
+                raise RateLimited(retry_after=max(1, math.ceil(retry_after)))
+        self.admitted += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Admitted and rejected attempts and backend state"""
+        return {
+            'admitted': self.admitted,
+            'rejected': dict(self.rejected),
+            'backend_errors': self.backend_errors,
+            **self.backend.stats(),
+        }
+
+    async def close(self) -> None:
+        """Release the backend"""
+        await self.backend.close()
+
+
+_rate_limiter: Optional[AuthRateLimiter] = None
+
+
+def start_rate_limiter() -> AuthRateLimiter:
+    """Create the shared limiter (called from the app lifespan)"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        if settings.AUTH_RATE_LIMIT_BACKEND == "redis":
+            backend = RedisBackend(settings.AUTH_RATE_LIMIT_REDIS_URL)
+        else:
+            backend = MemoryBackend(
+                shards=settings.AUTH_RATE_LIMIT_SHARDS,
+                max_keys=settings.AUTH_RATE_LIMIT_MAX_KEYS,
+            )
+        _rate_limiter = AuthRateLimiter(
+            backend,
+            ip_burst=settings.AUTH_RATE_LIMIT_IP_BURST,
+            ip_per_minute=settings.AUTH_RATE_LIMIT_IP_PER_MINUTE,
+            email_burst=settings.AUTH_RATE_LIMIT_EMAIL_BURST,
+            email_per_minute=settings.AUTH_RATE_LIMIT_EMAIL_PER_MINUTE,
+            trust_forwarded=settings.AUTH_RATE_LIMIT_TRUST_FORWARDED,
+        )
+    return _rate_limiter
+
+
+def get_rate_limiter() -> AuthRateLimiter:
+    """Get the shared limiter, creating it on first use"""
+    return _rate_limiter or start_rate_limiter()
+
+
+async def shutdown_rate_limiter() -> None:
+    """Close the shared limiter if it was created"""
+    global _rate_limiter
+    if _rate_limiter is not None:
+        await _rate_limiter.close()
+        _rate_limiter = None
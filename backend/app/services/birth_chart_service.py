@@ -1,35 +1,150 @@
 """
 Birth Chart service using Neo4j
 """
-from typing import Optional
-from datetime import datetime, time
-from app.models.birth_chart_neo4j import BirthChart
+from typing import Any, Dict, Optional, Tuple
+from datetime import datetime, time, timezone
+from uuid import uuid4
+from neomodel import db
+from app.db.neo4j_base import deflate_properties
+from app.models.birth_chart_neo4j import BirthChart, BirthChartDetail
 from app.models.user_neo4j import User
-from app.models.astrology_neo4j import ZodiacSign
+from app.repositories.birth_chart_repository import BirthChartRepository
 from app.schemas.birth_chart import BirthChartCreate
 from app.services.astrology_service import AstrologyService
+from app.services.cosmic_influence_service import CosmicInfluenceService
+from app.services.raag_recommendation_service import RECOMMEND_SUBQUERY, RaagRecommendationService
+from app.services.similarity_service import ChartSimilarityService
+from app.utils.identity_map import IdentityMap
+
+# Writing a throwaway property takes the user's write lock first, so
+# concurrent upserts for one user serialize and MERGE can't create two
+# charts. The detail node, sign relationships and raag recommendations are
+# written in the same transaction, which also drops daily influences that
+# may still be served as "today" since they were read from the old chart.
+UPSERT_QUERY = """
+MATCH (u:User {uid: $user_uid})
+SET u._upsert_lock = true
+REMOVE u._upsert_lock
+MERGE (u)-[:HAS_BIRTH_CHART]->(c:BirthChart)
+  ON CREATE SET c.uid = $chart_uid, c.calculated_at = $now
+SET c += $props, c.updated_at = $now
+MERGE (d:BirthChartDetail {chart_uid: c.uid})
+MERGE (c)-[:HAS_DETAIL]->(d)
+SET d += $detail
+WITH u, c, d
+OPTIONAL MATCH (u)-[:HAS_DAILY_INFLUENCE]->(stale:DailyInfluence)
+WHERE stale.date >= $influence_from
+DETACH DELETE stale
+WITH DISTINCT c, d
+OPTIONAL MATCH (c)-[old:HAS_ASCENDANT|SUN_IN|MOON_IN]->(:ZodiacSign)
+DELETE old
+WITH DISTINCT c, d
+OPTIONAL MATCH (lagna:ZodiacSign {name_english: $lagna})
+OPTIONAL MATCH (sun:ZodiacSign {name_english: $sun_sign})
+OPTIONAL MATCH (moon:ZodiacSign {name_english: $moon_sign})
+FOREACH (sign IN CASE WHEN lagna IS NULL THEN [] ELSE [lagna] END | MERGE (c)-[:HAS_ASCENDANT]->(sign))
+FOREACH (sign IN CASE WHEN sun IS NULL THEN [] ELSE [sun] END | MERGE (c)-[:SUN_IN]->(sign))
+FOREACH (sign IN CASE WHEN moon IS NULL THEN [] ELSE [moon] END | MERGE (c)-[:MOON_IN]->(sign))
+WITH c, d, $raag_sources AS raag_sources
+""" + RECOMMEND_SUBQUERY + """
+RETURN c, d
+"""
+
+CHART_BY_USER_QUERY = """
+MATCH (:User {uid: $user_uid})-[:HAS_BIRTH_CHART]->(c:BirthChart)
+RETURN c
+LIMIT 1
+"""
+
+CHART_WITH_DETAIL_BY_USER_QUERY = """
+MATCH (:User {uid: $user_uid})-[:HAS_BIRTH_CHART]->(c:BirthChart)
+OPTIONAL MATCH (c)-[:HAS_DETAIL]->(d:BirthChartDetail)
+RETURN c, d
+LIMIT 1
+"""
+
+# The chart and its detail node in one statement; planets and signs are
+# shared nodes and only lose their relationships
+DELETE_CHART_QUERY = """
+MATCH (c:BirthChart {uid: $chart_uid})
+OPTIONAL MATCH (c)-[:HAS_DETAIL]->(d:BirthChartDetail)
+OPTIONAL MATCH (c)<-[:HAS_BIRTH_CHART]-(:User)-[:HAS_DAILY_INFLUENCE]->(stale:DailyInfluence)
+WHERE stale.date >= $influence_from
+DETACH DELETE c, d, stale
+"""
+
+DETAIL_BY_CHART_QUERY = """
+MATCH (d:BirthChartDetail {chart_uid: $chart_uid})
+RETURN d
+"""
 
 
 class BirthChartService:
-    """Service for birth chart operations with Neo4j"""
+    """
+    Service for birth chart operations with Neo4j
+
+    Charts are loaded by their user's uid in one query, without loading the
+    user, and kept in the request's identity map under that uid. Only the
+    scalar properties are read by default; the planet, house and raw chart
+    payloads live on a BirthChartDetail node that is fetched with
+    ``with_detail=True`` by the endpoints that return them.
+    """
 
     @staticmethod
-    def get_by_user(user: User) -> Optional[BirthChart]:
+    def get_by_user(user: User, with_detail: bool = False) -> Optional[BirthChart]:
         """Get birth chart for a user using relationship"""
-        try:
-            chart = user.birth_chart.single()
+        return BirthChartService.get_by_user_id(user.uid, with_detail=with_detail)
+
+    @staticmethod
+    def get_by_user_id(user_id: str, with_detail: bool = False) -> Optional[BirthChart]:
+        """
+        Get birth chart by user ID
+
+        Args:
+            user_id: UID of the chart's user
+            with_detail: Also load planets_data, houses_data and chart_data
+
+        Returns:
+            The chart, or None if the user has none
+        """
+        chart = IdentityMap.get('BirthChart', user_id)
+        if chart is not None:
+            if with_detail and not chart.detail_loaded:
+                BirthChartService.load_detail(chart)
             return chart
+        query = CHART_WITH_DETAIL_BY_USER_QUERY if with_detail else CHART_BY_USER_QUERY
+        try:
+            results, _ = db.cypher_query(query, {'user_uid': user_id})
         except Exception:
             return None
+        chart = BirthChart.inflate(results[0][0]) if results else None
+        if chart is not None and with_detail:
+            detail = results[0][1]
+            chart.attach_detail(BirthChartDetail.inflate(detail) if detail is not None else None)
+        IdentityMap.put('BirthChart', user_id, chart)
+        return chart
 
     @staticmethod
-    def get_by_user_id(user_id: str) -> Optional[BirthChart]:
-        """Get birth chart by user ID"""
-        try:
-            user = User.nodes.get(uid=user_id)
-            return BirthChartService.get_by_user(user)
-        except User.DoesNotExist:
-            return None
+    def load_detail(chart: BirthChart) -> BirthChart:
+        """Fetch the detail payloads of an already loaded chart"""
+        results, _ = db.cypher_query(DETAIL_BY_CHART_QUERY, {'chart_uid': chart.uid})
+        return chart.attach_detail(BirthChartDetail.inflate(results[0][0]) if results else None)
+
+    @staticmethod
+    async def get_by_user_id_async(user_id: str) -> Optional[BirthChart]:
+        """Get birth chart by user ID without blocking the event loop"""
+        chart = IdentityMap.get('BirthChart', user_id)
+        if chart is None:
+            chart = await BirthChartRepository.get_by_user_uid(user_id)
+            IdentityMap.put('BirthChart', user_id, chart)
+        return chart
+
+    @staticmethod
+    async def has_chart_async(user_id: str) -> bool:
+        """Whether a user has a birth chart, without loading it"""
+        if IdentityMap.get('BirthChart', user_id) is not None:
+            return True
+        return await BirthChartRepository.exists_for_user(user_id)
 
     @staticmethod
     def _format_birth_time(birth_time_input) -> str:
@@ -46,6 +161,40 @@ class BirthChartService:
         else:
             raise ValueError(f"Invalid birth_time format: {type(birth_time_input)}")
 
+    @staticmethod
+    def chart_properties(
+        chart_data: BirthChartCreate,
+        calculated_data: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Deflated node properties for a chart
+
+        Returns:
+            (BirthChart scalar properties, BirthChartDetail payloads)
+        """
+        properties = deflate_properties(BirthChart, None, {
+            'birth_date': chart_data.birth_date,
+            'birth_time': BirthChartService._format_birth_time(chart_data.birth_time),  # Store as string
+            'birth_latitude': chart_data.birth_latitude,
+            'birth_longitude': chart_data.birth_longitude,
+            'birth_place': chart_data.birth_place,
+            'timezone': chart_data.timezone,
+            'lagna': calculated_data.get('lagna'),
+            'sun_sign': calculated_data.get('sun_sign'),
+            'moon_sign': calculated_data.get('moon_sign'),
+        })
+        detail = deflate_properties(BirthChartDetail, None, {
+            'planets_data': {
+                'planets': calculated_data.get('planets', []),
+                'lagna_hindi': calculated_data.get('lagna_hindi', ''),
+                'sun_sign_hindi': calculated_data.get('sun_sign_hindi', ''),
+                'moon_sign_hindi': calculated_data.get('moon_sign_hindi', ''),
+                'suggested_raag': calculated_data.get('suggested_raag', ''),
+            },
+            'chart_data': {'raw_chart': calculated_data.get('chart_raw', '')},
+        })
+        return properties, detail
+
     @staticmethod
     def create_or_update(
         user: User,
@@ -58,7 +207,6 @@ class BirthChartService:
 
         # Create datetime for calculation
         if isinstance(chart_data.birth_date, str):
-            from datetime import datetime
             birth_datetime = datetime.fromisoformat(chart_data.birth_date.replace('Z', '+00:00'))
         else:
             birth_datetime = datetime.combine(chart_data.birth_date, time(0, 0))
@@ -87,100 +235,43 @@ class BirthChartService:
                 'suggested_raag': 'Yaman',
             }
 
-        # Check if chart exists
-        existing_chart = BirthChartService.get_by_user(user)
-
-        if existing_chart:
-            # Update existing chart
-            existing_chart.birth_date = chart_data.birth_date
-            existing_chart.birth_time = birth_time_str  # Store as string
-            existing_chart.birth_latitude = chart_data.birth_latitude
-            existing_chart.birth_longitude = chart_data.birth_longitude
-            existing_chart.birth_place = chart_data.birth_place
-            existing_chart.timezone = chart_data.timezone
-            existing_chart.lagna = calculated_data.get('lagna')
-            existing_chart.sun_sign = calculated_data.get('sun_sign')
-            existing_chart.moon_sign = calculated_data.get('moon_sign')
-            existing_chart.planets_data = {
-                'planets': calculated_data.get('planets', []),
-                'lagna_hindi': calculated_data.get('lagna_hindi', ''),
-                'sun_sign_hindi': calculated_data.get('sun_sign_hindi', ''),
-                'moon_sign_hindi': calculated_data.get('moon_sign_hindi', ''),
-                'suggested_raag': calculated_data.get('suggested_raag', ''),
-            }
-            existing_chart.chart_data = {'raw_chart': calculated_data.get('chart_raw', '')}
-            existing_chart.updated_at = datetime.utcnow()
-            existing_chart.save()
-
-            chart = existing_chart
-        else:
-            # Create new chart
-            chart = BirthChart(
-                birth_date=chart_data.birth_date,
-                birth_time=birth_time_str,  # Store as string
-                birth_latitude=chart_data.birth_latitude,
-                birth_longitude=chart_data.birth_longitude,
-                birth_place=chart_data.birth_place,
-                timezone=chart_data.timezone,
-                lagna=calculated_data.get('lagna'),
-                sun_sign=calculated_data.get('sun_sign'),
-                moon_sign=calculated_data.get('moon_sign'),
-                planets_data={
-                    'planets': calculated_data.get('planets', []),
-                    'lagna_hindi': calculated_data.get('lagna_hindi', ''),
-                    'sun_sign_hindi': calculated_data.get('sun_sign_hindi', ''),
-                    'moon_sign_hindi': calculated_data.get('moon_sign_hindi', ''),
-                    'suggested_raag': calculated_data.get('suggested_raag', ''),
-                },
-                chart_data={'raw_chart': calculated_data.get('chart_raw', '')},
-            )
-            chart.save()
-
-            # Create relationship between user and birth chart
-            user.birth_chart.connect(chart)
-
-        # Connect to zodiac signs if they exist (optional enhancement)
-        BirthChartService._connect_zodiac_signs(chart, calculated_data)
+        # Upsert the chart, its detail, user link and sign links in one statement
+        properties, detail = BirthChartService.chart_properties(chart_data, calculated_data)
+        results, _ = db.cypher_query(UPSERT_QUERY, {
+            'user_uid': user.uid,
+            'chart_uid': uuid4().hex,
+            'now': datetime.now(timezone.utc).timestamp(),
+            'influence_from': CosmicInfluenceService.current_from(),
+            'props': properties,
+            'detail': detail,
+            'lagna': calculated_data.get('lagna'),
+            'sun_sign': calculated_data.get('sun_sign'),
+            'moon_sign': calculated_data.get('moon_sign'),
+            'raag_sources': RaagRecommendationService.sources(
+                calculated_data.get('lagna'),
+                calculated_data.get('moon_sign'),
+                calculated_data.get('sun_sign'),
+                calculated_data.get('planets', []),
+            ),
+        })
+        if not results:
+            raise ValueError(f"User not found: {user.uid}")
 
+        chart = BirthChart.inflate(results[0][0]).attach_detail(BirthChartDetail.inflate(results[0][1]))
+        IdentityMap.put('BirthChart', user.uid, chart)
+        ChartSimilarityService.index_chart(chart.uid, chart.planets_data)
         return chart
 
-    @staticmethod
-    def _connect_zodiac_signs(chart: BirthChart, calculated_data: dict):
-        """Connect birth chart to zodiac sign nodes"""
-        try:
-            if calculated_data.get('lagna'):
-                ascendant_sign = ZodiacSign.nodes.get(name_english=calculated_data['lagna'])
-                if not chart.ascendant_sign.is_connected(ascendant_sign):
-                    chart.ascendant_sign.connect(ascendant_sign)
-        except (ZodiacSign.DoesNotExist, Exception):
-            pass  # Sign node doesn't exist yet
-
-        try:
-            if calculated_data.get('sun_sign'):
-                sun_sign_node = ZodiacSign.nodes.get(name_english=calculated_data['sun_sign'])
-                if not chart.sun_in_sign.is_connected(sun_sign_node):
-                    chart.sun_in_sign.connect(sun_sign_node)
-        except (ZodiacSign.DoesNotExist, Exception):
-            pass
-
-        try:
-            if calculated_data.get('moon_sign'):
-                moon_sign_node = ZodiacSign.nodes.get(name_english=calculated_data['moon_sign'])
-                if not chart.moon_in_sign.is_connected(moon_sign_node):
-                    chart.moon_in_sign.connect(moon_sign_node)
-        except (ZodiacSign.DoesNotExist, Exception):
-            pass
-
     @staticmethod
     def delete(chart: BirthChart) -> None:
         """Delete birth chart"""
         try:
-            # Disconnect all relationships first
-            for rel in chart.planets.all():
-                chart.planets.disconnect(rel)
-
-            # Delete the node
-            chart.delete()
+            db.cypher_query(DELETE_CHART_QUERY, {
+                'chart_uid': chart.uid,
+                'influence_from': CosmicInfluenceService.current_from(),
+            })
+            IdentityMap.forget(chart)
+            ChartSimilarityService.remove(chart.uid)
         except Exception as e:
             print(f"Error deleting birth chart: {e}")
             raise
@@ -0,0 +1,318 @@
+"""
+Bulk NDJSON export and import of users and birth charts
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+from neomodel import db
+from app.core.config import settings
+from app.schemas.birth_chart import BirthChartCreate
+from app.services.birth_chart_service import BirthChartService
+from app.services.chart_batch_service import compute_chart_item
+from app.services.raag_recommendation_service import RECOMMEND_SUBQUERY, RaagRecommendationService
+from app.utils.checkpoint import load_checkpoint, save_checkpoint
+
+# Raw stored properties, so a record round-trips without conversion
+EXPORT_PAGE_QUERY = """
+MATCH (u:User)
+WHERE u.uid > $after
+WITH u
+ORDER BY u.uid
+LIMIT $limit
+OPTIONAL MATCH (u)-[:HAS_BIRTH_CHART]->(c:BirthChart)
+OPTIONAL MATCH (c)-[:HAS_DETAIL]->(d:BirthChartDetail)
+RETURN properties(u) AS user, properties(c) AS chart, properties(d) AS detail
+ORDER BY u.uid
+"""
+
+# Sign relationships and raag recommendations are rebuilt from the chart
+IMPORT_QUERY = """
+UNWIND $rows AS row
+MERGE (u:User {uid: row.user.uid})
+SET u += row.user
+WITH u, row
+WHERE row.chart IS NOT NULL
+MERGE (c:BirthChart {uid: row.chart.uid})
+SET c += row.chart
+MERGE (u)-[:HAS_BIRTH_CHART]->(c)
+MERGE (d:BirthChartDetail {chart_uid: c.uid})
+SET d += coalesce(row.detail, {})
+MERGE (c)-[:HAS_DETAIL]->(d)
+WITH c, row
+OPTIONAL MATCH (c)-[old:HAS_ASCENDANT|SUN_IN|MOON_IN]->(:ZodiacSign)
+DELETE old
+WITH DISTINCT c, row
+OPTIONAL MATCH (lagna:ZodiacSign {name_english: c.lagna})
+OPTIONAL MATCH (sun:ZodiacSign {name_english: c.sun_sign})
+OPTIONAL MATCH (moon:ZodiacSign {name_english: c.moon_sign})
+FOREACH (sign IN CASE WHEN lagna IS NULL THEN [] ELSE [lagna] END | MERGE (c)-[:HAS_ASCENDANT]->(sign))
+FOREACH (sign IN CASE WHEN sun IS NULL THEN [] ELSE [sun] END | MERGE (c)-[:SUN_IN]->(sign))
+FOREACH (sign IN CASE WHEN moon IS NULL THEN [] ELSE [moon] END | MERGE (c)-[:MOON_IN]->(sign))
+WITH c, row.raag_sources AS raag_sources
+""" + RECOMMEND_SUBQUERY
+
+BIRTH_FIELDS = ('birth_date', 'birth_time', 'birth_latitude', 'birth_longitude', 'birth_place', 'timezone')
+
+
+class BulkService:
+    """
+    Service for moving users and their birth charts in and out in bulk
+
+    Each NDJSON line is one user with their chart and chart detail as raw
+    stored properties: {"user": {...}, "chart": {...} | null,
+    "detail": {...} | null}. Exports include password hashes, so treat the
+    files as secrets. Both directions checkpoint after every batch: an
+    export records the last uid and the bytes written, an import the byte
+    offset of the next unread line, so an interrupted run resumes where it
+    stopped when started again on the same file.
+    """
+
+    @staticmethod
+    def checkpoint_path(command: str) -> str:
+        """Default checkpoint file for 'export' or 'import'"""
+        return os.path.join(settings.BULK_CHECKPOINT_DIR, f"bulk_{command}.checkpoint.json")
+
+    @staticmethod
+    def _resume(checkpoint_path: str, run_id: str, restart: bool, initial: Dict[str, Any]) -> Dict[str, Any]:
+        """Checkpoint of the same run, or a fresh one"""
+        checkpoint = {} if restart else load_checkpoint(checkpoint_path)
+        if checkpoint.get('run_id') != run_id:
+            return {'run_id': run_id, **initial, 'completed': False}
+        return checkpoint
+
+    @staticmethod
+    def fetch_page(after: str, limit: int) -> List[Dict[str, Any]]:
+        """Next page of export records, in uid order after a uid"""
+        results, columns = db.cypher_query(EXPORT_PAGE_QUERY, {'after': after, 'limit': limit})
+        records = []
+        for row in results:
+            record = dict(zip(columns, row))
+            if record['detail'] is not None:
+                record['detail'].pop('chart_uid', None)
+            records.append(record)
+        return records
+
+    @classmethod
+    def export(
+        cls,
+        path: str,
+        batch_size: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        restart: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Export every user with their birth chart to an NDJSON file
+
+        Users are paged by uid (keyset pagination). After every page the
+        file is flushed and synced before the checkpoint is written, and a
+        resumed export first truncates the file to the checkpointed size, so
+        no record is lost or written twice.
+
+        Args:
+            path: Output file
+            batch_size: Users per page (default BULK_BATCH_SIZE)
+            checkpoint_path: Checkpoint file (default in BULK_CHECKPOINT_DIR)
+            restart: Ignore an existing checkpoint and overwrite the file
+
+        Returns:
+            Summary with records written, elapsed seconds and records/s
+        """
+        batch_size = batch_size or settings.BULK_BATCH_SIZE
+        checkpoint_path = checkpoint_path or cls.checkpoint_path('export')
+        run_id = f"export:{os.path.abspath(path)}"
+        checkpoint = cls._resume(checkpoint_path, run_id, restart, {'after': '', 'records': 0, 'bytes': 0})
+        if checkpoint['completed']:
+            print(f"✅ Export to {path} already completed ({checkpoint['records']} records)")
+            return {**checkpoint, 'elapsed_seconds': 0.0, 'records_per_second': 0.0}
+        if checkpoint['after']:
+            print(f"↩️  Resuming export to {path} after user {checkpoint['after']}")
+
+        written = 0
+        started = time.perf_counter()
+        with open(path, 'r+b' if checkpoint['bytes'] else 'wb') as f:
+            f.truncate(checkpoint['bytes'])
+            f.seek(checkpoint['bytes'])
+            while True:
+                page = cls.fetch_page(checkpoint['after'], batch_size)
+                if not page:
+                    break
+                f.write(b''.join(
+                    json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+                    for record in page
+                ))
+                f.flush()
+                os.fsync(f.fileno())
+
+                written += len(page)
+                checkpoint.update(
+                    after=page[-1]['user']['uid'],
+                    records=checkpoint['records'] + len(page),
+                    bytes=f.tell(),
+                )
+                save_checkpoint(checkpoint_path, checkpoint)
+
+                elapsed = time.perf_counter() - started
+                print(f"  {checkpoint['records']} records exported ({written / elapsed:.0f} records/s)")
+
+        checkpoint['completed'] = True
+        save_checkpoint(checkpoint_path, checkpoint)
+
+        elapsed = time.perf_counter() - started
+        return {
+            **checkpoint,
+            'records_this_run': written,
+            'elapsed_seconds': round(elapsed, 2),
+            'records_per_second': round(written / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+    @staticmethod
+    def recompute(records: List[Dict[str, Any]], pool: ProcessPoolExecutor) -> int:
+        """
+        Recalculate the chart and detail of records in place from their birth data
+
+        Returns:
+            Number of charts that could not be recalculated (left unchanged)
+        """
+        charted = [record for record in records if record.get('chart')]
+        items = [{field: record['chart'][field] for field in BIRTH_FIELDS} for record in charted]
+        failed = 0
+        for record, item, result in zip(charted, items, pool.map(compute_chart_item, range(len(items)), items)):
+            if result['status'] != 'ok':
+                failed += 1
+                print(f"Warning: chart recompute failed for user {record['user']['uid']}: {result['error']}")
+                continue
+            properties, detail = BirthChartService.chart_properties(BirthChartCreate(**item), result['chart'])
+            record['chart'].update(properties)
+            record['detail'] = detail
+        return failed
+
+    @staticmethod
+    def _with_raag_sources(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Statement row for a record, with the chart's recommendation sources"""
+        chart = record.get('chart')
+        if not chart:
+            return record
+        return {
+            **record,
+            'raag_sources': RaagRecommendationService.sources_for_stored(
+                chart.get('lagna'),
+                chart.get('moon_sign'),
+                chart.get('sun_sign'),
+                (record.get('detail') or {}).get('planets_data'),
+            ),
+        }
+
+    @classmethod
+    def write_batch(cls, records: List[Dict[str, Any]]) -> int:
+        """
+        Upsert records with one UNWIND statement
+
+        If the batch fails (e.g. an email already taken by another uid) its
+        records are retried one at a time so only the bad ones are skipped.
+
+        Returns:
+            Number of records that could not be written
+        """
+        records = [cls._with_raag_sources(record) for record in records]
+        try:
+            db.cypher_query(IMPORT_QUERY, {'rows': records})
+            return 0
+        except Exception as e:
+            print(f"Warning: batch of {len(records)} failed ({e}); retrying records one by one")
+        failed = 0
+        for record in records:
+            try:
+                db.cypher_query(IMPORT_QUERY, {'rows': [record]})
+            except Exception as e:
+                failed += 1
+                print(f"Warning: import failed for user {record['user'].get('uid')}: {e}")
+        return failed
+
+    @classmethod
+    def import_file(
+        cls,
+        path: str,
+        batch_size: Optional[int] = None,
+        recompute: bool = False,
+        workers: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        restart: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Import an NDJSON export, upserting users and charts by uid
+
+        Args:
+            path: Input file
+            batch_size: Records per UNWIND statement (default BULK_BATCH_SIZE)
+            recompute: Recalculate charts from their birth data in worker
+                processes instead of importing the stored results
+            workers: Recompute processes (default ASTROLOGY_PROCESS_WORKERS,
+                0 = one per CPU core)
+            checkpoint_path: Checkpoint file (default in BULK_CHECKPOINT_DIR)
+            restart: Ignore an existing checkpoint for this file
+
+        Returns:
+            Summary with records read, records that failed to write, charts
+            that failed to recompute, elapsed seconds and records/s
+        """
+        batch_size = batch_size or settings.BULK_BATCH_SIZE
+        checkpoint_path = checkpoint_path or cls.checkpoint_path('import')
+        run_id = f"import:{os.path.abspath(path)}"
+        checkpoint = cls._resume(checkpoint_path, run_id, restart, {'offset': 0, 'records': 0, 'failed': 0, 'recompute_failed': 0})
+        if checkpoint['completed']:
+            print(f"✅ Import of {path} already completed ({checkpoint['records']} records)")
+            return {**checkpoint, 'elapsed_seconds': 0.0, 'records_per_second': 0.0}
+        if checkpoint['offset']:
+            print(f"↩️  Resuming import of {path} at byte {checkpoint['offset']}")
+
+        pool = None
+        if recompute:
+            workers = workers if workers is not None else settings.ASTROLOGY_PROCESS_WORKERS
+            pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+
+        imported = 0
+        started = time.perf_counter()
+        try:
+            with open(path, 'rb') as f:
+                f.seek(checkpoint['offset'])
+                while True:
+                    batch = []
+                    while len(batch) < batch_size:
+                        line = f.readline()
+                        if not line:
+                            break
+                        if line.strip():
+                            batch.append(json.loads(line))
+                    if not batch:
+                        break
+
+                    recompute_failed = cls.recompute(batch, pool) if pool else 0
+                    failed = cls.write_batch(batch)
+
+                    imported += len(batch)
+                    checkpoint.update(
+                        offset=f.tell(),
+                        records=checkpoint['records'] + len(batch),
+                        failed=checkpoint['failed'] + failed,
+                        recompute_failed=checkpoint['recompute_failed'] + recompute_failed,
+                    )
+                    save_checkpoint(checkpoint_path, checkpoint)
+
+                    elapsed = time.perf_counter() - started
+                    print(f"  {checkpoint['records']} records imported ({imported / elapsed:.0f} records/s)")
+        finally:
+            if pool:
+                pool.shutdown()
+
+        checkpoint['completed'] = True
+        save_checkpoint(checkpoint_path, checkpoint)
+
+        elapsed = time.perf_counter() - started
+        return {
+            **checkpoint,
+            'records_this_run': imported,
+            'elapsed_seconds': round(elapsed, 2),
+            'records_per_second': round(imported / elapsed, 1) if elapsed > 0 else 0.0,
+        }
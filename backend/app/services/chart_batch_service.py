@@ -0,0 +1,84 @@
+"""
+Batch birth chart computation on the chart executor
+"""
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List
+from app.services.astrology_service import AstrologyService
+from app.services.chart_executor import get_chart_executor
+
+
+def compute_chart_item(index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute one batch item inside a worker process
+
+    Errors are returned inline so a single bad item never fails the batch.
+
+    Args:
+        index: Position of the item in the batch request
+        item: Birth chart request fields (birth_date, birth_time,
+            birth_latitude, birth_longitude, timezone)
+
+    Returns:
+        Result record tagged with the input index
+    """
+    try:
+        birth_date = datetime.fromisoformat(item['birth_date'].replace('Z', '+00:00'))
+        chart_data = AstrologyService.compute_birth_chart(
+            birth_date=birth_date,
+            birth_time=item['birth_time'],
+            latitude=item['birth_latitude'],
+            longitude=item['birth_longitude'],
+            timezone=item['timezone']
+        )
+        return {'index': index, 'status': 'ok', 'chart': chart_data}
+    except ImportError as e:
+        return {'index': index, 'status': 'error', 'error': f"Astrology engine unavailable: {e}"}
+    except Exception as e:
+        return {'index': index, 'status': 'error', 'error': str(e) or e.__class__.__name__}
+
+
+class ChartBatchService:
+    """Service for fanning birth chart batches out to worker processes"""
+
+    @staticmethod
+    async def stream(items: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Compute charts for all items, yielding results in completion order
+
+        Items run on the shared chart executor. At most two items per worker
+        are in flight at once, and batch items wait for queue slots rather
+        than being rejected, so a large batch never floods the queue.
+
+        Args:
+            items: Birth chart request dictionaries
+
+        Yields:
+            Result records from compute_chart_item
+        """
+        executor = get_chart_executor()
+        window = executor.max_workers * 2
+        queued = iter(enumerate(items))
+        pending = set()
+
+        def submit_next() -> None:
+            entry = next(queued, None)
+            if entry is not None:
+                pending.add(asyncio.ensure_future(
+                    executor.submit(compute_chart_item, *entry, block=True)
+                ))
+
+        for _ in range(window):
+            submit_next()
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    submit_next()
+                    yield future.result()
+        finally:
+            # Client went away or the stream was closed early
+            for future in pending:
+                future.cancel()
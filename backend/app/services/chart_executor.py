@@ -0,0 +1,142 @@
+"""
+Dedicated process-pool executor for CPU-bound chart computation
+"""
+import asyncio
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+from app.core.config import settings
+from app.utils.metrics import LatencyStats
+
+
+class ExecutorSaturated(Exception):
+    """Raised when the chart executor queue is full"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Chart computation queue is full")
+        self.retry_after = retry_after
+
+
+def _timed_call(fn: Callable, args: Tuple) -> Tuple[float, Any]:
+    """Run fn(*args) in a worker process, returning (run seconds, result)"""
+    started = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - started, result
+
+
+class ChartExecutor:
+    """
+    Process pool with a bounded submission queue
+
+    Up to ``max_workers + max_queue`` jobs are admitted at once. Further
+    non-blocking submissions fail fast with ExecutorSaturated so the API can
+    answer 503 instead of letting latency grow without bound.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ProcessPoolExecutor(max_workers=max_workers)
+        self._slots = asyncio.Semaphore(max_workers + max_queue)
+        self.in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.wait_time = LatencyStats()
+        self.run_time = LatencyStats()
+
+    @property
+    def queue_depth(self) -> int:
+        """Admitted jobs not yet picked up by a worker (estimated)"""
+        return max(0, self.in_flight - self.max_workers)
+
+    def _retry_after(self) -> int:
+        """Estimate seconds until a queue slot frees up"""
+        backlog = self.queue_depth + 1
+        estimate = self.run_time.mean * backlog / self.max_workers
+        return max(1, min(30, math.ceil(estimate)))
+
+    async def submit(self, fn: Callable, *args: Any, block: bool = False) -> Any:
+        """
+        Run fn(*args) on the pool and return its result
+
+        Args:
+            fn: Picklable callable
+            *args: Picklable positional arguments
+            block: Wait for a free slot instead of failing when saturated
+
+        Raises:
+            ExecutorSaturated: If the queue is full and block is False
+        """
+        if not block and self._slots.locked():
+            self.rejected += 1
+            raise ExecutorSaturated(retry_after=self._retry_after())
+
+        await self._slots.acquire()
+        self.in_flight += 1
+        self.submitted += 1
+        enqueued = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            run_seconds, result = await loop.run_in_executor(self._pool, _timed_call, fn, args)
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+        total = time.perf_counter() - enqueued
+        self.completed += 1
+        self.run_time.observe(run_seconds)
+        self.wait_time.observe(max(0.0, total - run_seconds))
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, counters and wait/run time metrics"""
+        return {
+            'max_workers': self.max_workers,
+            'max_queue': self.max_queue,
+            'in_flight': self.in_flight,
+            'queue_depth': self.queue_depth,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'rejected': self.rejected,
+            'wait_time': self.wait_time.snapshot(),
+            'run_time': self.run_time.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, cancelling queued jobs"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+_chart_executor: Optional[ChartExecutor] = None
+
+
+def start_chart_executor() -> ChartExecutor:
+    """Start the shared chart executor (called from the app lifespan)"""
+    global _chart_executor
+    if _chart_executor is None:
+        _chart_executor = ChartExecutor(
+            max_workers=settings.ASTROLOGY_PROCESS_WORKERS or os.cpu_count() or 1,
+            max_queue=settings.ASTROLOGY_EXECUTOR_QUEUE_SIZE,
+        )
+    return _chart_executor
+
+
+def get_chart_executor() -> ChartExecutor:
+    """Get the shared chart executor, starting it on first use"""
+    return _chart_executor or start_chart_executor()
+
+
+def shutdown_chart_executor() -> None:
+    """Shut down the shared chart executor if it was started"""
+    global _chart_executor
+    if _chart_executor is not None:
+        _chart_executor.shutdown()
+        _chart_executor = None
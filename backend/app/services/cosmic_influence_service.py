@@ -0,0 +1,403 @@
+"""
+Daily cosmic influence: computation, nightly precomputation and lookup
+"""
+import json
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+from neomodel import db
+from app.core.config import settings
+from app.models.astrology_neo4j import DailyInfluence
+from app.services.astrology_service import AstrologyService
+from app.services.transit_service import TransitService
+from app.utils.checkpoint import load_checkpoint, save_checkpoint
+
+USERS_WITH_CHARTS_QUERY = """
+MATCH (u:User)-[:HAS_BIRTH_CHART]->(c:BirthChart)
+WHERE u.uid > $after
+RETURN u.uid AS uid, c.lagna AS lagna, c.sun_sign AS sun_sign,
+       c.moon_sign AS moon_sign, c.timezone AS timezone
+ORDER BY u.uid
+LIMIT $limit
+"""
+
+STORE_QUERY = """
+UNWIND $rows AS row
+MATCH (u:User {uid: row.user_uid})
+MERGE (d:DailyInfluence {key: row.key})
+SET d += row.props
+MERGE (u)-[:HAS_DAILY_INFLUENCE]->(d)
+"""
+
+LOOKUP_QUERY = """
+MATCH (d:DailyInfluence)
+WHERE d.key IN $keys
+RETURN d
+"""
+
+PRUNE_QUERY = """
+MATCH (d:DailyInfluence)
+WHERE d.date < $before
+WITH d LIMIT $limit
+DETACH DELETE d
+RETURN count(d)
+"""
+
+
+class CosmicInfluenceService:
+    """
+    Service for per-user daily cosmic influence
+
+    A nightly job (``python -m app.tools.daily_influence``) walks every user
+    with a birth chart in uid order, computes their influence for their
+    local date and stores it as a DailyInfluence node keyed by
+    "<user uid>:<YYYY-MM-DD>". Reading today's influence is then one lookup
+    on that unique key. Users the job hasn't reached yet are computed on
+    demand and stored the same way. Each completed run prunes influences
+    older than DAILY_INFLUENCE_RETENTION_DAYS.
+    """
+
+    @staticmethod
+    def compute(
+        user_id: str,
+        birth_chart: Dict[str, Any],
+        date: str,
+        transits: List[Dict[str, Any]],
+        snapshot_at: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Compute the cosmic influence of transits on a birth chart
+
+        Args:
+            user_id: User ID the result belongs to
+            birth_chart: Chart summary with 'ascendant', 'sun_sign' and 'moon_sign'
+            date: Date the influence applies to
+            transits: Active transit dictionaries
+            snapshot_at: ISO time the transits were computed for
+
+        Returns:
+            Cosmic influence dictionary in the API response format
+        """
+        ascendant = birth_chart.get('ascendant', '')
+        moon_sign = birth_chart.get('moon_sign', '')
+
+        # Get raag recommendations
+        raags = AstrologyService.get_recommended_raags(
+            lagna=ascendant,
+            moon_sign=moon_sign
+        )
+        lucky_raag = raags[0] if raags else None
+
+        return {
+            'user_id': user_id,
+            'date': date,
+            'energy_level': "Moderate",  # Can be enhanced with actual transit analysis
+            'dominant_moods': ["Calm", "Focused"],
+            'overall_description': f"Today's cosmic energy is favorable for introspection and creative pursuits. "
+                                   f"Your {ascendant} ascendant is well-supported by current planetary positions.",
+            'recommendations': [
+                f"Listen to {lucky_raag} to harmonize with cosmic energies",
+                "Practice meditation during sunset",
+                "Focus on creative projects today"
+            ],
+            'active_transits': transits,
+            'lucky_raag': lucky_raag,
+            'overall_score': 75.0,
+            'snapshot_at': snapshot_at,
+        }
+
+    @staticmethod
+    def _tzinfo(name: Optional[str]):
+        """Resolve an IANA name or fixed "+HH:MM" offset, falling back to UTC"""
+        tz = (name or '').strip()
+        try:
+            if tz[:1] in ('+', '-'):
+                sign = -1 if tz[0] == '-' else 1
+                hours, _, minutes = tz[1:].partition(':')
+                return timezone(sign * timedelta(hours=int(hours), minutes=int(minutes or 0)))
+            return ZoneInfo(tz)
+        except Exception:
+            return timezone.utc
+
+    @classmethod
+    def local_date(cls, tz_name: Optional[str], now: Optional[datetime] = None) -> date:
+        """Calendar date in a timezone at a moment (default now)"""
+        now = now or datetime.now(timezone.utc)
+        return now.astimezone(cls._tzinfo(tz_name)).date()
+
+    @classmethod
+    def transit_moment(cls, local_date: date, tz_name: Optional[str]) -> datetime:
+        """Local noon of a date as a UTC moment; daily transits are taken there"""
+        noon = datetime(local_date.year, local_date.month, local_date.day, 12, tzinfo=cls._tzinfo(tz_name))
+        return noon.astimezone(timezone.utc)
+
+    @staticmethod
+    def current_from(now: Optional[datetime] = None) -> str:
+        """
+        Earliest date a stored influence can still be someone's "today"
+
+        Influences dated on or after it may still be served by get_today, so
+        they are dropped whenever the chart changes; older ones are history.
+        """
+        now = now or datetime.now(timezone.utc)
+        return (now.astimezone(timezone.utc).date() - timedelta(days=1)).isoformat()
+
+    @staticmethod
+    def _key(user_uid: str, local_date: date) -> str:
+        """Stored influence key for a user and local date"""
+        return f"{user_uid}:{local_date.isoformat()}"
+
+    @classmethod
+    def _row(cls, influence: Dict[str, Any], tz_name: Optional[str]) -> Dict[str, Any]:
+        """Cypher parameters for storing one influence (JSON properties pre-serialized)"""
+        return {
+            'user_uid': influence['user_id'],
+            'key': f"{influence['user_id']}:{influence['date']}",
+            'props': {
+                'user_uid': influence['user_id'],
+                'date': influence['date'],
+                'timezone': tz_name,
+                'energy_level': influence['energy_level'],
+                'dominant_moods': json.dumps(influence['dominant_moods']),
+                'overall_description': influence['overall_description'],
+                'recommendations': json.dumps(influence['recommendations']),
+                'active_transits': json.dumps(influence['active_transits']),
+                'lucky_raag': influence['lucky_raag'],
+                'overall_score': influence['overall_score'],
+                'snapshot_at': influence['snapshot_at'],
+                'computed_at': datetime.now(timezone.utc).timestamp(),
+            },
+        }
+
+    @staticmethod
+    def store(rows: List[Dict[str, Any]]) -> None:
+        """Upsert stored influences in a single statement"""
+        if rows:
+            db.cypher_query(STORE_QUERY, {'rows': rows})
+
+    @classmethod
+    def compute_for_user(
+        cls,
+        user_uid: str,
+        chart: Dict[str, Any],
+        local_date: date,
+        transit_cache: Optional[Dict[datetime, List[Dict[str, Any]]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Compute one user's influence for a local date
+
+        Transits are taken at local noon. Users in the same timezone share a
+        moment, so the batch job passes a transit_cache to compute each
+        moment only once.
+
+        Args:
+            user_uid: User ID
+            chart: Row with 'lagna', 'sun_sign', 'moon_sign' and 'timezone'
+            local_date: User's local date
+            transit_cache: Optional moment -> transits memo
+
+        Returns:
+            Cosmic influence dictionary
+        """
+        moment = cls.transit_moment(local_date, chart.get('timezone'))
+        transits = transit_cache.get(moment) if transit_cache is not None else None
+        if transits is None:
+            transits = TransitService.compute_transits(moment)
+            if transit_cache is not None:
+                transit_cache[moment] = transits
+
+        return cls.compute(
+            user_id=user_uid,
+            birth_chart={
+                'ascendant': chart.get('lagna') or '',
+                'sun_sign': chart.get('sun_sign') or '',
+                'moon_sign': chart.get('moon_sign') or '',
+            },
+            date=local_date.isoformat(),
+            transits=transits,
+            snapshot_at=moment.isoformat()
+        )
+
+    @classmethod
+    def get_today(cls, user_uid: str, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """
+        Read a user's precomputed influence for their local today
+
+        The user's local date is one of yesterday, today or tomorrow in UTC,
+        so all three keys are looked up in one indexed read and the record
+        whose stored timezone puts "now" on its date is returned.
+
+        Args:
+            user_uid: User ID
+            now: Moment to resolve "today" at (default now)
+
+        Returns:
+            Stored influence dictionary, or None if not precomputed
+        """
+        now = now or datetime.now(timezone.utc)
+        utc_today = now.astimezone(timezone.utc).date()
+        keys = [cls._key(user_uid, utc_today + timedelta(days=offset)) for offset in (-1, 0, 1)]
+
+        results, _ = db.cypher_query(LOOKUP_QUERY, {'keys': keys})
+        for row in results:
+            record = DailyInfluence.inflate(row[0])
+            if record.date == cls.local_date(record.timezone, now).isoformat():
+                return record.to_dict()
+        return None
+
+    @classmethod
+    def compute_today(cls, user_uid: str, chart, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Compute and store a user's influence for their local today
+
+        Args:
+            user_uid: User ID
+            chart: The user's BirthChart node
+            now: Moment to resolve "today" at (default now)
+
+        Returns:
+            Cosmic influence dictionary
+        """
+        row = {
+            'lagna': chart.lagna,
+            'sun_sign': chart.sun_sign,
+            'moon_sign': chart.moon_sign,
+            'timezone': chart.timezone,
+        }
+        influence = cls.compute_for_user(user_uid, row, cls.local_date(chart.timezone, now))
+        try:
+            cls.store([cls._row(influence, chart.timezone)])
+        except Exception as e:
+            print(f"Warning: could not store cosmic influence for {user_uid}: {e}")
+        return influence
+
+    @staticmethod
+    def prune(
+        retention_days: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+        now: Optional[datetime] = None
+    ) -> int:
+        """
+        Delete influences dated more than retention_days before today (UTC)
+        in bounded batches
+
+        Args:
+            retention_days: Days of history to keep (default DAILY_INFLUENCE_RETENTION_DAYS; 0 keeps everything)
+            batch_size: Nodes per statement (default DAILY_INFLUENCE_PRUNE_BATCH_SIZE)
+            max_batches: Statements per call (default DAILY_INFLUENCE_PRUNE_MAX_BATCHES)
+            now: Moment to count back from (default now)
+
+        Returns:
+            Influences deleted
+        """
+        retention_days = settings.DAILY_INFLUENCE_RETENTION_DAYS if retention_days is None else retention_days
+        if retention_days <= 0:
+            return 0
+        batch_size = batch_size or settings.DAILY_INFLUENCE_PRUNE_BATCH_SIZE
+        max_batches = max_batches or settings.DAILY_INFLUENCE_PRUNE_MAX_BATCHES
+        now = now or datetime.now(timezone.utc)
+        before = (now.astimezone(timezone.utc).date() - timedelta(days=retention_days)).isoformat()
+
+        deleted = 0
+        for _ in range(max_batches):
+            results, _ = db.cypher_query(PRUNE_QUERY, {'before': before, 'limit': batch_size})
+            count = results[0][0] if results else 0
+            deleted += count
+            if count < batch_size:
+                break
+        return deleted
+
+    @classmethod
+    def fetch_page(cls, after: str, limit: int) -> List[Dict[str, Any]]:
+        """Next page of users with birth charts, in uid order after a uid"""
+        results, columns = db.cypher_query(USERS_WITH_CHARTS_QUERY, {'after': after, 'limit': limit})
+        return [dict(zip(columns, row)) for row in results]
+
+    @classmethod
+    def run_daily_job(
+        cls,
+        days_ahead: int = 1,
+        page_size: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        restart: bool = False,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Precompute every user's influence for their local date
+
+        Users are paged by uid (keyset pagination) and each page is stored
+        in one statement. After every page the last uid is checkpointed, so
+        a run interrupted part-way resumes after the last stored page when
+        started again on the same UTC day with the same days_ahead.
+
+        Args:
+            days_ahead: Days after each user's current local date to compute
+            page_size: Users per page (default DAILY_INFLUENCE_PAGE_SIZE)
+            checkpoint_path: Checkpoint file (default DAILY_INFLUENCE_CHECKPOINT_PATH)
+            restart: Ignore an existing checkpoint for this run
+            now: Moment the run is for (default now)
+
+        Returns:
+            Summary with users processed, failures, influences pruned,
+            elapsed seconds and users/s
+        """
+        now = now or datetime.now(timezone.utc)
+        page_size = page_size or settings.DAILY_INFLUENCE_PAGE_SIZE
+        checkpoint_path = checkpoint_path or settings.DAILY_INFLUENCE_CHECKPOINT_PATH
+        run_id = f"{now.astimezone(timezone.utc).date().isoformat()}+{days_ahead}"
+
+        checkpoint = {} if restart else load_checkpoint(checkpoint_path)
+        if checkpoint.get('run_id') != run_id:
+            checkpoint = {'run_id': run_id, 'after': '', 'processed': 0, 'failed': 0, 'completed': False}
+        elif checkpoint.get('completed'):
+            print(f"✅ Daily influence run {run_id} already completed ({checkpoint['processed']} users)")
+            return {**checkpoint, 'pruned': cls.prune(now=now), 'elapsed_seconds': 0.0, 'users_per_second': 0.0}
+        elif checkpoint['after']:
+            print(f"↩️  Resuming daily influence run {run_id} after user {checkpoint['after']}")
+
+        transit_cache: Dict[datetime, List[Dict[str, Any]]] = {}
+        processed = failed = 0
+        started = time.perf_counter()
+
+        while True:
+            page = cls.fetch_page(checkpoint['after'], page_size)
+            if not page:
+                break
+
+            rows = []
+            for chart in page:
+                local_date = cls.local_date(chart['timezone'], now) + timedelta(days=days_ahead)
+                try:
+                    influence = cls.compute_for_user(chart['uid'], chart, local_date, transit_cache)
+                    rows.append(cls._row(influence, chart['timezone']))
+                except Exception as e:
+                    failed += 1
+                    print(f"Warning: cosmic influence failed for {chart['uid']}: {e}")
+            cls.store(rows)
+
+            processed += len(rows)
+            checkpoint.update(
+                after=page[-1]['uid'],
+                processed=checkpoint['processed'] + len(rows),
+                failed=checkpoint['failed'] + len(page) - len(rows),
+            )
+            save_checkpoint(checkpoint_path, checkpoint)
+
+            elapsed = time.perf_counter() - started
+            print(f"  {checkpoint['processed']} users stored ({processed / elapsed:.0f} users/s)")
+
+        checkpoint['completed'] = True
+        save_checkpoint(checkpoint_path, checkpoint)
+        pruned = cls.prune(now=now)
+
+        elapsed = time.perf_counter() - started
+        return {
+            **checkpoint,
+            'processed_this_run': processed,
+            'failed_this_run': failed,
+            'pruned': pruned,
+            'elapsed_seconds': round(elapsed, 2),
+            'users_per_second': round(processed / elapsed, 1) if elapsed > 0 else 0.0,
+        }
@@ -0,0 +1,280 @@
+"""
+Precomputed sidereal ephemeris for fast transit lookups
+
+The ephemeris is a NumPy array of shape (steps, grahas, 2) holding the
+Lahiri sidereal longitude (degrees) and longitudinal speed (degrees/day) of
+each graha at fixed time steps. It is stored as a .npy file next to a JSON
+sidecar describing the time grid, and opened read-only with mmap so every
+worker process shares the same pages.
+"""
+import json
+import math
+import multiprocessing
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+from app.core.config import settings
+
+# Order of the graha axis in the ephemeris array
+GRAHAS = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"]
+
+# Swiss Ephemeris body ids for GRAHAS[:8] (Ketu is derived from Rahu's mean node)
+_SWISSEPH_BODIES = [0, 1, 4, 2, 5, 3, 6, 10]
+
+FORMAT_VERSION = 1
+UNIX_EPOCH_JD = 2440587.5
+STALE_LOCK_SECONDS = 3600
+
+
+def datetime_to_jd(when: datetime) -> float:
+    """Convert a datetime to a UT Julian day (naive datetimes are taken as UTC)"""
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return UNIX_EPOCH_JD + when.timestamp() / 86400.0
+
+
+def compute_positions(jd: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute sidereal longitude and speed of every graha directly with Swiss Ephemeris
+
+    Args:
+        jd: UT Julian day
+
+    Returns:
+        (longitudes in degrees, speeds in degrees/day), in GRAHAS order
+    """
+    import swisseph as swe
+
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_SPEED
+    longitude = np.empty(len(GRAHAS))
+    speed = np.empty(len(GRAHAS))
+    for column, body in enumerate(_SWISSEPH_BODIES):
+        position = swe.calc_ut(jd, body, flags)[0]
+        longitude[column] = position[0]
+        speed[column] = position[3]
+    # Ketu is always opposite Rahu
+    longitude[8] = (longitude[7] + 180.0) % 360.0
+    speed[8] = speed[7]
+    return longitude, speed
+
+
+def build_ephemeris(path: str, start_year: int, end_year: int, step_hours: float) -> Dict[str, Any]:
+    """
+    Compute the ephemeris with Swiss Ephemeris and write it to path
+
+    The array and its sidecar are written to temporary files and moved into
+    place atomically, so readers never see a partial file.
+
+    Args:
+        path: Destination .npy path
+        start_year: First year covered (from Jan 1, 00:00 UT)
+        end_year: Last year covered (through Dec 31)
+        step_hours: Sampling interval
+
+    Returns:
+        Metadata describing the written ephemeris
+    """
+    import swisseph as swe
+
+    start_jd = swe.julday(start_year, 1, 1, 0.0)
+    end_jd = swe.julday(end_year + 1, 1, 1, 0.0)
+    step_days = step_hours / 24.0
+    steps = int(math.ceil((end_jd - start_jd) / step_days)) + 1
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+    data = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float64, shape=(steps, len(GRAHAS), 2))
+
+    for step in range(steps):
+        longitude, speed = compute_positions(start_jd + step * step_days)
+        data[step, :, 0] = longitude
+        data[step, :, 1] = speed
+
+    data.flush()
+    del data
+
+    meta = {
+        'version': FORMAT_VERSION,
+        'grahas': GRAHAS,
+        'ayanamsa': 'Lahiri',
+        'start_jd': start_jd,
+        'step_days': step_days,
+        'steps': steps,
+        'start_year': start_year,
+        'end_year': end_year,
+        'built_at': datetime.utcnow().isoformat(),
+    }
+    tmp_meta_path = f"{path}.{os.getpid()}.tmp.json"
+    with open(tmp_meta_path, 'w') as f:
+        json.dump(meta, f)
+
+    os.replace(tmp_path, path)
+    os.replace(tmp_meta_path, f"{path}.json")
+    return meta
+
+
+class EphemerisService:
+    """Service for interpolated graha positions from the memory-mapped ephemeris"""
+
+    _data: Optional[np.ndarray] = None
+    _meta: Optional[Dict[str, Any]] = None
+    _builder: Optional[multiprocessing.Process] = None
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> bool:
+        """
+        Memory-map the ephemeris if it exists and is complete
+
+        Returns:
+            True if the ephemeris is loaded
+        """
+        path = path or settings.EPHEMERIS_PATH
+        meta_path = f"{path}.json"
+        if not (os.path.exists(path) and os.path.exists(meta_path)):
+            return False
+
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            data = np.load(path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not load ephemeris {path}: {e}")
+            return False
+
+        if meta.get('version') != FORMAT_VERSION or data.shape != (meta['steps'], len(GRAHAS), 2):
+            print(f"Warning: ephemeris {path} does not match its metadata, ignoring it")
+            return False
+
+        cls._data = data
+        cls._meta = meta
+        return True
+
+    @classmethod
+    def is_ready(cls) -> bool:
+        """Whether lookups can be served (loads the file if it has appeared)"""
+        return cls._data is not None or cls.load()
+
+    @classmethod
+    def start_background_build(cls) -> None:
+        """Build the ephemeris in a separate process if the file is missing"""
+        if cls.is_ready() or (cls._builder is not None and cls._builder.is_alive()):
+            return
+
+        # Only one worker builds; the others pick the file up once it exists
+        lock_path = f"{settings.EPHEMERIS_PATH}.lock"
+        os.makedirs(os.path.dirname(os.path.abspath(lock_path)), exist_ok=True)
+        try:
+            if time.time() - os.path.getmtime(lock_path) > STALE_LOCK_SECONDS:
+                os.remove(lock_path)  # Left behind by a builder that died
+        except OSError:
+            pass
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL))
+        except FileExistsError:
+            return
+
+        cls._builder = multiprocessing.Process(
+            target=_build_and_release,
+            args=(
+                settings.EPHEMERIS_PATH,
+                settings.EPHEMERIS_START_YEAR,
+                settings.EPHEMERIS_END_YEAR,
+                settings.EPHEMERIS_STEP_HOURS,
+                lock_path,
+            ),
+            daemon=True,
+        )
+        cls._builder.start()
+        print(f"🪐 Building ephemeris {settings.EPHEMERIS_START_YEAR}-{settings.EPHEMERIS_END_YEAR} in background")
+
+    @classmethod
+    def covers(cls, start_jd: float, end_jd: float) -> bool:
+        """Whether the loaded ephemeris spans the whole Julian day range"""
+        if not cls.is_ready():
+            return False
+        meta = cls._meta
+        last_jd = meta['start_jd'] + (meta['steps'] - 1) * meta['step_days']
+        return meta['start_jd'] <= start_jd and end_jd < last_jd
+
+    @classmethod
+    def interpolate(cls, jd: float) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Interpolate sidereal longitude and speed of every graha at a Julian day
+
+        Uses cubic Hermite interpolation between the two surrounding samples,
+        with the stored speeds as tangents.
+
+        Returns:
+            (longitudes, speeds) in GRAHAS order, or None if the ephemeris is
+            not loaded or does not cover jd
+        """
+        if not cls.is_ready():
+            return None
+
+        meta = cls._meta
+        h = meta['step_days']
+        t = (jd - meta['start_jd']) / h
+        index = int(math.floor(t))
+        if index < 0 or index + 1 >= meta['steps']:
+            return None
+
+        u = t - index
+        sample = cls._data[index:index + 2]
+        p0 = sample[0, :, 0]
+        # Unwrap across 360 -> 0 so interpolation takes the short way round
+        p1 = p0 + ((sample[1, :, 0] - p0 + 180.0) % 360.0 - 180.0)
+        m0 = sample[0, :, 1] * h
+        m1 = sample[1, :, 1] * h
+
+        u2 = u * u
+        u3 = u2 * u
+        longitude = ((2 * u3 - 3 * u2 + 1) * p0 + (u3 - 2 * u2 + u) * m0
+                     + (-2 * u3 + 3 * u2) * p1 + (u3 - u2) * m1) % 360.0
+        speed = ((6 * u2 - 6 * u) * p0 + (3 * u2 - 4 * u + 1) * m0
+                 + (-6 * u2 + 6 * u) * p1 + (3 * u2 - 2 * u) * m1) / h
+        return longitude, speed
+
+    @classmethod
+    def positions(cls, when: datetime) -> Optional[Dict[str, Dict[str, float]]]:
+        """
+        Interpolated sidereal longitude and speed of every graha at a moment
+
+        Args:
+            when: Moment to look up (naive datetimes are taken as UTC)
+
+        Returns:
+            Mapping of graha name to {'longitude', 'speed'}, or None if the
+            ephemeris is not loaded or does not cover the moment
+        """
+        result = cls.interpolate(datetime_to_jd(when))
+        if result is None:
+            return None
+
+        longitude, speed = result
+        return {
+            name: {'longitude': float(longitude[i]), 'speed': float(speed[i])}
+            for i, name in enumerate(GRAHAS)
+        }
+
+    @classmethod
+    def info(cls) -> Dict[str, Any]:
+        """Describe the loaded ephemeris"""
+        if not cls.is_ready():
+            building = cls._builder is not None and cls._builder.is_alive()
+            return {'ready': False, 'building': building}
+        return {'ready': True, **cls._meta}
+
+
+def _build_and_release(path: str, start_year: int, end_year: int, step_hours: float, lock_path: str) -> None:
+    """Background build entry point; always removes the build lock"""
+    try:
+        build_ephemeris(path, start_year, end_year, step_hours)
+    finally:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
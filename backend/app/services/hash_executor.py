@@ -0,0 +1,134 @@
+"""
+Dedicated thread pool for password hashing
+"""
+import asyncio
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+from app.core.config import settings
+from app.utils.metrics import LatencyStats
+
+
+class HashExecutorSaturated(Exception):
+    """Raised when the password hashing queue is full"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Password hashing queue is full")
+        self.retry_after = retry_after
+
+
+def _timed_call(fn: Callable, args: Tuple) -> Tuple[float, float, Any]:
+    """Run fn(*args) on a hashing thread, returning (start time, run seconds, result)"""
+    started = time.perf_counter()
+    result = fn(*args)
+    return started, time.perf_counter() - started, result
+
+
+class HashExecutor:
+    """
+    Bounded thread pool that runs bcrypt off the request threadpool
+
+    bcrypt releases the GIL, so ``max_workers`` threads hash in parallel on
+    as many cores. Up to ``max_workers + max_queue`` jobs are admitted at
+    once; beyond that submissions fail fast with HashExecutorSaturated, so a
+    login storm gets 503s instead of starving other endpoints.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self.in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.wait_time = LatencyStats()
+        self.run_time = LatencyStats()
+
+    @property
+    def queue_depth(self) -> int:
+        """Admitted jobs not yet picked up by a thread (estimated)"""
+        return max(0, self.in_flight - self.max_workers)
+
+    def _retry_after(self) -> int:
+        """Estimate seconds until a queue slot frees up"""
+        estimate = self.run_time.mean * (self.queue_depth + 1) / self.max_workers
+        return max(1, min(30, math.ceil(estimate)))
+
+    async def submit(self, fn: Callable, *args: Any) -> Any:
+        """
+        Run fn(*args) on a hashing thread and return its result
+
+        Raises:
+            HashExecutorSaturated: If the queue is full
+        """
+        # Only touched from the event loop thread, so no lock is needed
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise HashExecutorSaturated(retry_after=self._retry_after())
+
+        self.in_flight += 1
+        self.submitted += 1
+        enqueued = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            started, run_seconds, result = await loop.run_in_executor(self._pool, _timed_call, fn, args)
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+        self.completed += 1
+        self.run_time.observe(run_seconds)
+        self.wait_time.observe(max(0.0, started - enqueued))
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, counters and queue/run time metrics"""
+        return {
+            'max_workers': self.max_workers,
+            'max_queue': self.max_queue,
+            'in_flight': self.in_flight,
+            'queue_depth': self.queue_depth,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'rejected': self.rejected,
+            'wait_time': self.wait_time.snapshot(),
+            'run_time': self.run_time.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the hashing threads, cancelling queued jobs"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+_hash_executor: Optional[HashExecutor] = None
+
+
+def start_hash_executor() -> HashExecutor:
+    """Start the shared hashing executor (called from the app lifespan)"""
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = HashExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1,
+            max_queue=settings.PASSWORD_HASH_QUEUE_SIZE,
+        )
+    return _hash_executor
+
+
+def get_hash_executor() -> HashExecutor:
+    """Get the shared hashing executor, starting it on first use"""
+    return _hash_executor or start_hash_executor()
+
+
+def shutdown_hash_executor() -> None:
+    """Shut down the shared hashing executor if it was started"""
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown()
+        _hash_executor = None
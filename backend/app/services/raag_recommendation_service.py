@@ -0,0 +1,153 @@
+"""
+Weighted raag recommendations materialized as RECOMMENDED relationships
+"""
+import json
+from typing import Any, Dict, List, Optional
+from neomodel import db
+from app.db.reference_data import PLANET_RAAGS
+from app.models.music_neo4j import Raag
+
+# Scores a chart's raags from its graph links and replaces its RECOMMENDED
+# relationships. Expects `c` (the chart) and `raag_sources` in scope; each
+# source names a sign or a planet and carries a weight. Always yields one row.
+RECOMMEND_SUBQUERY = """
+CALL {
+  WITH c, raag_sources
+  OPTIONAL MATCH (c)-[old:RECOMMENDED]->(:Raag)
+  DELETE old
+  WITH DISTINCT c, raag_sources
+  UNWIND raag_sources AS source
+  OPTIONAL MATCH (:ZodiacSign {name_english: source.sign})-[:SUGGESTED_RAAG]->(sign_raag:Raag)
+  OPTIONAL MATCH (:Planet {name: source.planet})-[:ASSOCIATED_WITH_RAAG]->(planet_raag:Raag)
+  WITH c, source, coalesce(sign_raag, planet_raag) AS raag
+  WHERE raag IS NOT NULL
+  WITH c, raag, sum(source.weight) AS score
+  MERGE (c)-[rec:RECOMMENDED]->(raag)
+  SET rec.score = score
+  RETURN count(raag) AS recommended
+}
+"""
+
+RECOMMEND_BATCH_QUERY = """
+UNWIND $rows AS row
+MATCH (c:BirthChart {uid: row.chart_uid})
+WITH c, row.raag_sources AS raag_sources
+""" + RECOMMEND_SUBQUERY + """
+RETURN count(c)
+"""
+
+CHARTS_WITHOUT_RECOMMENDATIONS_QUERY = """
+MATCH (c:BirthChart)
+WHERE c.uid > $after AND NOT EXISTS { MATCH (c)-[:RECOMMENDED]->(:Raag) }
+OPTIONAL MATCH (c)-[:HAS_DETAIL]->(d:BirthChartDetail)
+RETURN c.uid AS chart_uid, c.lagna AS lagna, c.sun_sign AS sun_sign,
+       c.moon_sign AS moon_sign, d.planets_data AS planets_data
+ORDER BY c.uid
+LIMIT $limit
+"""
+
+RECOMMENDED_FOR_USER_QUERY = """
+MATCH (:User {uid: $user_uid})-[:HAS_BIRTH_CHART]->(:BirthChart)-[rec:RECOMMENDED]->(r:Raag)
+RETURN r, rec.score AS score
+ORDER BY score DESC, r.name
+LIMIT $limit
+"""
+
+
+class RaagRecommendationService:
+    """
+    Service for graph-driven raag recommendations
+
+    A chart's raags are scored from the graph: the raag each of its lagna,
+    moon and sun signs suggests (ZodiacSign-[:SUGGESTED_RAAG]->Raag) and the
+    raags associated with its planets (Planet-[:ASSOCIATED_WITH_RAAG]->Raag),
+    with planets in a kendra (houses 1, 4, 7, 10) counting double. Scores are
+    written as (:BirthChart)-[:RECOMMENDED {score}]->(:Raag) in the same
+    statement that writes the chart, so reading them is one traversal.
+    """
+
+    LAGNA_WEIGHT = 3.0
+    MOON_WEIGHT = 2.0
+    SUN_WEIGHT = 1.5
+    KENDRA_PLANET_WEIGHT = 1.0
+    PLANET_WEIGHT = 0.5
+    KENDRA_HOUSES = (1, 4, 7, 10)
+
+    @classmethod
+    def sources(
+        cls,
+        lagna: Optional[str],
+        moon_sign: Optional[str],
+        sun_sign: Optional[str],
+        planets: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Weighted signs and planets to score a chart's raags from
+
+        Args:
+            lagna: Ascendant sign
+            moon_sign: Moon sign
+            sun_sign: Sun sign
+            planets: Planet dictionaries with 'name' and 'house'
+
+        Returns:
+            Source dictionaries with 'sign' or 'planet' and 'weight'
+        """
+        sources = [
+            {'sign': sign, 'planet': None, 'weight': weight}
+            for sign, weight in ((lagna, cls.LAGNA_WEIGHT), (moon_sign, cls.MOON_WEIGHT), (sun_sign, cls.SUN_WEIGHT))
+            if sign
+        ]
+        for planet in planets:
+            if planet.get('name') in PLANET_RAAGS:
+                weight = cls.KENDRA_PLANET_WEIGHT if planet.get('house') in cls.KENDRA_HOUSES else cls.PLANET_WEIGHT
+                sources.append({'sign': None, 'planet': planet['name'], 'weight': weight})
+        return sources
+
+    @classmethod
+    def sources_for_stored(
+        cls,
+        lagna: Optional[str],
+        moon_sign: Optional[str],
+        sun_sign: Optional[str],
+        planets_data: Any
+    ) -> List[Dict[str, Any]]:
+        """sources() for a chart as stored, with planets_data still JSON-encoded"""
+        if isinstance(planets_data, str):
+            planets_data = json.loads(planets_data)
+        return cls.sources(lagna, moon_sign, sun_sign, (planets_data or {}).get('planets', []))
+
+    @classmethod
+    def backfill(cls, batch_size: int = 1000) -> int:
+        """Materialize recommendations for charts that have none; returns charts scored"""
+        scored = 0
+        after = ''
+        while True:
+            results, columns = db.cypher_query(
+                CHARTS_WITHOUT_RECOMMENDATIONS_QUERY, {'after': after, 'limit': batch_size}
+            )
+            if not results:
+                return scored
+            rows = []
+            for row in results:
+                chart = dict(zip(columns, row))
+                rows.append({
+                    'chart_uid': chart['chart_uid'],
+                    'raag_sources': cls.sources_for_stored(
+                        chart['lagna'], chart['moon_sign'], chart['sun_sign'], chart['planets_data']
+                    ),
+                })
+            db.cypher_query(RECOMMEND_BATCH_QUERY, {'rows': rows})
+            scored += len(rows)
+            after = results[-1][0]
+
+    @staticmethod
+    def get_for_user(user_uid: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Recommended raags of a user's chart, highest score first
+
+        Returns:
+            Raag dictionaries with an added 'score'
+        """
+        results, _ = db.cypher_query(RECOMMENDED_FOR_USER_QUERY, {'user_uid': user_uid, 'limit': limit})
+        return [{**Raag.inflate(node).to_dict(), 'score': score} for node, score in results]
@@ -0,0 +1,232 @@
+"""
+Neo4j schema bootstrap: constraints, indexes and reference data
+"""
+import threading
+from typing import Any, Dict, List, Tuple, Type
+from neomodel import StructuredNode, db
+from app.core.config import settings
+from app.db.neo4j_base import deflate_properties
+from app.db.reference_data import NAKSHATRAS, PLANET_RAAGS, PLANETS, RAAGS, ZODIAC_SIGNS
+from app.models.astrology_neo4j import DailyInfluence, Nakshatra, Planet, ZodiacSign
+from app.models.birth_chart_neo4j import BirthChart, BirthChartDetail
+from app.models.music_neo4j import Playlist, Raag, Track
+from app.models.user_neo4j import User
+from app.services.astrology_service import AstrologyService
+from app.services.raag_recommendation_service import RaagRecommendationService
+
+MODELS: List[Type[StructuredNode]] = [
+    User, BirthChart, BirthChartDetail, Planet, ZodiacSign, Nakshatra, DailyInfluence, Raag, Track, Playlist,
+]
+
+# One statement per label; new nodes get a uid in UniqueIdProperty's format
+SEED_QUERY = """
+UNWIND $rows AS row
+MERGE (n:{label} {{{key}: row.{key}}})
+  ON CREATE SET n.uid = replace(randomUUID(), '-', '')
+SET n += row
+"""
+
+SEED_SUGGESTED_RAAGS_QUERY = """
+UNWIND $pairs AS pair
+MATCH (z:ZodiacSign {name_english: pair.sign})
+MATCH (r:Raag {name: pair.raag})
+OPTIONAL MATCH (z)-[old:SUGGESTED_RAAG]->(other:Raag)
+WHERE other <> r
+DELETE old
+MERGE (z)-[:SUGGESTED_RAAG]->(r)
+"""
+
+SEED_PLANET_RAAGS_QUERY = """
+UNWIND $planets AS planet
+MATCH (p:Planet {name: planet.name})
+OPTIONAL MATCH (p)-[old:ASSOCIATED_WITH_RAAG]->(other:Raag)
+WHERE NOT other.name IN planet.raags
+DELETE old
+WITH DISTINCT p, planet
+UNWIND planet.raags AS raag_name
+MATCH (r:Raag {name: raag_name})
+MERGE (p)-[:ASSOCIATED_WITH_RAAG]->(r)
+"""
+
+# Charts written before the detail node existed carry their payloads inline
+MIGRATE_CHART_DETAILS_QUERY = """
+MATCH (c:BirthChart)
+WHERE c.planets_data IS NOT NULL OR c.houses_data IS NOT NULL OR c.chart_data IS NOT NULL
+WITH c LIMIT $batch_size
+MERGE (d:BirthChartDetail {chart_uid: c.uid})
+MERGE (c)-[:HAS_DETAIL]->(d)
+SET d.planets_data = c.planets_data, d.houses_data = c.houses_data, d.chart_data = c.chart_data
+REMOVE c.planets_data, c.houses_data, c.chart_data
+RETURN count(c)
+"""
+
+MIGRATION_BATCH_SIZE = 1000
+
+
+class SchemaService:
+    """
+    Service that installs and verifies the graph schema
+
+    Every unique_index property on the models gets a uniqueness constraint
+    (which Neo4j backs with an index) and every index property a range
+    index, using neomodel's naming. Reference data is then upserted with
+    one UNWIND statement per label. Everything is idempotent, so it runs on
+    every startup and from ``python -m app.tools.schema``.
+    """
+
+    _lock = threading.Lock()
+    _verified = False
+    _missing: List[str] = []
+
+    @staticmethod
+    def required_schema() -> List[Tuple[str, str, bool]]:
+        """(label, property, unique) for every indexed model property"""
+        required = []
+        for model in MODELS:
+            for name, prop in model.defined_properties(aliases=False, rels=False).items():
+                if prop.unique_index or prop.index:
+                    required.append((model.__label__, prop.db_property or name, bool(prop.unique_index)))
+        return required
+
+    @classmethod
+    def install_schema(cls) -> int:
+        """Create missing constraints and indexes; returns statements run"""
+        statements = 0
+        for label, prop, unique in cls.required_schema():
+            if unique:
+                db.cypher_query(
+                    f"CREATE CONSTRAINT constraint_unique_{label}_{prop} IF NOT EXISTS "
+                    f"FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE"
+                )
+            else:
+                db.cypher_query(f"CREATE INDEX index_{label}_{prop} IF NOT EXISTS FOR (n:{label}) ON (n.{prop})")
+            statements += 1
+        return statements
+
+    @staticmethod
+    def seed_reference_data() -> Dict[str, int]:
+        """Upsert zodiac signs, planets, raags, nakshatras and their raag links"""
+        seeds = [
+            (ZodiacSign, 'name_english', ZODIAC_SIGNS),
+            (Planet, 'name', PLANETS),
+            (Raag, 'name', RAAGS),
+            (Nakshatra, 'name', NAKSHATRAS),
+        ]
+        counts = {}
+        for model, key, rows in seeds:
+            db.cypher_query(
+                SEED_QUERY.format(label=model.__label__, key=key),
+                {'rows': [deflate_properties(model, None, row) for row in rows]},
+            )
+            counts[model.__label__] = len(rows)
+
+        pairs = [{'sign': sign, 'raag': raag} for sign, raag in AstrologyService.ZODIAC_RAAGAS.items()]
+        db.cypher_query(SEED_SUGGESTED_RAAGS_QUERY, {'pairs': pairs})
+        counts['SUGGESTED_RAAG'] = len(pairs)
+
+        planets = [{'name': name, 'raags': raags} for name, raags in PLANET_RAAGS.items()]
+        db.cypher_query(SEED_PLANET_RAAGS_QUERY, {'planets': planets})
+        counts['ASSOCIATED_WITH_RAAG'] = sum(len(raags) for raags in PLANET_RAAGS.values())
+        return counts
+
+    @staticmethod
+    def migrate_chart_details() -> int:
+        """Move inline chart payloads onto BirthChartDetail nodes; returns charts moved"""
+        moved = 0
+        while True:
+            results, _ = db.cypher_query(MIGRATE_CHART_DETAILS_QUERY, {'batch_size': MIGRATION_BATCH_SIZE})
+            count = results[0][0] if results else 0
+            moved += count
+            if count < MIGRATION_BATCH_SIZE:
+                return moved
+
+    @classmethod
+    def missing_indexes(cls) -> List[str]:
+        """Required (label, property) indexes that are absent or not yet online"""
+        results, _ = db.cypher_query(
+            "SHOW INDEXES YIELD labelsOrTypes, properties, state WHERE state = 'ONLINE' "
+            "RETURN labelsOrTypes, properties"
+        )
+        online = {
+            (labels[0], properties[0])
+            for labels, properties in results
+            if labels and properties and len(properties) == 1
+        }
+        return [
+            f"{label}.{prop}"
+            for label, prop, _ in cls.required_schema()
+            if (label, prop) not in online
+        ]
+
+    @classmethod
+    def bootstrap(cls) -> Dict[str, Any]:
+        """
+        Install the schema, seed reference data, migrate old charts and
+        verify the indexes
+
+        Charts without raag recommendations (written before they existed)
+        are scored once the reference links are in place.
+
+        Returns:
+            Report with 'statements', 'seeded', 'migrated_charts',
+            'recommended_charts' and 'missing_indexes'
+        """
+        with cls._lock:
+            statements = cls.install_schema()
+            db.cypher_query("CALL db.awaitIndexes(300)")
+            seeded = cls.seed_reference_data()
+            migrated = cls.migrate_chart_details()
+            recommended = RaagRecommendationService.backfill()
+            cls._missing = cls.missing_indexes()
+            cls._verified = not cls._missing
+            print(f"🗂️  Schema bootstrap: {statements} constraints/indexes ensured, seeded {seeded}, "
+                  f"moved {migrated} chart payloads to detail nodes, scored raags for {recommended} charts")
+            if cls._missing:
+                print(f"Warning: missing indexes: {', '.join(cls._missing)}")
+            return {
+                'statements': statements,
+                'seeded': seeded,
+                'migrated_charts': migrated,
+                'recommended_charts': recommended,
+                'missing_indexes': cls._missing,
+            }
+
+    @classmethod
+    def ensure(cls) -> bool:
+        """
+        Bootstrap (with SCHEMA_BOOTSTRAP_ON_STARTUP) and report whether every
+        required index is online
+
+        Run once by the startup warm-up; otherwise the same as verify().
+        """
+        if cls._verified:
+            return True
+        if not settings.SCHEMA_BOOTSTRAP_ON_STARTUP:
+            return cls.verify()
+        try:
+            cls.bootstrap()
+        except Exception as e:
+            cls._missing = [f"schema check failed: {e}"]
+        return cls._verified
+
+    @classmethod
+    def verify(cls) -> bool:
+        """
+        Whether every required index is online, without writing anything
+
+        One SHOW INDEXES read, so readiness probes can call it freely; once
+        verified the result is latched and probes cost nothing.
+        """
+        if cls._verified:
+            return True
+        try:
+            cls._missing = cls.missing_indexes()
+            cls._verified = not cls._missing
+        except Exception as e:
+            cls._missing = [f"schema check failed: {e}"]
+        return cls._verified
+
+    @classmethod
+    def status(cls) -> Dict[str, Any]:
+        """Last verification result"""
+        return {'verified': cls._verified, 'missing_indexes': list(cls._missing)}
@@ -0,0 +1,251 @@
+"""
+Chart similarity: planet-longitude feature vectors and a nearest-neighbour index
+"""
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+import numpy as np
+from neomodel import db
+from app.core.config import settings
+from app.services.astrology_service import AstrologyService
+from app.utils.vector_index import VectorIndex
+
+# Outer planets are left out: they barely move within a generation
+FEATURE_OBJECTS = ("Asc", "Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Rahu")
+
+CHART_PLANETS_PAGE_QUERY = """
+MATCH (c:BirthChart)-[:HAS_DETAIL]->(d:BirthChartDetail)
+WHERE c.uid > $after
+RETURN c.uid AS uid, d.planets_data AS planets_data, c.updated_at AS updated_at
+ORDER BY c.uid
+LIMIT $limit
+"""
+
+# Charts written after a (updated_at, uid) position, oldest first, for the
+# periodic refresh; paging on the pair keeps charts sharing a stamp together
+CHART_CHANGES_QUERY = """
+MATCH (c:BirthChart)-[:HAS_DETAIL]->(d:BirthChartDetail)
+WHERE c.updated_at > $since OR (c.updated_at = $since AND c.uid > $after)
+RETURN c.uid AS uid, d.planets_data AS planets_data, c.updated_at AS updated_at
+ORDER BY c.updated_at, c.uid
+LIMIT $limit
+"""
+
+# Each refresh re-reads charts this far behind the newest one it has seen,
+# so an upsert stamped before another worker's but committed after it is
+# not skipped
+REFRESH_OVERLAP_SECONDS = 60.0
+
+SIMILAR_PROFILES_QUERY = """
+UNWIND $chart_uids AS chart_uid
+MATCH (u:User)-[:HAS_BIRTH_CHART]->(c:BirthChart {uid: chart_uid})
+WHERE coalesce(u.is_active, true)
+RETURN c.uid AS chart_uid, u.uid AS user_id, u.name AS name,
+       c.lagna AS lagna, c.sun_sign AS sun_sign, c.moon_sign AS moon_sign
+"""
+
+
+class ChartSimilarityService:
+    """
+    Service for finding charts similar to a user's chart
+
+    Each chart becomes a vector of (cos, sin) of its ascendant and planet
+    longitudes, scaled so the inner product of two charts is the mean
+    cosine of their angular differences: 1 for identical positions, and
+    359° counts as next to 0°. Vectors are kept in a per-process
+    VectorIndex loaded from the graph at startup and updated when charts
+    are created, updated or deleted through this process's services.
+
+    Charts written by other workers or by bulk imports are pulled in by
+    their updated_at stamp, checked at most every
+    SIMILARITY_REFRESH_SECONDS on query, so a worker's index lags the graph
+    by up to that long (with 0, until the next load). Deleted charts are
+    never returned, since profiles are read from the graph, but they stay in
+    other workers' indexes until the next load.
+    """
+
+    DIM = 2 * len(FEATURE_OBJECTS)
+
+    _index = VectorIndex(
+        dim=DIM,
+        lists=settings.SIMILARITY_INDEX_LISTS,
+        probes=settings.SIMILARITY_INDEX_PROBES,
+    )
+    _load_lock = threading.Lock()
+    _loaded = False
+    _load_seconds: Optional[float] = None
+    _refresh_lock = threading.Lock()
+    _synced_to = 0.0  # Newest updated_at seen in the graph
+    _checked_at = 0.0  # time.monotonic() of the last refresh
+    _refreshed = 0
+
+    @staticmethod
+    def feature_vector(planets: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """
+        Feature vector from a chart's planets list
+
+        Args:
+            planets: Planet dictionaries with 'name', 'sign' and 'degree'
+
+        Returns:
+            float32 vector of length DIM, or None if no feature object is present
+        """
+        longitudes = {}
+        for planet in planets:
+            sign = planet.get('sign')
+            if sign in AstrologyService.ZODIAC_SIGNS and planet.get('degree') is not None:
+                longitudes[str(planet.get('name', '')).lower()] = (
+                    AstrologyService.ZODIAC_SIGNS.index(sign) * 30.0 + float(planet['degree'])
+                )
+
+        vector = np.zeros(ChartSimilarityService.DIM, dtype=np.float32)
+        found = False
+        for i, name in enumerate(FEATURE_OBJECTS):
+            longitude = longitudes.get(name.lower())
+            if longitude is not None:
+                radians = np.deg2rad(longitude)
+                vector[2 * i] = np.cos(radians)
+                vector[2 * i + 1] = np.sin(radians)
+                found = True
+        return vector / np.sqrt(len(FEATURE_OBJECTS)) if found else None
+
+    @staticmethod
+    def _planets(planets_data: Any) -> List[Dict[str, Any]]:
+        """Planets list from a stored or loaded planets_data value"""
+        if isinstance(planets_data, str):
+            planets_data = json.loads(planets_data)
+        return (planets_data or {}).get('planets', [])
+
+    @classmethod
+    def load(cls, page_size: int = 5000) -> int:
+        """Rebuild the index from every stored chart; returns charts indexed"""
+        started = time.perf_counter()
+        keys: List[str] = []
+        vectors: List[np.ndarray] = []
+        synced_to = 0.0
+        after = ''
+        while True:
+            results, _ = db.cypher_query(CHART_PLANETS_PAGE_QUERY, {'after': after, 'limit': page_size})
+            if not results:
+                break
+            for chart_uid, planets_data, updated_at in results:
+                vector = cls.feature_vector(cls._planets(planets_data))
+                if vector is not None:
+                    keys.append(chart_uid)
+                    vectors.append(vector)
+                synced_to = max(synced_to, updated_at or 0.0)
+            after = results[-1][0]
+
+        cls._index.build(keys, np.array(vectors, dtype=np.float32).reshape(len(keys), cls.DIM))
+        cls._synced_to = synced_to
+        cls._checked_at = time.monotonic()
+        cls._loaded = True
+        cls._load_seconds = round(time.perf_counter() - started, 2)
+        print(f"🧭 Similarity index loaded: {len(keys)} charts in {cls._load_seconds}s")
+        return len(keys)
+
+    @classmethod
+    def ensure_loaded(cls) -> None:
+        """Load the index once per process"""
+        if cls._loaded:
+            return
+        with cls._load_lock:
+            if not cls._loaded:
+                cls.load()
+
+    @classmethod
+    def refresh(cls, page_size: int = 5000) -> int:
+        """
+        Index charts written since the last load or refresh
+
+        Does nothing until SIMILARITY_REFRESH_SECONDS have passed since the
+        last check, or while another thread is refreshing.
+
+        Returns:
+            Charts re-indexed
+        """
+        interval = settings.SIMILARITY_REFRESH_SECONDS
+        if interval <= 0 or time.monotonic() - cls._checked_at < interval:
+            return 0
+        if not cls._refresh_lock.acquire(blocking=False):
+            return 0
+        try:
+            refreshed = 0
+            since, after = cls._synced_to - REFRESH_OVERLAP_SECONDS, ''
+            while True:
+                results, _ = db.cypher_query(
+                    CHART_CHANGES_QUERY, {'since': since, 'after': after, 'limit': page_size}
+                )
+                for chart_uid, planets_data, updated_at in results:
+                    cls.index_chart(chart_uid, planets_data)
+                    cls._synced_to = max(cls._synced_to, updated_at)
+                refreshed += len(results)
+                if len(results) < page_size:
+                    break
+                after, since = results[-1][0], results[-1][2]
+            cls._checked_at = time.monotonic()
+            cls._refreshed += refreshed
+            return refreshed
+        finally:
+            cls._refresh_lock.release()
+
+    @classmethod
+    def index_chart(cls, chart_uid: str, planets_data: Any) -> None:
+        """Add or refresh a chart after it is created or updated"""
+        vector = cls.feature_vector(cls._planets(planets_data))
+        if vector is None:
+            cls._index.remove(chart_uid)
+        else:
+            cls._index.add(chart_uid, vector)
+
+    @classmethod
+    def remove(cls, chart_uid: str) -> None:
+        """Drop a deleted chart"""
+        cls._index.remove(chart_uid)
+
+    @classmethod
+    def similar(cls, chart, k: int) -> List[Dict[str, Any]]:
+        """
+        Charts of other active users most similar to a chart
+
+        Args:
+            chart: BirthChart with its detail loaded
+            k: Number of results
+
+        Returns:
+            Profiles with 'user_id', 'name', signs and 'similarity' (-1 to 1),
+            most similar first
+        """
+        cls.ensure_loaded()
+        cls.refresh()
+        vector = cls._index.get(chart.uid)
+        if vector is None:
+            vector = cls.feature_vector(cls._planets(chart.planets_data))
+        if vector is None:
+            return []
+
+        # Over-fetch a little: deleted or inactive users are dropped below
+        neighbours = cls._index.search(vector, k + 5, exclude=chart.uid)
+        if not neighbours:
+            return []
+        results, columns = db.cypher_query(
+            SIMILAR_PROFILES_QUERY, {'chart_uids': [chart_uid for chart_uid, _ in neighbours]}
+        )
+        profiles = {row[0]: dict(zip(columns[1:], row[1:])) for row in results}
+        return [
+            {**profiles[chart_uid], 'similarity': round(score, 4)}
+            for chart_uid, score in neighbours
+            if chart_uid in profiles
+        ][:k]
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Index size, load time and refresh state"""
+        return {
+            **cls._index.stats(),
+            'loaded': cls._loaded,
+            'load_seconds': cls._load_seconds,
+            'refreshed': cls._refreshed,
+            'synced_to': cls._synced_to,
+        }
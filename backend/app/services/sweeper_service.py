@@ -0,0 +1,149 @@
+"""
+Background sweeper that removes orphaned graph nodes
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from neomodel import db
+from app.core.config import settings
+
+# One bounded batch per statement; each returns how many orphans it removed
+ORPHAN_QUERIES: Dict[str, str] = {
+    'birth_charts': """
+        MATCH (c:BirthChart)
+        WHERE NOT EXISTS { MATCH (:User)-[:HAS_BIRTH_CHART]->(c) }
+        WITH c LIMIT $limit
+        OPTIONAL MATCH (c)-[:HAS_DETAIL]->(d:BirthChartDetail)
+        DETACH DELETE c, d
+        RETURN count(DISTINCT c)
+    """,
+    'chart_details': """
+        MATCH (d:BirthChartDetail)
+        WHERE NOT EXISTS { MATCH (:BirthChart)-[:HAS_DETAIL]->(d) }
+        WITH d LIMIT $limit
+        DETACH DELETE d
+        RETURN count(d)
+    """,
+    # Only personalized playlists belong to a user; editorial ones have no creator
+    'playlists': """
+        MATCH (p:Playlist {is_personalized: true})
+        WHERE NOT EXISTS { MATCH (:User)-[:CREATED_PLAYLIST]->(p) }
+        WITH p LIMIT $limit
+        DETACH DELETE p
+        RETURN count(p)
+    """,
+    # Catalog tracks hang off a raag or a playlist; an orphan has no link at all
+    'tracks': """
+        MATCH (t:Track)
+        WHERE NOT EXISTS { MATCH (:User)-[:HAS_TRACK]->(t) }
+          AND NOT EXISTS { MATCH (:Raag)-[:RAAG_OF_TRACK]->(t) }
+          AND NOT EXISTS { MATCH (:Playlist)-[:CONTAINS_TRACK]->(t) }
+        WITH t LIMIT $limit
+        DETACH DELETE t
+        RETURN count(t)
+    """,
+    'daily_influences': """
+        MATCH (d:DailyInfluence)
+        WHERE NOT EXISTS { MATCH (:User)-[:HAS_DAILY_INFLUENCE]->(d) }
+        WITH d LIMIT $limit
+        DETACH DELETE d
+        RETURN count(d)
+    """,
+}
+
+
+class SweeperService:
+    """
+    Service that periodically deletes nodes whose owner is gone
+
+    Cascading deletes keep aggregates whole, but nodes left behind by older
+    code, interrupted imports or manual edits are only found by looking.
+    Shared catalog nodes are never orphans: a track reachable from a raag or
+    a playlist stays, and only personalized playlists need an owner. A
+    sweep deletes orphans of each kind in batches of ORPHAN_SWEEP_BATCH_SIZE,
+    each in its own transaction, and stops a kind after
+    ORPHAN_SWEEP_MAX_BATCHES so one sweep never holds locks for long.
+    """
+
+    _task: Optional[asyncio.Task] = None
+    _runs = 0
+    _deleted: Dict[str, int] = {kind: 0 for kind in ORPHAN_QUERIES}
+    _last_run_at: Optional[str] = None
+    _last_duration_ms: Optional[float] = None
+    _last_error: Optional[str] = None
+
+    @staticmethod
+    def sweep_kind(kind: str, batch_size: int, max_batches: int) -> int:
+        """Delete orphans of one kind in bounded batches; returns nodes deleted"""
+        deleted = 0
+        for _ in range(max_batches):
+            results, _ = db.cypher_query(ORPHAN_QUERIES[kind], {'limit': batch_size})
+            count = results[0][0] if results else 0
+            deleted += count
+            if count < batch_size:
+                break
+        return deleted
+
+    @classmethod
+    def sweep(cls, batch_size: Optional[int] = None, max_batches: Optional[int] = None) -> Dict[str, int]:
+        """
+        Run one sweep over every orphan kind
+
+        Returns:
+            Nodes deleted per kind
+        """
+        batch_size = batch_size or settings.ORPHAN_SWEEP_BATCH_SIZE
+        max_batches = max_batches or settings.ORPHAN_SWEEP_MAX_BATCHES
+        started = time.perf_counter()
+        swept = {kind: cls.sweep_kind(kind, batch_size, max_batches) for kind in ORPHAN_QUERIES}
+        for kind, count in swept.items():
+            cls._deleted[kind] += count
+        cls._runs += 1
+        cls._last_run_at = datetime.now(timezone.utc).isoformat()
+        cls._last_duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        cls._last_error = None
+        if any(swept.values()):
+            print(f"🧹 Orphan sweep removed {swept}")
+        return swept
+
+    @classmethod
+    def start(cls) -> None:
+        """Sweep periodically in the background (called from the app lifespan)"""
+        if settings.ORPHAN_SWEEP_INTERVAL_SECONDS > 0 and cls._task is None:
+            cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Cancel the background sweeper"""
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+
+    @classmethod
+    async def _run(cls) -> None:
+        """Sweep every ORPHAN_SWEEP_INTERVAL_SECONDS, starting one interval after startup"""
+        while True:
+            await asyncio.sleep(settings.ORPHAN_SWEEP_INTERVAL_SECONDS)
+            try:
+                await asyncio.to_thread(cls.sweep)
+            except Exception as e:
+                cls._last_error = str(e) or e.__class__.__name__
+                print(f"Warning: orphan sweep failed: {cls._last_error}")
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Sweeper runs and nodes deleted per kind since startup"""
+        return {
+            'enabled': settings.ORPHAN_SWEEP_INTERVAL_SECONDS > 0,
+            'interval_seconds': settings.ORPHAN_SWEEP_INTERVAL_SECONDS,
+            'runs': cls._runs,
+            'deleted': dict(cls._deleted),
+            'last_run_at': cls._last_run_at,
+            'last_duration_ms': cls._last_duration_ms,
+            'last_error': cls._last_error,
+        }
@@ -0,0 +1,126 @@
+"""
+Transit timeline: sign ingresses, nakshatra changes and retrograde stations
+"""
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, Tuple
+import numpy as np
+from app.services.astrology_service import AstrologyService
+from app.services.ephemeris_service import GRAHAS, EphemerisService, compute_positions, datetime_to_jd, UNIX_EPOCH_JD
+
+PositionSource = Callable[[float], Tuple[np.ndarray, np.ndarray]]
+
+# Coarse sampling interval: short enough that the Moon (the fastest graha,
+# under 16°/day) crosses at most one nakshatra boundary per step
+COARSE_STEP_DAYS = 0.25
+MINUTE_DAYS = 1.0 / 1440
+
+
+def jd_to_datetime(jd: float) -> datetime:
+    """Convert a UT Julian day to an aware UTC datetime"""
+    return datetime.fromtimestamp((jd - UNIX_EPOCH_JD) * 86400.0, tz=timezone.utc)
+
+
+class TimelineService:
+    """
+    Service for transit events over a date range
+
+    The range is sampled every COARSE_STEP_DAYS. Whenever a graha's sign,
+    nakshatra or direction of motion differs between two samples, the
+    instant of change is found by bisection to one-minute precision. Events
+    are yielded in time order as they are found, so a long range is never
+    held in memory.
+    """
+
+    @staticmethod
+    def _position_source(start_jd: float, end_jd: float) -> PositionSource:
+        """Use the precomputed ephemeris if it covers the range, else Swiss Ephemeris"""
+        if EphemerisService.covers(start_jd, end_jd):
+            return EphemerisService.interpolate
+        return compute_positions
+
+    @staticmethod
+    def _features(longitude: np.ndarray, speed: np.ndarray) -> np.ndarray:
+        """Sign index, nakshatra index and retrograde flag for every graha"""
+        return np.stack([
+            np.minimum(longitude // 30.0, 11),
+            np.minimum(longitude // AstrologyService.NAKSHATRA_SPAN, 26),
+            speed < 0,
+        ]).astype(np.int16)
+
+    @classmethod
+    def iter_events(cls, start: datetime, end: datetime) -> Iterator[Dict[str, Any]]:
+        """
+        Yield transit events between start and end in time order
+
+        Args:
+            start: Range start (naive datetimes are taken as UTC)
+            end: Range end
+
+        Yields:
+            Event dictionaries with time, planet, event, from, to, longitude
+        """
+        start_jd = datetime_to_jd(start)
+        end_jd = datetime_to_jd(end)
+        source = cls._position_source(start_jd, end_jd)
+
+        steps = max(1, math.ceil((end_jd - start_jd) / COARSE_STEP_DAYS))
+        lo_jd = start_jd
+        lo_features = cls._features(*source(lo_jd))
+
+        for step in range(1, steps + 1):
+            hi_jd = min(end_jd, start_jd + step * COARSE_STEP_DAYS)
+            hi_features = cls._features(*source(hi_jd))
+
+            changed = np.argwhere(lo_features != hi_features)
+            if len(changed):
+                events = [
+                    cls._locate(source, lo_jd, hi_jd, int(kind), int(body), int(lo_features[kind, body]))
+                    for kind, body in changed
+                ]
+                events.sort(key=lambda event: (event['time'], event['planet']))
+                yield from events
+
+            lo_jd, lo_features = hi_jd, hi_features
+
+    @classmethod
+    def _locate(
+        cls,
+        source: PositionSource,
+        lo_jd: float,
+        hi_jd: float,
+        kind: int,
+        body: int,
+        before: int
+    ) -> Dict[str, Any]:
+        """Bisect one feature change of one graha down to a minute"""
+        while hi_jd - lo_jd > MINUTE_DAYS:
+            mid_jd = (lo_jd + hi_jd) / 2
+            if cls._features(*source(mid_jd))[kind, body] == before:
+                lo_jd = mid_jd
+            else:
+                hi_jd = mid_jd
+
+        longitude, speed = source(hi_jd)
+        after = int(cls._features(longitude, speed)[kind, body])
+        when = jd_to_datetime(hi_jd)
+        when = (when + timedelta(seconds=30)).replace(second=0, microsecond=0)
+
+        if kind == 0:
+            event, names = "sign_ingress", AstrologyService.ZODIAC_SIGNS
+        elif kind == 1:
+            event, names = "nakshatra_change", AstrologyService.NAKSHATRAS
+        else:
+            event = "station_retrograde" if after else "station_direct"
+            names = ["direct", "retrograde"]
+
+        return {
+            'time': when.isoformat(),
+            'planet': GRAHAS[body],
+            'event': event,
+            'from': names[before],
+            'to': names[after],
+            'longitude': round(float(longitude[body]), 4),
+            'retrograde': bool(speed[body] < 0),
+        }
+
@@ -0,0 +1,106 @@
+"""
+Access token validation cache and revocation table
+"""
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from app.core.config import settings
+from app.core.security import create_access_token, create_refresh_token, decode_token
+from app.models.user_neo4j import User
+from app.schemas.auth import Token
+from app.utils.cache import TTLCache
+
+# Minimum version for a deleted user: no token is ever new enough
+REVOKED = sys.maxsize
+
+
+class TokenService:
+    """
+    Service for issuing and validating tokens
+
+    Access tokens carry the user's is_active flag and token_version as the
+    'active' and 'ver' claims. Validated payloads are cached by token until
+    their 'exp', so a repeated bearer token costs a dictionary lookup instead
+    of an HMAC check and a JSON decode.
+
+    Deactivation, password changes and deletion bump token_version (or
+    delete the user) and record the new minimum version here, which rejects
+    older tokens without a database read. Entries are kept for one access
+    token lifetime, after which every older token has expired anyway. The
+    table is per process: other worker processes learn of the change only
+    through endpoints that load the user, until the old tokens expire.
+    """
+
+    _cache = TTLCache(
+        maxsize=settings.TOKEN_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    )
+    _revoked: Dict[str, Tuple[int, float]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def claims(user: User) -> Dict[str, Any]:
+        """Token claims identifying user"""
+        return {"sub": user.uid, "active": user.is_active, "ver": user.token_version or 0}
+
+    @classmethod
+    def issue(cls, user: User) -> Token:
+        """Access and refresh tokens for user"""
+        claims = cls.claims(user)
+        return Token(
+            access_token=create_access_token(data=claims),
+            refresh_token=create_refresh_token(data={"sub": claims["sub"], "ver": claims["ver"]}),
+            token_type="bearer"
+        )
+
+    @classmethod
+    def decode_access(cls, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Validated payload of an access token, from the cache when possible
+
+        Returns:
+            Payload, or None if the token is invalid, expired or not an access token
+        """
+        payload = cls._cache.get(token)
+        if payload is not None:
+            if payload["exp"] > time.time():
+                return payload
+            cls._cache.pop(token)
+            return None
+
+        payload = decode_token(token)
+        if payload is None or payload.get("type") != "access" or not payload.get("sub"):
+            return None
+        remaining = payload.get("exp", 0) - time.time()
+        if remaining > 0:
+            cls._cache.set(token, payload, ttl_seconds=remaining)
+        return payload
+
+    @classmethod
+    def revoke(cls, user_uid: str, min_version: int = REVOKED) -> None:
+        """Reject this user's tokens older than min_version (all of them by default)"""
+        now = time.monotonic()
+        with cls._lock:
+            cls._revoked[user_uid] = (min_version, now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+            if len(cls._revoked) > 1024:
+                cls._revoked = {uid: entry for uid, entry in cls._revoked.items() if entry[1] > now}
+
+    @classmethod
+    def is_revoked(cls, user_uid: str, version: int) -> bool:
+        """Whether a token of this version for this user has been revoked"""
+        entry = cls._revoked.get(user_uid)
+        if entry is None:
+            return False
+        min_version, expires_at = entry
+        if expires_at <= time.monotonic():
+            with cls._lock:
+                if cls._revoked.get(user_uid) == entry:
+                    del cls._revoked[user_uid]
+            return False
+        return version < min_version
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Token cache counters and revocation table size"""
+        return {**cls._cache.stats(), 'revocations': len(cls._revoked)}
@@ -0,0 +1,174 @@
+"""
+Shared, time-bucketed snapshot of current planetary transits
+"""
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+from app.core.config import settings
+from app.services.astrology_service import AstrologyService
+from app.services.ephemeris_service import EphemerisService
+
+# Reference location for the full-chart fallback (Delhi)
+FALLBACK_LATITUDE = 28.7041
+FALLBACK_LONGITUDE = 77.1025
+FALLBACK_TIMEZONE = "Asia/Kolkata"
+
+
+class TransitService:
+    """
+    Service for current planetary transits
+
+    Transits are computed once per TRANSIT_SNAPSHOT_BUCKET_SECONDS bucket,
+    for the bucket's start time, and every request in that bucket is served
+    from the same snapshot. Concurrent requests at a bucket boundary wait
+    for a single computation, and the next bucket's snapshot is computed in
+    the background TRANSIT_SNAPSHOT_REFRESH_AHEAD_SECONDS before it is due.
+    """
+
+    _current: Optional[Dict[str, Any]] = None
+    _next: Optional[Dict[str, Any]] = None
+    _lock = threading.Lock()
+    _refreshing = False
+
+    hits = 0
+    computations = 0
+    prefetches = 0
+
+    @classmethod
+    def get_snapshot(cls, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Get the transit snapshot for the current time bucket
+
+        Returns:
+            Dictionary with 'snapshot_at', 'expires_at' and 'transits'
+        """
+        now = now or datetime.now(timezone.utc)
+        bucket_start = cls._bucket_start(now)
+
+        snapshot = cls._current
+        if snapshot is None or snapshot['snapshot_at'] != bucket_start:
+            return cls._advance(bucket_start)
+
+        cls.hits += 1
+        refresh_at = snapshot['expires_at'] - timedelta(seconds=settings.TRANSIT_SNAPSHOT_REFRESH_AHEAD_SECONDS)
+        if now >= refresh_at:
+            cls._refresh_ahead(snapshot['expires_at'])
+        return snapshot
+
+    @classmethod
+    def compute_transits(cls, when: datetime) -> List[Dict[str, Any]]:
+        """
+        Compute planetary transits for a moment
+
+        Uses the precomputed ephemeris when available, otherwise calculates
+        a full chart at the fallback reference location.
+
+        Args:
+            when: Timezone-aware moment
+
+        Returns:
+            List of transit dictionaries
+        """
+        positions = EphemerisService.positions(when)
+        if positions is not None:
+            signs = {
+                name: AstrologyService.ZODIAC_SIGNS[int(position['longitude'] // 30) % 12]
+                for name, position in positions.items()
+            }
+        else:
+            local = when.astimezone(ZoneInfo(FALLBACK_TIMEZONE))
+            chart_data = AstrologyService.calculate_birth_chart(
+                birth_date=local,
+                birth_time=local.strftime("%H:%M"),
+                latitude=FALLBACK_LATITUDE,
+                longitude=FALLBACK_LONGITUDE,
+                timezone=FALLBACK_TIMEZONE
+            )
+            signs = {
+                planet['name']: planet['sign'] or "Unknown"
+                for planet in chart_data['planets']
+                if planet['name'].lower() not in ['asc', 'mc']  # Exclude angles
+            }
+
+        return [
+            {
+                'planet': name,
+                'current_sign': sign,
+                'description': f"{name} in {sign}",
+                'influence': "Neutral",  # Can be enhanced with aspects
+                'intensity': 0.5,
+            }
+            for name, sign in signs.items()
+        ]
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Return snapshot counters"""
+        current = cls._current
+        return {
+            'bucket_seconds': settings.TRANSIT_SNAPSHOT_BUCKET_SECONDS,
+            'snapshot_at': current['snapshot_at'].isoformat() if current else None,
+            'hits': cls.hits,
+            'computations': cls.computations,
+            'prefetches': cls.prefetches,
+        }
+
+    @staticmethod
+    def _bucket_start(now: datetime) -> datetime:
+        """Start of the time bucket containing now"""
+        bucket = settings.TRANSIT_SNAPSHOT_BUCKET_SECONDS
+        epoch = int(now.timestamp())
+        return datetime.fromtimestamp(epoch - epoch % bucket, tz=timezone.utc)
+
+    @classmethod
+    def _build(cls, bucket_start: datetime) -> Dict[str, Any]:
+        """Compute the snapshot for a bucket"""
+        transits = cls.compute_transits(bucket_start)
+        cls.computations += 1
+        return {
+            'snapshot_at': bucket_start,
+            'expires_at': bucket_start + timedelta(seconds=settings.TRANSIT_SNAPSHOT_BUCKET_SECONDS),
+            'transits': transits,
+        }
+
+    @classmethod
+    def _advance(cls, bucket_start: datetime) -> Dict[str, Any]:
+        """Install the snapshot for a new bucket, computing it at most once"""
+        with cls._lock:
+            snapshot = cls._current
+            if snapshot is not None and snapshot['snapshot_at'] == bucket_start:
+                return snapshot  # Another request computed it while we waited
+
+            prefetched = cls._next
+            if prefetched is not None and prefetched['snapshot_at'] == bucket_start:
+                snapshot = prefetched
+            else:
+                snapshot = cls._build(bucket_start)
+
+            cls._current = snapshot
+            cls._next = None
+            return snapshot
+
+    @classmethod
+    def _refresh_ahead(cls, next_start: datetime) -> None:
+        """Start computing the next bucket's snapshot in the background"""
+        with cls._lock:
+            if cls._refreshing or (cls._next is not None and cls._next['snapshot_at'] == next_start):
+                return
+            cls._refreshing = True
+
+        threading.Thread(target=cls._prefetch, args=(next_start,), daemon=True).start()
+
+    @classmethod
+    def _prefetch(cls, next_start: datetime) -> None:
+        """Background worker for _refresh_ahead"""
+        try:
+            snapshot = cls._build(next_start)
+            with cls._lock:
+                cls._next = snapshot
+                cls.prefetches += 1
+        except Exception as e:
+            print(f"Warning: transit snapshot prefetch failed: {e}")
+        finally:
+            cls._refreshing = False
@@ -1,23 +1,99 @@
 """
 User service for CRUD operations using Neo4j
 """
-from typing import Optional
+from typing import Any, Dict, List, Optional
+from neomodel import db
+from neomodel.exceptions import UniqueProperty
+from app.core.config import settings
 from app.models.user_neo4j import User
+from app.repositories.user_repository import DELETE_USER_QUERY, EmailAlreadyRegistered, UserRepository
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.services.similarity_service import ChartSimilarityService
+from app.core.security import get_password_hash, verify_and_update_password, verify_password
+from app.services.hash_executor import get_hash_executor
+from app.services.token_service import TokenService
+from app.utils.cache import TTLCache
+from app.utils.identity_map import IdentityMap
 
 
 class UserService:
-    """Service for user operations with Neo4j"""
+    """
+    Service for user operations with Neo4j
+
+    Lookups by uid go through the request's identity map and then a short-TTL
+    principal cache before reaching the database. Updates and deletes
+    invalidate both in this process; other worker processes may serve a
+    stale user for up to PRINCIPAL_CACHE_TTL_SECONDS.
+    """
+
+    _principal_cache = TTLCache(
+        maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS
+    )
+
+    @classmethod
+    def _cached(cls, user_id: str) -> Optional[User]:
+        """User from this request's identity map or the principal cache"""
+        user = IdentityMap.get('User', user_id)
+        if user is None:
+            user = cls._principal_cache.get(user_id)
+            IdentityMap.put('User', user_id, user)
+        return user
+
+    @classmethod
+    def _remember(cls, user: Optional[User]) -> Optional[User]:
+        """Record a freshly loaded user in both caches"""
+        if user is not None:
+            IdentityMap.put('User', user.uid, user)
+            cls._principal_cache.set(user.uid, user)
+        return user
+
+    @classmethod
+    def invalidate(cls, user_id: str) -> None:
+        """Drop a user from both caches after it changes"""
+        IdentityMap.discard('User', user_id)
+        cls._principal_cache.pop(user_id)
 
     @staticmethod
-    def get_by_id(user_id: str) -> Optional[User]:
+    def _revoking(user: User, values: Dict[str, Any]) -> Dict[str, Any]:
+        """values plus a token_version bump if they change the password or is_active"""
+        if 'hashed_password' in values or values.get('is_active', user.is_active) != user.is_active:
+            return {**values, 'token_version': (user.token_version or 0) + 1}
+        return values
+
+    @classmethod
+    def _forget_deleted(cls, user_id: str, chart_uids: List[str]) -> None:
+        """Drop a deleted user and their charts from caches and the similarity index"""
+        TokenService.revoke(user_id)
+        cls.invalidate(user_id)
+        IdentityMap.discard('BirthChart', user_id)
+        for chart_uid in chart_uids:
+            ChartSimilarityService.remove(chart_uid)
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, Any]:
+        """Return principal cache statistics"""
+        return cls._principal_cache.stats()
+
+    @classmethod
+    def get_by_id(cls, user_id: str) -> Optional[User]:
         """Get user by ID (uid)"""
+        user = cls._cached(user_id)
+        if user is not None:
+            return user
         try:
-            return User.nodes.get(uid=user_id)
+            return cls._remember(User.nodes.get(uid=user_id))
         except User.DoesNotExist:
             return None
 
+    @classmethod
+    async def get_by_id_async(cls, user_id: str) -> Optional[User]:
+        """Get user by ID (uid) without blocking the event loop"""
+        user = cls._cached(user_id)
+        if user is not None:
+            return user
+        return cls._remember(await UserRepository.get_by_uid(user_id))
+
     @staticmethod
     def get_by_email(email: str) -> Optional[User]:
         """Get user by email"""
@@ -26,32 +102,91 @@ class UserService:
         except User.DoesNotExist:
             return None
 
+    @staticmethod
+    async def get_by_email_async(email: str) -> Optional[User]:
+        """Get user by email without blocking the event loop"""
+        return await UserRepository.get_by_email(email)
+
     @staticmethod
     def create(user_data: UserCreate) -> User:
-        """Create a new user"""
+        """
+        Create a new user
+
+        Raises:
+            EmailAlreadyRegistered: If the email is taken
+        """
         user = User(
             email=user_data.email,
             name=user_data.name,
             hashed_password=get_password_hash(user_data.password)
         )
-        user.save()
+        try:
+            user.save()
+        except UniqueProperty as e:
+            raise EmailAlreadyRegistered(user.email) from e
         return user
 
     @staticmethod
-    def update(user: User, user_data: UserUpdate) -> User:
+    async def create_async(user_data: UserCreate) -> User:
+        """
+        Create a new user in a single write, hashing the password on the hashing executor
+
+        Raises:
+            EmailAlreadyRegistered: If the email is taken
+            HashExecutorSaturated: If the hashing queue is full
+        """
+        hashed_password = await get_hash_executor().submit(get_password_hash, user_data.password)
+        user = User(email=user_data.email, name=user_data.name, hashed_password=hashed_password)
+        return await UserRepository.create(user)
+
+    @classmethod
+    def update(cls, user: User, user_data: UserUpdate) -> User:
         """Update user"""
         update_data = user_data.model_dump(exclude_unset=True)
-
         if 'password' in update_data:
-            user.hashed_password = get_password_hash(update_data.pop('password'))
+            update_data['hashed_password'] = get_password_hash(update_data.pop('password'))
+        values = cls._revoking(user, {field: value for field, value in update_data.items() if hasattr(user, field)})
 
-        for field, value in update_data.items():
-            if hasattr(user, field):
+        try:
+            for field, value in values.items():
                 setattr(user, field, value)
-
-        user.save()
+            user.save()
+        finally:
+            cls.invalidate(user.uid)  # Even on failure: the cached instance may be half-mutated
+        if 'token_version' in values:
+            TokenService.revoke(user.uid, values['token_version'])
         return user
 
+    @classmethod
+    async def update_async(cls, user: User, user_data: UserUpdate) -> User:
+        """Update user without blocking the event loop"""
+        update_data = user_data.model_dump(exclude_unset=True)
+
+        if 'password' in update_data:
+            update_data['hashed_password'] = await get_hash_executor().submit(
+                get_password_hash, update_data.pop('password')
+            )
+
+        values = {field: value for field, value in update_data.items() if hasattr(user, field)}
+        if not values:
+            return user
+        return await cls._write(user, values)
+
+    @classmethod
+    async def set_active_async(cls, user: User, is_active: bool) -> User:
+        """Activate or deactivate a user; deactivation revokes their tokens"""
+        return await cls._write(user, {'is_active': is_active})
+
+    @classmethod
+    async def _write(cls, user: User, values: Dict[str, Any]) -> User:
+        """Store values, revoking issued tokens if they change the password or is_active"""
+        values = cls._revoking(user, values)
+        updated = await UserRepository.update(user, values)
+        cls.invalidate(user.uid)
+        if 'token_version' in values:
+            TokenService.revoke(user.uid, values['token_version'])
+        return updated
+
     @staticmethod
     def authenticate(email: str, password: str) -> Optional[User]:
         """Authenticate user with email and password"""
@@ -62,7 +197,42 @@ class UserService:
             return None
         return user
 
-    @staticmethod
-    def delete(user: User) -> None:
-        """Delete user"""
-        user.delete()
+    @classmethod
+    async def authenticate_async(cls, email: str, password: str) -> Optional[User]:
+        """
+        Authenticate user with email and password without blocking the event loop
+
+        bcrypt runs on the hashing executor. A hash made with outdated cost
+        parameters is replaced by a fresh one after a successful check; if
+        that write fails the login still succeeds.
+
+        Raises:
+            HashExecutorSaturated: If the hashing queue is full
+        """
+        user = await cls.get_by_email_async(email)
+        if not user:
+            return None
+        valid, new_hash = await get_hash_executor().submit(
+            verify_and_update_password, password, user.hashed_password
+        )
+        if not valid:
+            return None
+        if new_hash:
+            try:
+                user = await UserRepository.update(user, {'hashed_password': new_hash})
+                cls.invalidate(user.uid)
+            except Exception as e:
+                print(f"Warning: could not rehash password for {user.uid}: {e}")
+        return user
+
+    @classmethod
+    def delete(cls, user: User) -> None:
+        """Delete user with everything they own"""
+        results, _ = db.cypher_query(DELETE_USER_QUERY, {'uid': user.uid})
+        cls._forget_deleted(user.uid, results[0][0] if results else [])
+
+    @classmethod
+    async def delete_async(cls, user: User) -> None:
+        """Delete user without blocking the event loop"""
+        chart_uids = await UserRepository.delete(user.uid)
+        cls._forget_deleted(user.uid, chart_uids)
@@ -0,0 +1,113 @@
+"""
+Startup warm-up so the first real requests don't pay cold-start costs
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from neomodel import db
+from app.db.neo4j_base import get_async_driver
+from app.services.astrology_service import AstrologyService
+from app.services.chart_executor import get_chart_executor
+from app.services.ephemeris_service import EphemerisService
+from app.services.schema_service import SchemaService
+from app.services.similarity_service import ChartSimilarityService
+from app.services.transit_service import TransitService
+
+
+class WarmupService:
+    """
+    Service that preloads engines, connections and static tables
+
+    The API reports ready only once every warm-up step has run. Failed steps
+    are recorded in the report. Database availability is not latched here;
+    /ready checks it live on every probe.
+    """
+
+    _task: Optional[asyncio.Task] = None
+    _finished = False
+    _steps: List[Dict[str, Any]] = []
+
+    @classmethod
+    def start(cls) -> None:
+        """Run warm-up in the background (called from the app lifespan)"""
+        cls._finished = False
+        cls._steps = []
+        cls._task = asyncio.create_task(cls.run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Cancel an unfinished warm-up"""
+        if cls._task is not None and not cls._task.done():
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+
+    @classmethod
+    async def run(cls) -> None:
+        """Run all warm-up steps in order"""
+        started = time.perf_counter()
+        await cls._step("astrology_engine", lambda: asyncio.to_thread(AstrologyService.warm_up))
+        await cls._step("chart_workers", cls._warm_chart_workers)
+        await cls._step("neo4j", cls._warm_neo4j)
+        await cls._step("schema", cls._ensure_schema)
+        await cls._step("ephemeris", lambda: asyncio.to_thread(EphemerisService.is_ready))
+        await cls._step("transit_snapshot", lambda: asyncio.to_thread(TransitService.get_snapshot))
+        await cls._step("similarity_index", lambda: asyncio.to_thread(ChartSimilarityService.ensure_loaded))
+        cls._finished = True
+        print(f"🔥 Warm-up finished in {time.perf_counter() - started:.2f}s")
+
+    @classmethod
+    async def _step(cls, name: str, action: Callable[[], Awaitable[Any]]) -> bool:
+        """Run and time one step, recording failures instead of raising"""
+        started = time.perf_counter()
+        try:
+            await action()
+            error = None
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+            print(f"Warning: warm-up step {name} failed: {error}")
+
+        cls._steps.append({
+            'step': name,
+            'ok': error is None,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+            'error': error,
+        })
+        return error is None
+
+    @staticmethod
+    async def _warm_neo4j() -> None:
+        """Open a connection on both the neomodel and the async driver"""
+        await asyncio.to_thread(db.cypher_query, "RETURN 1")
+        await get_async_driver().verify_connectivity()
+
+    @staticmethod
+    async def _ensure_schema() -> None:
+        """Bootstrap constraints, indexes and reference data"""
+        if not await asyncio.to_thread(SchemaService.ensure):
+            raise RuntimeError(f"missing indexes: {', '.join(SchemaService.status()['missing_indexes'])}")
+
+    @staticmethod
+    async def _warm_chart_workers() -> None:
+        """Spawn every chart worker process and run one chart in each"""
+        executor = get_chart_executor()
+        await asyncio.gather(*(
+            executor.submit(AstrologyService.warm_up, block=True)
+            for _ in range(executor.max_workers)
+        ))
+
+    @classmethod
+    def is_ready(cls) -> bool:
+        """Whether warm-up has finished"""
+        return cls._finished
+
+    @classmethod
+    def report(cls) -> Dict[str, Any]:
+        """Describe warm-up progress and step timings"""
+        return {
+            'ready': cls.is_ready(),
+            'finished': cls._finished,
+            'steps': list(cls._steps),
+        }
@@ -0,0 +1,73 @@
+"""
+Bulk import and export of users and birth charts as NDJSON
+
+Exports every user with their birth chart, one record per line, and imports
+such a file back with batched UNWIND upserts keyed by uid. Both directions
+resume from their checkpoint when run again on the same file; pass
+--restart to start over. Export files contain password hashes.
+
+Usage:
+    python -m app.tools.bulk export PATH [--batch-size 500] [--checkpoint PATH] [--restart]
+    python -m app.tools.bulk import PATH [--batch-size 500] [--recompute] [--workers N]
+        [--checkpoint PATH] [--restart]
+"""
+import argparse
+import sys
+from app.core.config import settings
+from app.db.neo4j_base import init_neo4j, close_neo4j
+from app.services.bulk_service import BulkService
+
+
+def main() -> None:
+    """Run an export or import and print throughput"""
+    parser = argparse.ArgumentParser(description="Export or import users and birth charts as NDJSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="Write all users and charts to a file")
+    import_parser = commands.add_parser("import", help="Upsert users and charts from a file")
+    for command in (export_parser, import_parser):
+        command.add_argument("path")
+        command.add_argument("--batch-size", type=int, default=settings.BULK_BATCH_SIZE)
+        command.add_argument("--checkpoint", help="Checkpoint file (default in BULK_CHECKPOINT_DIR)")
+        command.add_argument("--restart", action="store_true", help="Ignore the checkpoint of this file")
+    import_parser.add_argument("--recompute", action="store_true",
+                               help="Recalculate charts from their birth data instead of importing them")
+    import_parser.add_argument("--workers", type=int,
+                               help="Recompute processes (default ASTROLOGY_PROCESS_WORKERS, 0 = per CPU core)")
+    args = parser.parse_args()
+
+    if args.batch_size < 1:
+        parser.error("--batch-size must be positive")
+
+    init_neo4j()
+    try:
+        if args.command == "export":
+            summary = BulkService.export(
+                args.path,
+                batch_size=args.batch_size,
+                checkpoint_path=args.checkpoint,
+                restart=args.restart,
+            )
+        else:
+            summary = BulkService.import_file(
+                args.path,
+                batch_size=args.batch_size,
+                recompute=args.recompute,
+                workers=args.workers,
+                checkpoint_path=args.checkpoint,
+                restart=args.restart,
+            )
+    finally:
+        close_neo4j()
+
+    failed = summary.get('failed', 0)
+    print(f"✅ {args.command.capitalize()} {args.path}: {summary['records']} records"
+          + (f", {failed} failed to write" if failed else "")
+          + (f", {summary['recompute_failed']} kept stored charts" if summary.get('recompute_failed') else "")
+          + f"; {summary.get('records_this_run', 0)} this run in {summary['elapsed_seconds']}s "
+          f"({summary['records_per_second']} records/s)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
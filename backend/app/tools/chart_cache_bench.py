@@ -0,0 +1,95 @@
+"""
+Birth chart cache benchmark
+
+Calls AstrologyService.calculate_birth_chart for --charts distinct birth
+inputs with an empty chart cache (cold: every call computes the chart with
+--engine), then --repeats more times for the same inputs (cached: every
+call is a cache hit and a private copy). It reports the latency of both and
+checks that the cached charts match the computed ones. No database is
+needed.
+
+Usage:
+    python -m app.tools.chart_cache_bench [--charts 200] [--repeats 5] [--engine swisseph]
+"""
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from app.core.config import settings
+from app.services.astrology_service import AstrologyService
+from app.utils.metrics import LatencyStats
+
+
+def birth_inputs(count: int) -> List[Dict[str, Any]]:
+    """Distinct birth inputs around New Delhi, one day and minute apart"""
+    first = datetime(1985, 1, 1)
+    return [
+        {
+            'birth_date': first + timedelta(days=i),
+            'birth_time': f"{(6 + i) % 24:02d}:{i % 60:02d}",
+            'latitude': 28.6139 + i % 10 * 0.01,
+            'longitude': 77.2090,
+            'timezone': "Asia/Kolkata",
+        }
+        for i in range(count)
+    ]
+
+
+def timed(inputs: List[Dict[str, Any]], latency: LatencyStats) -> List[Dict[str, Any]]:
+    """Charts for inputs, recording each call's latency"""
+    charts = []
+    for birth in inputs:
+        started = time.perf_counter()
+        charts.append(AstrologyService.calculate_birth_chart(**birth))
+        latency.observe(time.perf_counter() - started)
+    return charts
+
+
+def main() -> None:
+    """Run the benchmark, print the report and exit non-zero on a mismatch"""
+    parser = argparse.ArgumentParser(description="Benchmark cold vs cached birth chart latency")
+    parser.add_argument("--charts", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=5, help="Cached calls per chart")
+    parser.add_argument("--engine", choices=["vedicastro", "swisseph"], default="swisseph")
+    args = parser.parse_args()
+
+    if settings.ASTROLOGY_CACHE_MAX_ENTRIES < args.charts:
+        print(f"❌ ASTROLOGY_CACHE_MAX_ENTRIES={settings.ASTROLOGY_CACHE_MAX_ENTRIES} "
+              f"cannot hold {args.charts} charts")
+        sys.exit(1)
+
+    settings.ASTROLOGY_ENGINE = args.engine
+    inputs = birth_inputs(args.charts)
+    AstrologyService.clear_cache()
+
+    cold = LatencyStats(window=args.charts)
+    computed = timed(inputs, cold)
+    fallback = AstrologyService._get_default_chart_data()
+    failed = sum(chart == fallback for chart in computed)
+
+    cached = LatencyStats(window=args.charts * args.repeats)
+    mismatched = 0
+    for _ in range(args.repeats):
+        mismatched += sum(chart != expected for chart, expected in zip(timed(inputs, cached), computed))
+
+    stats = AstrologyService.cache_stats()
+    cold_ms, cached_ms = cold.snapshot(), cached.snapshot()
+    print(f"{args.charts} charts from {args.engine}, {args.repeats} cached calls each "
+          f"(cache hits {stats['hits']}, misses {stats['misses']})")
+    for name, snapshot in (("cold", cold_ms), ("cached", cached_ms)):
+        print(f"{name:>6}: mean {snapshot['mean_ms']:8.3f} ms  p50 {snapshot['p50_ms']:8.3f} ms  "
+              f"p95 {snapshot['p95_ms']:8.3f} ms  max {snapshot['max_ms']:8.3f} ms")
+    print(f"speedup {cold_ms['mean_ms'] / cached_ms['mean_ms']:.1f}x on the mean")
+
+    if failed:
+        print(f"❌ {failed} charts fell back to the default chart; is the {args.engine} engine working?")
+    if mismatched:
+        print(f"❌ {mismatched} cached charts differ from the computed ones")
+    if not failed and not mismatched:
+        print("✅ Cached charts match the computed ones")
+    sys.exit(1 if failed or mismatched else 0)
+
+
+if __name__ == "__main__":
+    main()
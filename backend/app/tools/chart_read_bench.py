@@ -0,0 +1,97 @@
+"""
+Birth chart read-size and decode benchmark
+
+Builds the node properties of a representative chart the way
+BirthChartService writes them and compares a read of the old layout (every
+payload on the BirthChart node) with the default scalar projection and
+with a detail read. Reports stored property bytes and inflate time per
+read; no database is needed.
+
+Usage:
+    python -m app.tools.chart_read_bench [--reads 20000]
+"""
+import argparse
+import json
+import time
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict
+from neo4j.graph import Graph, Node
+from app.models.birth_chart_neo4j import BirthChart, BirthChartDetail
+from app.schemas.birth_chart import BirthChartCreate
+from app.services.astrology_service import AstrologyService
+from app.services.birth_chart_service import BirthChartService
+
+SAMPLE_CHART = BirthChartCreate(
+    birth_date=date(1990, 5, 15),
+    birth_time="14:30",
+    birth_latitude=28.6139,
+    birth_longitude=77.2090,
+    birth_place="New Delhi, India",
+    timezone="Asia/Kolkata",
+)
+
+
+def property_bytes(properties: Dict[str, Any]) -> int:
+    """Approximate stored size: UTF-8 bytes of strings, 8 bytes per number"""
+    return sum(
+        len(value.encode('utf-8')) if isinstance(value, str) else 8
+        for value in properties.values()
+        if value is not None
+    )
+
+
+def time_reads(read: Callable[[], Any], reads: int) -> float:
+    """Mean microseconds per call of read, after a warm-up pass"""
+    for _ in range(min(reads, 1000)):
+        read()
+    started = time.perf_counter()
+    for _ in range(reads):
+        read()
+    return (time.perf_counter() - started) / reads * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print the report"""
+    parser = argparse.ArgumentParser(description="Compare birth chart node size and decode time per read")
+    parser.add_argument("--reads", type=int, default=20000)
+    args = parser.parse_args()
+
+    calculated = AstrologyService.calculate_birth_chart(
+        birth_date=datetime.combine(SAMPLE_CHART.birth_date, datetime.min.time()),
+        birth_time=SAMPLE_CHART.birth_time.strftime("%H:%M"),
+        latitude=SAMPLE_CHART.birth_latitude,
+        longitude=SAMPLE_CHART.birth_longitude,
+        timezone=SAMPLE_CHART.timezone,
+    )
+    properties, detail = BirthChartService.chart_properties(SAMPLE_CHART, calculated)
+    now = datetime.now(timezone.utc).timestamp()
+    properties.update({'uid': 'bench', 'calculated_at': now, 'updated_at': now})
+    detail['chart_uid'] = 'bench'
+
+    graph = Graph()
+    chart_node = Node(graph, "4:bench:0", 0, ["BirthChart"], properties)
+    detail_node = Node(graph, "4:bench:1", 1, ["BirthChartDetail"], detail)
+    inline_node = Node(graph, "4:bench:2", 2, ["BirthChart"], {**properties, **detail})
+
+    def read_inline() -> BirthChart:
+        # Before: the payloads were JSONProperty fields of the chart itself
+        chart = BirthChart.inflate(inline_node)
+        for field in BirthChart.DETAIL_FIELDS:
+            value = inline_node.get(field)
+            setattr(chart, field, json.loads(value) if value is not None else None)
+        return chart
+
+    layouts = [
+        ("before: payloads on BirthChart", property_bytes(inline_node._properties), read_inline),
+        ("after: scalar projection", property_bytes(properties), lambda: BirthChart.inflate(chart_node)),
+        ("after: with detail", property_bytes(properties) + property_bytes(detail),
+         lambda: BirthChart.inflate(chart_node).attach_detail(BirthChartDetail.inflate(detail_node))),
+    ]
+
+    print(f"{len(calculated.get('planets', []))} planets, {args.reads} reads per layout")
+    for name, size, read in layouts:
+        print(f"{name:<34} {size:>7} bytes  {time_reads(read, args.reads):>8.1f} µs/read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Concurrent request benchmark for authenticated endpoints
+
+Keeps a fixed number of requests in flight against a running API and
+reports requests per second and latency percentiles. Run it against a build
+before and after a change to compare event-loop throughput.
+
+Usage:
+    python -m app.tools.concurrency_bench --email USER --password PASS \\
+        [--base-url http://localhost:8000] [--path /api/v1/users/me] [--concurrency 64] [--requests 5000]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from typing import Dict
+import httpx
+from app.utils.metrics import LatencyStats
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    """Get an access token for the benchmark user"""
+    response = await client.post("/api/v1/auth/login", json={'email': email, 'password': password})
+    response.raise_for_status()
+    return response.json()['access_token']
+
+
+async def run(args: argparse.Namespace) -> Dict[str, float]:
+    """Issue args.requests requests with args.concurrency in flight"""
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        token = args.token or await login(client, args.email, args.password)
+        headers = {'Authorization': f"Bearer {token}"}
+        latency = LatencyStats(window=args.requests)
+        errors = 0
+        remaining = args.requests
+
+        async def worker() -> None:
+            nonlocal errors, remaining
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                try:
+                    response = await client.get(args.path, headers=headers)
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latency.observe(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {**latency.snapshot(), 'errors': errors, 'elapsed_s': elapsed, 'rps': args.requests / elapsed}
+
+
+def main() -> None:
+    """Run the benchmark and print the report"""
+    parser = argparse.ArgumentParser(description="Benchmark concurrent requests to an authenticated endpoint")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/api/v1/users/me")
+    parser.add_argument("--token", help="Access token (otherwise --email/--password are used to log in)")
+    parser.add_argument("--email")
+    parser.add_argument("--password")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    if not args.token and not (args.email and args.password):
+        parser.error("give --token or both --email and --password")
+
+    result = asyncio.run(run(args))
+    print(f"{args.requests} x GET {args.path} with {args.concurrency} in flight: "
+          f"{result['rps']:.0f} req/s in {result['elapsed_s']:.2f}s")
+    print(f"latency mean {result['mean_ms']:.1f} ms  p50 {result['p50_ms']:.1f} ms  "
+          f"p95 {result['p95_ms']:.1f} ms  p99 {result['p99_ms']:.1f} ms  errors {result['errors']}")
+    sys.exit(1 if result['errors'] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Nightly cosmic influence precomputation
+
+Computes every user's cosmic influence for their local date and stores it
+for GET /astrology/cosmic-influence/today. Schedule it nightly (e.g. cron
+``0 18 * * *``, before midnight in UTC+6 and later zones); an interrupted
+run resumes from its checkpoint when started again the same UTC day.
+Influences older than DAILY_INFLUENCE_RETENTION_DAYS are pruned at the end.
+
+Usage:
+    python -m app.tools.daily_influence [--days-ahead 1] [--page-size 500] [--checkpoint PATH] [--restart]
+"""
+import argparse
+import sys
+from app.core.config import settings
+from app.db.neo4j_base import init_neo4j, close_neo4j
+from app.services.cosmic_influence_service import CosmicInfluenceService
+
+
+def main() -> None:
+    """Run the precomputation and print throughput"""
+    parser = argparse.ArgumentParser(description="Precompute per-user daily cosmic influence")
+    parser.add_argument("--days-ahead", type=int, default=1,
+                        help="Days after each user's current local date to compute (0 = today)")
+    parser.add_argument("--page-size", type=int, default=settings.DAILY_INFLUENCE_PAGE_SIZE)
+    parser.add_argument("--checkpoint", default=settings.DAILY_INFLUENCE_CHECKPOINT_PATH)
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint of this run")
+    args = parser.parse_args()
+
+    if args.page_size < 1:
+        parser.error("--page-size must be positive")
+
+    init_neo4j()
+    try:
+        summary = CosmicInfluenceService.run_daily_job(
+            days_ahead=args.days_ahead,
+            page_size=args.page_size,
+            checkpoint_path=args.checkpoint,
+            restart=args.restart,
+        )
+    finally:
+        close_neo4j()
+
+    print(f"✅ Run {summary['run_id']}: {summary['processed']} users stored, {summary['failed']} failed; "
+          f"{summary.get('processed_this_run', 0)} this run in {summary['elapsed_seconds']}s "
+          f"({summary['users_per_second']} users/s); {summary['pruned']} old influences pruned")
+    sys.exit(1 if summary['failed'] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Astrology engine parity check and latency benchmark
+
+Computes the same random birth inputs with every engine, reports per-chart
+latency for each, and compares object longitudes against vedicastro (signs,
+nakshatras and houses are derived from them by the shared kernel). Exits
+non-zero if any object differs by more than the tolerance, or if nothing
+could be compared.
+
+Usage:
+    python -m app.tools.engine_parity [--samples 500] [--seed 7] [--tolerance 0.05]
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from app.services.astrology_service import AstrologyService
+from app.utils.metrics import LatencyStats
+
+
+def random_inputs(count: int, seed: int) -> List[Dict[str, Any]]:
+    """Random birth inputs between 1900 and 2050 with whole-hour offsets"""
+    rng = random.Random(seed)
+    start = datetime(1900, 1, 1)
+    span_days = (datetime(2050, 12, 31) - start).days
+    inputs = []
+    for _ in range(count):
+        longitude = round(rng.uniform(-180, 180), 4)
+        offset = round(longitude / 15)
+        inputs.append({
+            'birth_date': start + timedelta(days=rng.randrange(span_days)),
+            'birth_time': f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+            'latitude': round(rng.uniform(-60, 60), 4),
+            'longitude': longitude,
+            'timezone': f"{'-' if offset < 0 else '+'}{abs(offset):02d}:00",
+        })
+    return inputs
+
+
+def absolute_longitudes(chart: Dict[str, Any]) -> Dict[str, float]:
+    """Sidereal longitude of each object, rebuilt from sign and degree"""
+    return {
+        planet['name']: AstrologyService.ZODIAC_SIGNS.index(planet['sign']) * 30 + planet['degree']
+        for planet in chart['planets']
+    }
+
+
+def main() -> None:
+    """Run the parity check and print the report"""
+    parser = argparse.ArgumentParser(description="Compare astrology engines for parity and latency")
+    parser.add_argument("--samples", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Longitude tolerance in degrees")
+    args = parser.parse_args()
+
+    inputs = random_inputs(args.samples, args.seed)
+    results: Dict[str, List[Any]] = {}
+
+    for engine in AstrologyService.ENGINES:
+        latency = LatencyStats(window=args.samples)
+        charts: List[Any] = []
+        for item in inputs:
+            started = time.perf_counter()
+            try:
+                charts.append(AstrologyService._compute_birth_chart(**item, engine=engine))
+            except Exception as e:
+                charts.append(e)
+            latency.observe(time.perf_counter() - started)
+        results[engine] = charts
+
+        failures = sum(isinstance(chart, Exception) for chart in charts)
+        stats = latency.snapshot()
+        print(f"{engine:>10}: mean {stats['mean_ms']:.3f} ms  p50 {stats['p50_ms']:.3f} ms  "
+              f"p99 {stats['p99_ms']:.3f} ms  errors {failures}/{len(charts)}")
+        if failures:
+            print(f"{'':>12}first error: {next(c for c in charts if isinstance(c, Exception))!r}")
+
+    reference, candidates = AstrologyService.ENGINES[0], AstrologyService.ENGINES[1:]
+    mismatches = 0
+    unverified = False
+    for engine in candidates:
+        compared = 0
+        worst = 0.0
+        for item, expected, actual in zip(inputs, results[reference], results[engine]):
+            if isinstance(expected, Exception) or isinstance(actual, Exception):
+                continue
+            expected_lon = absolute_longitudes(expected)
+            actual_lon = absolute_longitudes(actual)
+            for name in expected_lon.keys() & actual_lon.keys():
+                compared += 1
+                diff = abs((expected_lon[name] - actual_lon[name] + 180.0) % 360.0 - 180.0)
+                worst = max(worst, diff)
+                if diff > args.tolerance:
+                    mismatches += 1
+                    print(f"  mismatch {engine} {name} {diff:.4f}° for {item}")
+
+        print(f"{engine} vs {reference}: {compared} objects compared, worst difference {worst:.4f}°")
+        if compared == 0:
+            print(f"  no comparable charts; is {reference} installed correctly?")
+            unverified = True
+
+    sys.exit(1 if mismatches or unverified else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Ephemeris build command
+
+Usage:
+    python -m app.tools.ephemeris [--start-year 2000] [--end-year 2060] [--step-hours 6] [--path ...]
+"""
+import argparse
+import time
+from app.core.config import settings
+from app.services.ephemeris_service import build_ephemeris
+
+
+def main() -> None:
+    """Regenerate the memory-mapped ephemeris file"""
+    parser = argparse.ArgumentParser(description="Build the precomputed sidereal ephemeris")
+    parser.add_argument("--path", default=settings.EPHEMERIS_PATH, help="Output .npy path")
+    parser.add_argument("--start-year", type=int, default=settings.EPHEMERIS_START_YEAR)
+    parser.add_argument("--end-year", type=int, default=settings.EPHEMERIS_END_YEAR)
+    parser.add_argument("--step-hours", type=float, default=settings.EPHEMERIS_STEP_HOURS)
+    args = parser.parse_args()
+
+    if args.end_year < args.start_year:
+        parser.error("--end-year must not be before --start-year")
+
+    print(f"🪐 Building ephemeris {args.start_year}-{args.end_year} every {args.step_hours}h -> {args.path}")
+    started = time.perf_counter()
+    meta = build_ephemeris(args.path, args.start_year, args.end_year, args.step_hours)
+    elapsed = time.perf_counter() - started
+    print(f"✅ Wrote {meta['steps']} samples in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Login throughput benchmark for each bcrypt cost
+
+Runs the password check a login performs (verify_and_update_password) on
+the hashing executor with every thread busy, and reports logins per second
+overall and per core for each cost. Use it to pick BCRYPT_ROUNDS and
+PASSWORD_HASH_WORKERS for the hardware; no database is needed.
+
+Usage:
+    python -m app.tools.hash_bench [--rounds 10 11 12 13] [--workers 0] [--seconds 3]
+"""
+import argparse
+import asyncio
+import os
+import time
+from passlib.context import CryptContext
+from app.services.hash_executor import HashExecutor
+
+PASSWORD = "correct horse battery staple"
+
+
+async def measure(executor: HashExecutor, context: CryptContext, hashed: str, seconds: float) -> int:
+    """Logins completed in seconds with one check in flight per worker"""
+    deadline = time.perf_counter() + seconds
+    completed = 0
+
+    async def worker() -> None:
+        nonlocal completed
+        while time.perf_counter() < deadline:
+            valid, _ = await executor.submit(context.verify_and_update, PASSWORD, hashed)
+            assert valid
+            completed += 1
+
+    await asyncio.gather(*(worker() for _ in range(executor.max_workers)))
+    return completed
+
+
+def main() -> None:
+    """Run the benchmark and print the report"""
+    parser = argparse.ArgumentParser(description="Benchmark login password checks per bcrypt cost")
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--workers", type=int, default=0, help="Hashing threads (0 = one per CPU core)")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    workers = args.workers or cores
+    print(f"{workers} hashing threads on {cores} cores, {args.seconds:.0f}s per cost")
+    for rounds in args.rounds:
+        context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds, bcrypt__min_rounds=rounds)
+        hashed = context.hash(PASSWORD)
+        executor = HashExecutor(max_workers=workers, max_queue=0)
+        started = time.perf_counter()
+        completed = asyncio.run(measure(executor, context, hashed, args.seconds))
+        elapsed = time.perf_counter() - started
+        executor.shutdown()
+
+        stats = executor.stats()
+        rate = completed / elapsed
+        print(f"cost {rounds:>2}: {rate:8.1f} logins/s  {rate / min(workers, cores):7.1f} per core  "
+              f"check {stats['run_time']['mean_ms']:6.1f} ms  queue p95 {stats['wait_time']['p95_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Cold-start import-time report with a regression budget
+
+Imports the API in a fresh interpreter under ``python -X importtime``,
+prints the slowest modules and exits non-zero if the total exceeds the
+budget, so CI can fail when cold start regresses. The budget defaults to
+IMPORT_BUDGET_MS from the environment (2500 if unset); the test suite
+enforces the same budget in tests/test_import_budget.py.
+
+Usage:
+    python -m app.tools.import_budget [--budget-ms 2500] [--top 20] [--module app.main]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+DEFAULT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", 2500))
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def measure(module: str) -> List[Tuple[str, int, int]]:
+    """
+    Import module in a fresh interpreter and collect -X importtime output
+
+    Returns:
+        (module name, self µs, cumulative µs) for every imported module
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+        cwd=BACKEND_DIR,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr[-2000:]}")
+
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def total_import_ms(rows: List[Tuple[str, int, int]], module: str) -> float:
+    """Cumulative import time of module in milliseconds"""
+    return next(cumulative for name, _, cumulative in rows if name == module) / 1000
+
+
+def main() -> None:
+    """Print the import-time report and enforce the budget"""
+    parser = argparse.ArgumentParser(description="Report API import time and enforce a budget")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = measure(args.module)
+    total_ms = total_import_ms(rows, args.module)
+
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda row: row[1], reverse=True)[:args.top]:
+        print(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {name}")
+
+    print(f"\nimport {args.module}: {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    if total_ms > args.budget_ms:
+        print("❌ Import-time budget exceeded")
+        sys.exit(1)
+    print("✅ Within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Concurrent registration load test
+
+Registers --users new accounts against a running API, sending --attempts
+concurrent sign-ups for every email, and checks that each email got exactly
+one 201 with the rest rejected as already registered. It then counts the
+stored User nodes per email in Neo4j to confirm there are no duplicates, and
+reports registrations per second. The test users are deleted afterwards
+unless --keep is given.
+
+Run the API with AUTH_RATE_LIMIT_ENABLED=false (or limits above the load),
+otherwise the rate limiter answers most of the attempts with 429.
+
+Usage:
+    python -m app.tools.register_bench [--base-url http://localhost:8000] [--users 200]
+        [--attempts 4] [--concurrency 64] [--min-rps 0] [--keep]
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Tuple
+import httpx
+from neomodel import db
+from app.db.neo4j_base import init_neo4j, close_neo4j
+from app.utils.metrics import LatencyStats
+
+STORED_QUERY = """
+MATCH (u:User) WHERE u.email STARTS WITH $prefix
+RETURN u.email AS email, count(*) AS copies
+"""
+
+CLEANUP_QUERY = """
+MATCH (u:User) WHERE u.email STARTS WITH $prefix
+DETACH DELETE u
+"""
+
+
+async def register_all(
+    args: argparse.Namespace, emails: List[str]
+) -> Tuple[Dict[str, Counter], float, Dict[str, Any]]:
+    """
+    Send args.attempts sign-ups per email in random order
+
+    Returns:
+        (status code counts per email, elapsed seconds, latency snapshot)
+    """
+    attempts = [email for email in emails for _ in range(args.attempts)]
+    random.shuffle(attempts)
+    statuses: Dict[str, Counter] = defaultdict(Counter)
+    latency = LatencyStats(window=len(attempts))
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        async def worker() -> None:
+            while attempts:
+                email = attempts.pop()
+                started = time.perf_counter()
+                try:
+                    response = await client.post("/api/v1/auth/register", json={
+                        'email': email, 'name': "Load Test", 'password': "load-test-password",
+                    })
+                    statuses[email][response.status_code] += 1
+                except httpx.HTTPError:
+                    statuses[email]['error'] += 1
+                latency.observe(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+    return statuses, elapsed, latency.snapshot()
+
+
+def main() -> None:
+    """Run the load test, print the report and exit non-zero on any violation"""
+    parser = argparse.ArgumentParser(description="Load-test concurrent registrations for duplicates and throughput")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--attempts", type=int, default=4, help="Concurrent sign-ups per email")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--min-rps", type=float, default=0.0, help="Fail below this many registrations per second")
+    parser.add_argument("--keep", action="store_true", help="Leave the test users in the database")
+    args = parser.parse_args()
+
+    prefix = f"loadtest-{uuid.uuid4().hex[:8]}-"
+    emails = [f"{prefix}{i}@example.com" for i in range(args.users)]
+    statuses, elapsed, latency = asyncio.run(register_all(args, emails))
+
+    init_neo4j()
+    try:
+        results, _ = db.cypher_query(STORED_QUERY, {'prefix': prefix})
+        stored = dict(results)
+        if not args.keep:
+            db.cypher_query(CLEANUP_QUERY, {'prefix': prefix})
+    finally:
+        close_neo4j()
+
+    totals = sum(statuses.values(), Counter())
+    wrong = [email for email in emails if statuses[email][201] != 1 or statuses[email][400] != args.attempts - 1]
+    duplicated = [email for email, copies in stored.items() if copies > 1]
+    missing = [email for email in emails if email not in stored]
+    rps = totals[201] / elapsed
+
+    print(f"{args.users} emails x {args.attempts} attempts with {args.concurrency} in flight in {elapsed:.2f}s: "
+          f"{rps:.1f} registrations/s, {sum(totals.values()) / elapsed:.1f} attempts/s")
+    print(f"latency mean {latency['mean_ms']:.1f} ms  p95 {latency['p95_ms']:.1f} ms  "
+          f"statuses {dict(totals)}")
+
+    failed = False
+    if wrong:
+        print(f"❌ {len(wrong)} emails did not get exactly one 201, e.g. {wrong[0]}: {dict(statuses[wrong[0]])}")
+        failed = True
+    if duplicated or missing:
+        print(f"❌ Stored users: {len(duplicated)} emails duplicated, {len(missing)} missing")
+        failed = True
+    if rps < args.min_rps:
+        print(f"❌ {rps:.1f} registrations/s is below --min-rps {args.min_rps}")
+        failed = True
+    if not failed:
+        print(f"✅ One user per email ({len(stored)} stored)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Schema bootstrap command
+
+Installs constraints and indexes, seeds reference data (zodiac signs,
+planets, raags, nakshatras), moves inline chart payloads of older BirthChart
+nodes onto BirthChartDetail nodes, scores raags for charts that have no
+recommendations yet and verifies every required index is online. Idempotent; exits
+non-zero if any index is missing.
+
+Usage:
+    python -m app.tools.schema [--verify-only]
+"""
+import argparse
+import sys
+from app.db.neo4j_base import init_neo4j, close_neo4j
+from app.services.schema_service import SchemaService
+
+
+def main() -> None:
+    """Bootstrap or verify the Neo4j schema"""
+    parser = argparse.ArgumentParser(description="Install Neo4j constraints, indexes and reference data")
+    parser.add_argument("--verify-only", action="store_true", help="Only report missing indexes")
+    args = parser.parse_args()
+
+    init_neo4j()
+    try:
+        if args.verify_only:
+            missing = SchemaService.missing_indexes()
+        else:
+            missing = SchemaService.bootstrap()['missing_indexes']
+    finally:
+        close_neo4j()
+
+    required = len(SchemaService.required_schema())
+    if missing:
+        print(f"❌ {len(missing)} of {required} indexes missing: {', '.join(missing)}")
+        sys.exit(1)
+    print(f"✅ All {required} indexes online")
+
+
+if __name__ == "__main__":
+    main()
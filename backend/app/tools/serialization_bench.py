@@ -0,0 +1,124 @@
+"""
+Response serialization microbenchmark
+
+Measures the per-response cost of turning service output into response
+bytes for /astrology/birth-chart, /birth-charts/me and /users/me, two ways:
+the validated path (build the pydantic response model, then FastAPI's
+serialize_response and the stdlib-encoded JSONResponse) and the trusted
+path the endpoints use (plain content dictionaries encoded by
+APIJSONResponse). It also checks that both produce the same JSON. The
+chart is computed with --engine; no database is needed.
+
+Usage:
+    python -m app.tools.serialization_bench [--iterations 20000] [--engine swisseph]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Tuple
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from app.api.v1.endpoints.astrology import BirthChartResponse, PlanetData, birth_chart_response_content
+from app.models.birth_chart_neo4j import BirthChart as BirthChartModel
+from app.models.user_neo4j import User as UserModel
+from app.schemas.birth_chart import BirthChart, BirthChartCreate, birth_chart_content
+from app.schemas.user import UserWithChartStatus, user_content
+from app.services.astrology_service import AstrologyService
+from app.services.birth_chart_service import BirthChartService
+from app.utils.responses import APIJSONResponse
+
+NOW = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+
+def sample_data(engine: str) -> Tuple[Dict[str, Any], BirthChartModel, UserModel]:
+    """A computed chart and the stored chart and user nodes for it"""
+    request = BirthChartCreate(
+        birth_date="1990-08-15", birth_time="14:30", birth_latitude=28.6139,
+        birth_longitude=77.2090, birth_place="New Delhi", timezone="Asia/Kolkata",
+    )
+    chart_data = AstrologyService._compute_birth_chart(
+        birth_date=datetime(1990, 8, 15), birth_time="14:30",
+        latitude=request.birth_latitude, longitude=request.birth_longitude,
+        timezone=request.timezone, engine=engine,
+    )
+    properties, detail = BirthChartService.chart_properties(request, chart_data)
+    chart = BirthChartModel(uid="c" * 32, calculated_at=NOW, updated_at=NOW, **properties)
+    chart.birth_date = request.birth_date  # Deflated to a string above
+    for field, value in detail.items():
+        setattr(chart, field, json.loads(value) if isinstance(value, str) else value)
+    chart.detail_loaded = True
+    user = UserModel(uid="u" * 32, email="asha@example.com", name="Asha", hashed_password="x",
+                     is_active=True, is_superuser=False, created_at=NOW, updated_at=NOW)
+    return chart_data, chart, user
+
+
+def validated(model: Any, build: Callable[[], Any]) -> Callable[[], bytes]:
+    """The pre-orjson path: model construction, FastAPI serialization, stdlib JSON"""
+    field = create_response_field(name="response", type_=model)
+    loop = asyncio.new_event_loop()
+
+    def run() -> bytes:
+        content = loop.run_until_complete(serialize_response(field=field, response_content=build()))
+        return JSONResponse(content).body
+    return run
+
+
+def per_call_us(fn: Callable[[], bytes], iterations: int) -> float:
+    """Mean microseconds per call"""
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print the report"""
+    parser = argparse.ArgumentParser(description="Benchmark response serialization per endpoint")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--engine", choices=["vedicastro", "swisseph"], default="swisseph")
+    args = parser.parse_args()
+
+    chart_data, chart, user = sample_data(args.engine)
+
+    def old_birth_chart() -> BirthChartResponse:
+        planets = [PlanetData(**planet) for planet in chart_data['planets']]
+        ascendant = next((p['degree'] for p in chart_data['planets'] if p['name'].lower() == 'asc'), 0.0)
+        return BirthChartResponse(
+            **{key: chart_data[key] for key in ('lagna', 'lagna_hindi', 'sun_sign', 'sun_sign_hindi',
+                                                'moon_sign', 'moon_sign_hindi', 'suggested_raag')},
+            planets=planets, ascendant_degree=ascendant, house_positions=list(range(1, 13)),
+        )
+
+    cases = {
+        "POST /astrology/birth-chart": (
+            validated(BirthChartResponse, old_birth_chart),
+            lambda: APIJSONResponse(birth_chart_response_content(chart_data)).body,
+        ),
+        "GET /birth-charts/me": (
+            validated(BirthChart, lambda: {**chart.to_dict(), 'user_id': user.uid}),
+            lambda: APIJSONResponse(birth_chart_content(chart, user.uid)).body,
+        ),
+        "GET /users/me": (
+            validated(UserWithChartStatus, lambda: UserWithChartStatus(**user.to_dict(), has_birth_chart=True)),
+            lambda: APIJSONResponse(user_content(user, has_birth_chart=True)).body,
+        ),
+    }
+
+    mismatched = False
+    print(f"{args.iterations} responses each, chart from {args.engine}")
+    for name, (old, new) in cases.items():
+        same = json.loads(old()) == json.loads(new())
+        mismatched |= not same
+        before, after = per_call_us(old, args.iterations), per_call_us(new, args.iterations)
+        print(f"{'✅' if same else '❌'} {name:<28} validated {before:7.1f} us  trusted {after:6.1f} us  "
+              f"{before / after:5.1f}x  ({len(new())} bytes)")
+    sys.exit(1 if mismatched else 0)
+
+
+if __name__ == "__main__":
+    main()
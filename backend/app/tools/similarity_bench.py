@@ -0,0 +1,105 @@
+"""
+Chart similarity index benchmark
+
+Generates synthetic charts, loads them into the same VectorIndex the API
+uses and compares top-k query latency and recall against a brute-force
+NumPy scan over all vectors. Planet longitudes follow mean daily motions
+from random birth dates between 1940 and 2020, so slow planets cluster
+the way real charts do; the ascendant is uniform.
+
+Usage:
+    python -m app.tools.similarity_bench [--charts 1000000] [--queries 200] [--k 10]
+        [--lists 0] [--probes 8]
+"""
+import argparse
+import time
+import numpy as np
+from app.services.similarity_service import FEATURE_OBJECTS, ChartSimilarityService
+from app.utils.metrics import LatencyStats
+from app.utils.vector_index import VectorIndex
+
+# Mean longitude at 1940-01-01 and mean motion in degrees per day (approximate, sidereal)
+MEAN_MOTION = {
+    "Sun": (256.0, 0.9856),
+    "Moon": (120.0, 13.1764),
+    "Mercury": (256.0, 0.9856),
+    "Venus": (256.0, 0.9856),
+    "Mars": (300.0, 0.5240),
+    "Jupiter": (330.0, 0.0831),
+    "Saturn": (0.0, 0.0335),
+    "Rahu": (180.0, -0.0529),
+}
+# Inner planets stay within this many degrees of the Sun
+ELONGATION = {"Mercury": 28.0, "Venus": 47.0}
+
+
+def synthetic_vectors(count: int, seed: int = 0) -> np.ndarray:
+    """Feature vectors for count random charts, shape (count, DIM)"""
+    rng = np.random.default_rng(seed)
+    days = rng.uniform(0, 80 * 365.25, count)
+    longitudes = np.empty((count, len(FEATURE_OBJECTS)))
+    for i, name in enumerate(FEATURE_OBJECTS):
+        if name == "Asc":
+            longitudes[:, i] = rng.uniform(0, 360, count)
+            continue
+        start, motion = MEAN_MOTION[name]
+        longitudes[:, i] = start + motion * days
+        if name in ELONGATION:
+            longitudes[:, i] += ELONGATION[name] * np.sin(rng.uniform(0, 2 * np.pi, count))
+    radians = np.deg2rad(np.mod(longitudes, 360.0))
+    vectors = np.empty((count, ChartSimilarityService.DIM), dtype=np.float32)
+    vectors[:, 0::2] = np.cos(radians)
+    vectors[:, 1::2] = np.sin(radians)
+    return vectors / np.sqrt(len(FEATURE_OBJECTS))
+
+
+def brute_force(vectors: np.ndarray, query: np.ndarray, k: int) -> np.ndarray:
+    """Exact top-k rows by inner product"""
+    scores = vectors @ query
+    top = np.argpartition(-scores, k)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+def main() -> None:
+    """Run the benchmark and print the report"""
+    parser = argparse.ArgumentParser(description="Benchmark the chart similarity index against brute force")
+    parser.add_argument("--charts", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--lists", type=int, default=0, help="Inverted lists (0 = sqrt of charts)")
+    parser.add_argument("--probes", type=int, default=8)
+    args = parser.parse_args()
+
+    vectors = synthetic_vectors(args.charts)
+    queries = synthetic_vectors(args.queries, seed=1)
+
+    index = VectorIndex(dim=ChartSimilarityService.DIM, lists=args.lists, probes=args.probes)
+    started = time.perf_counter()
+    index.build(range(args.charts), vectors)
+    build_seconds = time.perf_counter() - started
+
+    exact = LatencyStats(window=args.queries)
+    approximate = LatencyStats(window=args.queries)
+    hits = 0
+    for query in queries:
+        started = time.perf_counter()
+        expected = brute_force(vectors, query, args.k)
+        exact.observe(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        found = index.search(query, args.k)
+        approximate.observe(time.perf_counter() - started)
+
+        hits += len(set(expected.tolist()) & {key for key, _ in found})
+
+    brute, ivf = exact.snapshot(), approximate.snapshot()
+    layout = index.stats()
+    print(f"{args.charts} charts, {layout['lists']} lists, {layout['probes']} probes, "
+          f"built in {build_seconds:.1f}s; {args.queries} queries, k={args.k}")
+    print(f"brute force  mean {brute['mean_ms']:.2f} ms  p95 {brute['p95_ms']:.2f} ms")
+    print(f"index        mean {ivf['mean_ms']:.2f} ms  p95 {ivf['p95_ms']:.2f} ms  "
+          f"recall@{args.k} {hits / (args.queries * args.k):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""
+JSON checkpoint files for resumable batch jobs
+"""
+import json
+import os
+from typing import Any, Dict
+
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    """Read a checkpoint, or {} if it is missing or unreadable"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_checkpoint(path: str, checkpoint: Dict[str, Any]) -> None:
+    """Write the checkpoint atomically so a crash never leaves it torn"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
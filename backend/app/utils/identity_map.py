@@ -0,0 +1,71 @@
+"""
+Request-scoped identity map for loaded graph nodes
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+_current: ContextVar[Optional[Dict[Tuple[str, str], Any]]] = ContextVar("identity_map", default=None)
+
+
+class IdentityMap:
+    """
+    Per-request map of (kind, key) -> loaded node
+
+    Within a request scope the same node is loaded at most once; outside a
+    scope (CLI tools, background threads) every lookup misses and writes
+    are ignored. The map lives in a context variable, so it follows the
+    request into dependency and threadpool calls.
+    """
+
+    @staticmethod
+    def get(kind: str, key: str) -> Optional[Any]:
+        """Node loaded earlier in this request, or None"""
+        current = _current.get()
+        return current.get((kind, key)) if current is not None else None
+
+    @staticmethod
+    def put(kind: str, key: str, value: Any) -> None:
+        """Remember a loaded node for the rest of this request"""
+        current = _current.get()
+        if current is not None and value is not None:
+            current[(kind, key)] = value
+
+    @staticmethod
+    def discard(kind: str, key: str) -> None:
+        """Forget a node, e.g. after it was written or deleted"""
+        current = _current.get()
+        if current is not None:
+            current.pop((kind, key), None)
+
+    @staticmethod
+    def forget(value: Any) -> None:
+        """Forget every entry holding this object, whatever its key"""
+        current = _current.get()
+        if current is not None:
+            for key in [key for key, held in current.items() if held is value]:
+                del current[key]
+
+    @staticmethod
+    @contextmanager
+    def scope() -> Iterator[None]:
+        """Run a unit of work with a fresh, empty map"""
+        token = _current.set({})
+        try:
+            yield
+        finally:
+            _current.reset(token)
+
+
+class IdentityMapMiddleware:
+    """ASGI middleware giving every HTTP request its own identity map"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with IdentityMap.scope():
+            await self.app(scope, receive, send)
@@ -0,0 +1,55 @@
+"""
+Lightweight in-process metrics
+"""
+import threading
+from collections import deque
+from typing import Any, Dict
+
+
+class LatencyStats:
+    """
+    Thread-safe latency recorder
+
+    Keeps running totals plus a sliding window of recent samples from which
+    percentiles are reported.
+    """
+
+    def __init__(self, window: int = 1024):
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one sample, in seconds"""
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return count, mean, max and recent p50/p95/p99 in milliseconds"""
+        with self._lock:
+            samples = sorted(self._samples)
+            count, total, maximum = self.count, self.total, self.max
+
+        def percentile(p: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(p * len(samples)))] * 1000
+
+        return {
+            'count': count,
+            'mean_ms': round(total / count * 1000, 3) if count else 0.0,
+            'max_ms': round(maximum * 1000, 3),
+            'p50_ms': round(percentile(0.50), 3),
+            'p95_ms': round(percentile(0.95), 3),
+            'p99_ms': round(percentile(0.99), 3),
+        }
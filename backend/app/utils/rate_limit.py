@@ -0,0 +1,141 @@
+"""
+Token-bucket rate limiting with pluggable storage
+"""
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+# Refills a hash-stored bucket and takes `cost` tokens if it can, using the
+# server clock so every client shares one notion of time. Returns
+# {admitted (0/1), retry-after seconds as a string}.
+REDIS_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local admitted = 0
+local retry_after = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  admitted = 1
+else
+  retry_after = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {admitted, tostring(retry_after)}
+"""
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage for token buckets
+
+    A bucket holds up to ``capacity`` tokens and refills at
+    ``refill_per_second``; each attempt takes ``cost`` tokens.
+    """
+
+    @abstractmethod
+    async def take(self, key: str, capacity: float, refill_per_second: float, cost: float = 1.0) -> Tuple[bool, float]:
+        """
+        Take cost tokens from the bucket for key
+
+        Returns:
+            (admitted, seconds until enough tokens are available when rejected)
+        """
+
+    async def close(self) -> None:
+        """Release connections"""
+
+    def stats(self) -> Dict[str, Any]:
+        """Backend counters"""
+        return {}
+
+
+class _Shard:
+    """One lock and one LRU-ordered slice of the buckets"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+
+class MemoryBackend(RateLimitBackend):
+    """
+    In-process buckets, sharded by key hash so concurrent attempts rarely
+    share a lock. Each shard keeps at most max_keys / shards buckets and
+    drops the least recently used one beyond that; a dropped bucket comes
+    back full, which only ever favours the client.
+    """
+
+    def __init__(self, shards: int = 64, max_keys: int = 100000):
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._per_shard = max(1, max_keys // len(self._shards))
+        self.evictions = 0
+
+    async def take(self, key: str, capacity: float, refill_per_second: float, cost: float = 1.0) -> Tuple[bool, float]:
+        shard = self._shards[zlib.crc32(key.encode()) % len(self._shards)]
+        now = time.monotonic()
+        with shard.lock:
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                bucket = shard.buckets[key] = [capacity, now]
+                if len(shard.buckets) > self._per_shard:
+                    shard.buckets.popitem(last=False)
+                    self.evictions += 1
+            else:
+                shard.buckets.move_to_end(key)
+                bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * refill_per_second)
+                bucket[1] = now
+
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                return True, 0.0
+            return False, (cost - bucket[0]) / refill_per_second
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'backend': 'memory',
+            'keys': sum(len(shard.buckets) for shard in self._shards),
+            'shards': len(self._shards),
+            'evictions': self.evictions,
+        }
+
+
+class RedisBackend(RateLimitBackend):
+    """
+    Buckets in Redis (or any server speaking its protocol and Lua scripting,
+    such as Valkey or KeyDB), shared by every worker process that points at
+    the same URL. Each attempt is one EVALSHA round trip. Requires the
+    optional ``redis`` package.
+    """
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("The redis rate limit backend requires the 'redis' package") from e
+
+        self.prefix = prefix
+        self._client = redis.from_url(url)
+        self._script = self._client.register_script(REDIS_TOKEN_BUCKET_SCRIPT)
+
+    async def take(self, key: str, capacity: float, refill_per_second: float, cost: float = 1.0) -> Tuple[bool, float]:
+        admitted, retry_after = await self._script(
+            keys=[self.prefix + key], args=[capacity, refill_per_second, cost]
+        )
+        return bool(admitted), float(retry_after)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {'backend': 'redis'}
@@ -0,0 +1,24 @@
+"""
+Response classes
+"""
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class APIJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson
+
+    The default response class of the app. orjson encodes dates, times,
+    datetimes, UUIDs and NumPy values natively, with UTC datetimes ending in
+    'Z' as pydantic writes them, so an endpoint whose service output already
+    matches its response model can return this class directly and skip
+    model validation and FastAPI's serialization pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+        )
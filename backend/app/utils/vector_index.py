@@ -0,0 +1,174 @@
+"""
+In-memory nearest-neighbour index over dense vectors
+"""
+import threading
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+import numpy as np
+
+
+class _List:
+    """One inverted list: a growable vector matrix and its ids"""
+
+    def __init__(self, dim: int):
+        self.vectors = np.empty((16, dim), dtype=np.float32)
+        self.ids: List[Hashable] = []
+
+    def append(self, key: Hashable, vector: np.ndarray) -> int:
+        row = len(self.ids)
+        if row == len(self.vectors):
+            grown = np.empty((row * 2, self.vectors.shape[1]), dtype=np.float32)
+            grown[:row] = self.vectors
+            self.vectors = grown
+        self.vectors[row] = vector
+        self.ids.append(key)
+        return row
+
+    def remove(self, row: int) -> Optional[Hashable]:
+        """Swap the last entry into row; returns the id that moved, if any"""
+        last = len(self.ids) - 1
+        moved = None
+        if row != last:
+            self.vectors[row] = self.vectors[last]
+            self.ids[row] = self.ids[last]
+            moved = self.ids[row]
+        self.ids.pop()
+        return moved
+
+
+class VectorIndex:
+    """
+    Thread-safe inner-product index (IVF) with incremental updates
+
+    Vectors are grouped into inverted lists around k-means centroids; a
+    query scans only the ``probes`` lists whose centroids score highest, so
+    its cost grows with N / lists * probes instead of N. Below
+    ``min_train_size`` vectors there is a single list and search is exact.
+    Adds and removes touch one list. The centroids are retrained on a sample
+    whenever the index has grown 4x since they were fitted.
+    """
+
+    def __init__(self, dim: int, lists: int = 0, probes: int = 8, min_train_size: int = 4096):
+        self.dim = dim
+        self.lists = lists
+        self.probes = probes
+        self.min_train_size = min_train_size
+        self._lock = threading.RLock()
+        self._centroids = np.zeros((1, dim), dtype=np.float32)
+        self._lists = [_List(dim)]
+        self._where: Dict[Hashable, Tuple[int, int]] = {}
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    def _list_count(self, size: int) -> int:
+        if size < self.min_train_size:
+            return 1
+        return self.lists or max(1, int(np.sqrt(size)))
+
+    @staticmethod
+    def _kmeans(vectors: np.ndarray, k: int, iterations: int = 10, sample: int = 65536) -> np.ndarray:
+        """Spherical k-means on a random sample; returns unit-length centroids"""
+        rng = np.random.default_rng(0)
+        if len(vectors) > sample:
+            vectors = vectors[rng.choice(len(vectors), sample, replace=False)]
+        centroids = vectors[rng.choice(len(vectors), k, replace=False)].copy()
+        for _ in range(iterations):
+            assign = np.argmax(vectors @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, vectors)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            filled = norms[:, 0] > 0
+            centroids[filled] = sums[filled] / norms[filled]
+        return centroids.astype(np.float32)
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self._centroids.T, axis=1)
+
+    def build(self, keys: Iterable[Hashable], vectors: np.ndarray) -> None:
+        """Replace the contents with keys and their vectors (rows of vectors)"""
+        keys = list(keys)
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(keys), self.dim)
+        count = self._list_count(len(keys))
+        centroids = self._kmeans(vectors, count) if count > 1 else np.zeros((1, self.dim), dtype=np.float32)
+
+        with self._lock:
+            self._centroids = centroids
+            self._lists = [_List(self.dim) for _ in range(count)]
+            self._where = {}
+            self._trained_size = len(keys)
+            for key, vector, list_no in zip(keys, vectors, self._assign(vectors).tolist()):
+                self._where[key] = (list_no, self._lists[list_no].append(key, vector))
+
+    def _retrain(self) -> None:
+        keys = [key for inverted in self._lists for key in inverted.ids]
+        vectors = np.concatenate([inverted.vectors[:len(inverted.ids)] for inverted in self._lists])
+        self.build(keys, vectors)
+
+    def add(self, key: Hashable, vector: np.ndarray) -> None:
+        """Insert or replace the vector for key"""
+        vector = np.asarray(vector, dtype=np.float32).reshape(self.dim)
+        with self._lock:
+            self.remove(key)
+            list_no = int(self._assign(vector[np.newaxis])[0])
+            self._where[key] = (list_no, self._lists[list_no].append(key, vector))
+            size = len(self._where)
+            if size >= self.min_train_size and size >= 4 * max(self._trained_size, 1):
+                self._retrain()
+
+    def remove(self, key: Hashable) -> bool:
+        """Drop key; returns whether it was present"""
+        with self._lock:
+            location = self._where.pop(key, None)
+            if location is None:
+                return False
+            list_no, row = location
+            moved = self._lists[list_no].remove(row)
+            if moved is not None:
+                self._where[moved] = (list_no, row)
+            return True
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """Stored vector for key, or None"""
+        with self._lock:
+            location = self._where.get(key)
+            if location is None:
+                return None
+            list_no, row = location
+            return self._lists[list_no].vectors[row].copy()
+
+    def search(self, query: np.ndarray, k: int, exclude: Optional[Hashable] = None) -> List[Tuple[Hashable, float]]:
+        """
+        Approximate top-k keys by inner product with query
+
+        Returns:
+            (key, score) pairs, highest score first
+        """
+        query = np.asarray(query, dtype=np.float32).reshape(self.dim)
+        with self._lock:
+            probes = min(self.probes, len(self._lists))
+            order = np.argsort(-(self._centroids @ query))[:probes]
+            ids: List[Hashable] = []
+            scores = []
+            for list_no in order.tolist():
+                inverted = self._lists[list_no]
+                if inverted.ids:
+                    ids.extend(inverted.ids)
+                    scores.append(inverted.vectors[:len(inverted.ids)] @ query)
+        if not ids:
+            return []
+
+        scores = np.concatenate(scores)
+        wanted = min(k + 1, len(ids))
+        top = np.argpartition(-scores, wanted - 1)[:wanted]
+        top = top[np.argsort(-scores[top])]
+        results = [(ids[i], float(scores[i])) for i in top.tolist() if ids[i] != exclude]
+        return results[:k]
+
+    def stats(self) -> Dict[str, int]:
+        """Index size and layout"""
+        with self._lock:
+            return {'size': len(self._where), 'lists': len(self._lists), 'probes': self.probes}
@@ -0,0 +1,30 @@
+"""
+Shared test fixtures
+
+Unit tests run without a database. Tests that take the ``neo4j`` fixture
+write to and sweep the configured Neo4j database, so they only run when
+NEO4J_TESTS=1 is set; point NEO4J_URI at a disposable database for them.
+"""
+import os
+
+os.environ.setdefault("NEO4J_PASSWORD", "test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+import pytest  # noqa: E402
+from neomodel import db  # noqa: E402
+from app.db.neo4j_base import init_neo4j, close_neo4j  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def neo4j():
+    """The neomodel connection to a reachable test database"""
+    if os.environ.get("NEO4J_TESTS") != "1":
+        pytest.skip("set NEO4J_TESTS=1 to run tests against Neo4j")
+    init_neo4j()
+    try:
+        db.cypher_query("RETURN 1")
+    except Exception as e:
+        close_neo4j()
+        pytest.skip(f"Neo4j is not reachable: {e}")
+    yield db
+    close_neo4j()
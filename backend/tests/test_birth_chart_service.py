@@ -0,0 +1,148 @@
+"""
+Birth chart service tests
+"""
+import time as clock
+from datetime import date, datetime, time, timedelta, timezone
+import pytest
+from neo4j.graph import Graph, Node
+from neomodel import db
+from app.core.config import settings
+from app.models.birth_chart_neo4j import BirthChart
+from app.models.user_neo4j import User
+from app.schemas.birth_chart import BirthChartCreate
+from app.services.birth_chart_service import DELETE_CHART_QUERY, UPSERT_QUERY, BirthChartService
+from app.services.cosmic_influence_service import CosmicInfluenceService
+
+
+@pytest.fixture
+def recorded_queries(monkeypatch):
+    """Replace the database with one that records queries and echoes the upserted chart"""
+    queries = []
+
+    def cypher_query(self, query, params=None, **kwargs):
+        queries.append((query, params))
+        chart = Node(Graph(), "4:test:1", 1, ["BirthChart"], {
+            **params['props'], 'uid': params['chart_uid'],
+            'calculated_at': params['now'], 'updated_at': params['now'],
+        })
+        detail = Node(Graph(), "4:test:2", 2, ["BirthChartDetail"], {
+            **params['detail'], 'chart_uid': params['chart_uid'],
+        })
+        return [[chart, detail]], ['c', 'd']
+
+    monkeypatch.setattr(type(db), "cypher_query", cypher_query)
+    monkeypatch.setattr(settings, "ASTROLOGY_ENGINE", "swisseph")
+    return queries
+
+
+def chart_request() -> BirthChartCreate:
+    return BirthChartCreate(
+        birth_date=date(1990, 8, 15),
+        birth_time=time(14, 30),
+        birth_latitude=28.6139,
+        birth_longitude=77.2090,
+        birth_place="New Delhi",
+        timezone="Asia/Kolkata",
+    )
+
+
+def test_create_or_update_is_one_round_trip(recorded_queries):
+    chart = BirthChartService.create_or_update(User(uid="user-1"), chart_request())
+
+    assert [query for query, _ in recorded_queries] == [UPSERT_QUERY]
+    assert chart.lagna and chart.planets_data['planets']
+
+
+def test_create_or_update_stamps_utc_regardless_of_host_timezone(recorded_queries, monkeypatch):
+    if not hasattr(clock, "tzset"):
+        pytest.skip("time.tzset is not available on this platform")
+    monkeypatch.setenv("TZ", "Asia/Kolkata")
+    clock.tzset()
+    try:
+        before = datetime.now(timezone.utc).timestamp()
+        BirthChartService.create_or_update(User(uid="user-1"), chart_request())
+        after = datetime.now(timezone.utc).timestamp()
+    finally:
+        monkeypatch.undo()
+        clock.tzset()
+
+    _, params = recorded_queries[0]
+    assert before <= params['now'] <= after
+
+
+def test_create_or_update_drops_current_daily_influences(recorded_queries):
+    BirthChartService.create_or_update(User(uid="user-1"), chart_request())
+
+    _, params = recorded_queries[0]
+    assert params['influence_from'] == CosmicInfluenceService.current_from()
+
+
+def test_delete_drops_current_daily_influences(monkeypatch):
+    queries = []
+    monkeypatch.setattr(type(db), "cypher_query",
+                        lambda self, query, params=None, **kwargs: queries.append((query, params)) or ([], []))
+
+    BirthChartService.delete(BirthChart(uid="chart-1"))
+
+    assert queries == [(DELETE_CHART_QUERY, {
+        'chart_uid': "chart-1", 'influence_from': CosmicInfluenceService.current_from(),
+    })]
+
+
+SEED_USER_QUERY = """
+CREATE (:User {uid: 'bcinf-test-user', email: 'bcinf-test@example.com'})
+"""
+
+ADD_INFLUENCES_QUERY = """
+MATCH (u:User {uid: 'bcinf-test-user'})
+UNWIND $dates AS day
+CREATE (u)-[:HAS_DAILY_INFLUENCE]->(:DailyInfluence {uid: 'bcinf-test-' + day, key: 'bcinf-test-user:' + day,
+                                                    date: day})
+"""
+
+REMAINING_INFLUENCES_QUERY = """
+MATCH (d:DailyInfluence) WHERE d.uid STARTS WITH 'bcinf-test-'
+RETURN d.date ORDER BY d.date
+"""
+
+CLEANUP_INFLUENCES_QUERY = """
+MATCH (u:User {uid: 'bcinf-test-user'})
+OPTIONAL MATCH (u)-[:HAS_BIRTH_CHART]->(c:BirthChart)
+OPTIONAL MATCH (c)-[:HAS_DETAIL]->(d:BirthChartDetail)
+OPTIONAL MATCH (u)-[:HAS_DAILY_INFLUENCE]->(i:DailyInfluence)
+DETACH DELETE u, c, d, i
+"""
+
+
+@pytest.fixture
+def influences(neo4j, monkeypatch):
+    """A user with daily influences from three days ago to tomorrow; returns the dates that must survive"""
+    monkeypatch.setattr(settings, "ASTROLOGY_ENGINE", "swisseph")
+    today = datetime.now(timezone.utc).date()
+    dates = [(today + timedelta(days=offset)).isoformat() for offset in (-3, -2, -1, 0, 1)]
+    neo4j.cypher_query(CLEANUP_INFLUENCES_QUERY)
+    neo4j.cypher_query(SEED_USER_QUERY)
+    neo4j.cypher_query(ADD_INFLUENCES_QUERY, {'dates': dates})
+    yield [day for day in dates if day < CosmicInfluenceService.current_from()]
+    neo4j.cypher_query(CLEANUP_INFLUENCES_QUERY)
+
+
+def remaining_influences(neo4j):
+    results, _ = neo4j.cypher_query(REMAINING_INFLUENCES_QUERY)
+    return [row[0] for row in results]
+
+
+def test_upsert_deletes_current_influences_and_keeps_history(neo4j, influences):
+    BirthChartService.create_or_update(User(uid="bcinf-test-user"), chart_request())
+
+    assert remaining_influences(neo4j) == influences
+
+
+def test_delete_deletes_current_influences_and_keeps_history(neo4j, influences):
+    chart = BirthChartService.create_or_update(User(uid="bcinf-test-user"), chart_request())
+    today = datetime.now(timezone.utc).date().isoformat()
+    neo4j.cypher_query(ADD_INFLUENCES_QUERY, {'dates': [today]})  # Computed from the chart just stored
+
+    BirthChartService.delete(chart)
+
+    assert remaining_influences(neo4j) == influences
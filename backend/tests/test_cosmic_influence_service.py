@@ -0,0 +1,44 @@
+"""
+Cosmic influence service tests
+"""
+from datetime import datetime, timezone
+import pytest
+from neomodel import db
+from app.services.cosmic_influence_service import PRUNE_QUERY, CosmicInfluenceService
+
+NOW = datetime(2024, 5, 10, 1, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def pruned(monkeypatch):
+    """Queries run against a graph that deletes the given count per statement"""
+    counts, queries = [], []
+
+    def cypher_query(self, query, params=None, **kwargs):
+        queries.append((query, params))
+        return [[counts.pop(0) if counts else 0]], ['count(d)']
+
+    monkeypatch.setattr(type(db), "cypher_query", cypher_query)
+    return counts, queries
+
+
+def test_prune_deletes_in_batches_until_one_is_short(pruned):
+    counts, queries = pruned
+    counts.extend([100, 100, 7])
+
+    assert CosmicInfluenceService.prune(retention_days=30, batch_size=100, max_batches=10, now=NOW) == 207
+    assert queries == [(PRUNE_QUERY, {'before': "2024-04-10", 'limit': 100})] * 3
+
+
+def test_prune_stops_at_max_batches(pruned):
+    counts, queries = pruned
+    counts.extend([100] * 5)
+
+    assert CosmicInfluenceService.prune(retention_days=30, batch_size=100, max_batches=2, now=NOW) == 200
+    assert len(queries) == 2
+
+
+def test_prune_is_disabled_at_zero_retention(pruned):
+    _, queries = pruned
+    assert CosmicInfluenceService.prune(retention_days=0, now=NOW) == 0
+    assert queries == []
@@ -0,0 +1,52 @@
+"""
+Astrology engine parity tests
+"""
+from datetime import datetime
+import pytest
+from app.services.astrology_service import AstrologyService
+from app.tools.engine_parity import absolute_longitudes, random_inputs
+
+TOLERANCE = 0.05  # Degrees
+
+# Apparent geocentric longitudes at J2000.0 (2000-01-01 12:00 UT) from the
+# Astronomical Almanac, less the Lahiri ayanamsa of 23.857°
+J2000_SIDEREAL = {
+    'Sun': 256.51,
+    'Moon': 199.46,
+    'Mercury': 248.03,
+    'Venus': 217.71,
+    'Mars': 304.10,
+    'Jupiter': 1.39,
+    'Saturn': 16.54,
+    'Rahu': 101.19,  # Mean node
+    'Ketu': 281.19,
+}
+
+
+def angular_difference(a: float, b: float) -> float:
+    return abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+def test_swisseph_matches_known_sidereal_longitudes():
+    chart = AstrologyService._compute_swisseph(datetime(2000, 1, 1), "12:00", 51.4779, 0.0, "+00:00")
+    longitudes = absolute_longitudes(chart)
+
+    for name, expected in J2000_SIDEREAL.items():
+        assert angular_difference(longitudes[name], expected) <= TOLERANCE, name
+    assert (chart['sun_sign'], chart['moon_sign']) == ("Sagittarius", "Libra")
+
+
+def test_swisseph_matches_vedicastro():
+    try:
+        from vedicastro.VedicAstro import VedicHoroscopeData  # noqa: F401
+    except (ImportError, AttributeError) as e:
+        # vedicastro needs flatlib's sidereal branch; the PyPI release fails on import
+        pytest.skip(f"vedicastro cannot be imported: {e!r}")
+
+    for item in random_inputs(50, seed=7):
+        expected = absolute_longitudes(AstrologyService._compute_vedicastro(**item))
+        actual = absolute_longitudes(AstrologyService._compute_swisseph(**item))
+        shared = expected.keys() & actual.keys()
+        assert {'Asc', 'Sun', 'Moon'} <= shared
+        for name in shared:
+            assert angular_difference(actual[name], expected[name]) <= TOLERANCE, (name, item)
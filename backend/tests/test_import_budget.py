@@ -0,0 +1,13 @@
+"""
+Cold-start import-time budget
+"""
+from app.tools.import_budget import DEFAULT_BUDGET_MS, measure, total_import_ms
+
+
+def test_api_import_stays_within_budget():
+    total_ms = total_import_ms(measure("app.main"), "app.main")
+
+    assert total_ms <= DEFAULT_BUDGET_MS, (
+        f"import app.main took {total_ms:.0f} ms, over the {DEFAULT_BUDGET_MS:.0f} ms budget; "
+        f"run python -m app.tools.import_budget to see the slowest modules"
+    )
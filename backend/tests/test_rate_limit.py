@@ -0,0 +1,103 @@
+"""
+Token-bucket rate limiting tests
+"""
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.main import app
+from app.repositories import user_repository
+from app.services import auth_rate_limiter
+from app.services.auth_rate_limiter import AuthRateLimiter
+from app.services.user_service import UserService
+from app.utils import rate_limit
+from app.utils.rate_limit import MemoryBackend, RateLimitBackend
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A settable stand-in for time.monotonic in the memory backend"""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_backend_requires_take():
+    with pytest.raises(TypeError):
+        RateLimitBackend()
+
+
+@pytest.mark.asyncio
+async def test_bucket_rejects_when_empty_with_retry_after(clock):
+    backend = MemoryBackend(shards=4)
+
+    assert [await backend.take("k", capacity=2, refill_per_second=0.5) for _ in range(2)] == [(True, 0.0)] * 2
+    assert await backend.take("k", capacity=2, refill_per_second=0.5) == (False, 2.0)
+
+    clock[0] += 1.5
+    admitted, retry_after = await backend.take("k", capacity=2, refill_per_second=0.5)
+    assert not admitted and retry_after == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_bucket_refills_up_to_capacity(clock):
+    backend = MemoryBackend(shards=4)
+    for _ in range(2):
+        await backend.take("k", capacity=2, refill_per_second=0.5)
+
+    clock[0] += 2.0
+    assert await backend.take("k", capacity=2, refill_per_second=0.5) == (True, 0.0)
+    assert (await backend.take("k", capacity=2, refill_per_second=0.5))[0] is False
+
+    clock[0] += 3600.0
+    results = [(await backend.take("k", capacity=2, refill_per_second=0.5))[0] for _ in range(3)]
+    assert results == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_buckets_are_per_key(clock):
+    backend = MemoryBackend(shards=4)
+    assert (await backend.take("a", capacity=1, refill_per_second=1))[0]
+    assert (await backend.take("b", capacity=1, refill_per_second=1))[0]
+    assert not (await backend.take("a", capacity=1, refill_per_second=1))[0]
+
+
+@pytest.fixture
+def limited_login(monkeypatch, clock):
+    """The app with a one-attempt-per-email limiter and no database behind login"""
+    limiter = AuthRateLimiter(MemoryBackend(shards=4), ip_burst=100, ip_per_minute=60,
+                              email_burst=1, email_per_minute=1)
+    monkeypatch.setattr(settings, "AUTH_RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(auth_rate_limiter, "_rate_limiter", limiter)
+
+    authenticated = []
+
+    async def authenticate_async(email, password):
+        authenticated.append(email)
+        return None
+
+    async def no_database(*args, **kwargs):
+        pytest.fail("Neo4j was queried")
+
+    monkeypatch.setattr(UserService, "authenticate_async", staticmethod(authenticate_async))
+    monkeypatch.setattr(user_repository, "read_query", no_database)
+    monkeypatch.setattr(user_repository, "write_query", no_database)
+    return limiter, authenticated
+
+
+def test_login_is_rejected_before_authentication(limited_login):
+    limiter, authenticated = limited_login
+    client = TestClient(app)
+    credentials = {'email': "Asha@Example.com", 'password': "wrong-password"}
+
+    assert client.post("/api/v1/auth/login", json=credentials).status_code == 401
+    assert len(authenticated) == 1
+
+    # Same bucket: emails are case-folded
+    response = client.post("/api/v1/auth/login", json={**credentials, 'email': "asha@example.com"})
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "60"
+    assert len(authenticated) == 1
+
+    stats = limiter.stats()
+    assert stats['admitted'] == 1
+    assert stats['rejected'] == {'ip': 0, 'email': 1}
@@ -0,0 +1,42 @@
+"""
+Schema service tests
+"""
+import pytest
+from neomodel import db
+from app.services.schema_service import SchemaService
+
+
+@pytest.fixture
+def unverified(monkeypatch):
+    monkeypatch.setattr(SchemaService, "_verified", False)
+    monkeypatch.setattr(SchemaService, "_missing", [])
+
+
+def test_verify_only_reads_indexes(unverified, monkeypatch):
+    queries = []
+
+    def cypher_query(self, query, params=None, **kwargs):
+        queries.append(query)
+        return [], []
+
+    monkeypatch.setattr(type(db), "cypher_query", cypher_query)
+    monkeypatch.setattr(SchemaService, "bootstrap", classmethod(lambda cls: pytest.fail("verify bootstrapped")))
+
+    assert SchemaService.verify() is False
+    assert len(queries) == 1 and queries[0].startswith("SHOW INDEXES")
+    assert SchemaService.status()['missing_indexes']
+
+
+def test_verify_latches_once_indexes_are_online(unverified, monkeypatch):
+    online = [([label], [prop]) for label, prop, _ in SchemaService.required_schema()]
+    calls = []
+
+    def cypher_query(self, query, params=None, **kwargs):
+        calls.append(query)
+        return online, ['labelsOrTypes', 'properties']
+
+    monkeypatch.setattr(type(db), "cypher_query", cypher_query)
+
+    assert SchemaService.verify() is True
+    assert SchemaService.verify() is True
+    assert len(calls) == 1
@@ -0,0 +1,75 @@
+"""
+Chart similarity service tests
+"""
+import pytest
+from neomodel import db
+from app.core.config import settings
+from app.services.similarity_service import (
+    CHART_CHANGES_QUERY, CHART_PLANETS_PAGE_QUERY, REFRESH_OVERLAP_SECONDS, ChartSimilarityService,
+)
+from app.utils.vector_index import VectorIndex
+
+
+def planets_data(sun_degree: float) -> dict:
+    return {'planets': [{'name': "Sun", 'sign': "Leo", 'degree': sun_degree}]}
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """A fake graph of (uid, planets_data, updated_at) rows and the queries run against it"""
+    charts = [("chart-a", planets_data(10.0), 1000.0)]
+    queries = []
+
+    def cypher_query(self, query, params=None, **kwargs):
+        queries.append((query, params))
+        if query == CHART_PLANETS_PAGE_QUERY:
+            return [row for row in charts if row[0] > params['after']][:params['limit']], []
+        if query == CHART_CHANGES_QUERY:
+            position = (params['since'], params['after'])
+            changed = sorted((row for row in charts if (row[2], row[0]) > position), key=lambda row: (row[2], row[0]))
+            return changed[:params['limit']], []
+        pytest.fail(f"Unexpected query: {query}")
+
+    monkeypatch.setattr(type(db), "cypher_query", cypher_query)
+    monkeypatch.setattr(ChartSimilarityService, "_index", VectorIndex(dim=ChartSimilarityService.DIM))
+    for name, value in (("_loaded", False), ("_synced_to", 0.0), ("_checked_at", 0.0), ("_refreshed", 0)):
+        monkeypatch.setattr(ChartSimilarityService, name, value)
+    monkeypatch.setattr(settings, "SIMILARITY_REFRESH_SECONDS", 30)
+    return charts, queries
+
+
+def test_refresh_indexes_charts_written_by_other_workers(graph, monkeypatch):
+    charts, queries = graph
+    ChartSimilarityService.load()
+    charts.append(("chart-b", planets_data(20.0), 1050.0))
+
+    assert ChartSimilarityService.refresh() == 0  # Checked at load time
+    monkeypatch.setattr(ChartSimilarityService, "_checked_at", 0.0)
+    assert ChartSimilarityService.refresh() == 2  # chart-a is inside the overlap window
+
+    assert ChartSimilarityService._index.get("chart-b") is not None
+    assert ChartSimilarityService._synced_to == 1050.0
+    assert queries[-1] == (CHART_CHANGES_QUERY, {
+        'since': 1000.0 - REFRESH_OVERLAP_SECONDS, 'after': '', 'limit': 5000,
+    })
+
+
+def test_refresh_pages_through_charts_sharing_a_stamp(graph, monkeypatch):
+    charts, queries = graph
+    ChartSimilarityService.load()
+    charts.extend((f"chart-{i}", planets_data(float(i)), 1100.0) for i in range(5))
+    monkeypatch.setattr(ChartSimilarityService, "_checked_at", 0.0)
+
+    assert ChartSimilarityService.refresh(page_size=2) == 6
+    assert all(ChartSimilarityService._index.get(f"chart-{i}") is not None for i in range(5))
+    assert queries[-1][1]['after'] == "chart-4" and queries[-1][1]['since'] == 1100.0
+
+
+def test_refresh_is_disabled_at_zero(graph, monkeypatch):
+    _, queries = graph
+    ChartSimilarityService.load()
+    monkeypatch.setattr(settings, "SIMILARITY_REFRESH_SECONDS", 0)
+    monkeypatch.setattr(ChartSimilarityService, "_checked_at", 0.0)
+
+    assert ChartSimilarityService.refresh() == 0
+    assert [query for query, _ in queries] == [CHART_PLANETS_PAGE_QUERY, CHART_PLANETS_PAGE_QUERY]
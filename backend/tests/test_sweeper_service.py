@@ -0,0 +1,46 @@
+"""
+Orphan sweeper tests (need Neo4j)
+"""
+import pytest
+from app.services.sweeper_service import SweeperService
+
+SEED_QUERY = """
+MERGE (r:Raag {name: 'Sweeper Test Raag'})
+CREATE (r)-[:RAAG_OF_TRACK]->(:Track {uid: 'sweeper-test-catalog-track', title: 'Catalog'})
+CREATE (p:Playlist {uid: 'sweeper-test-editorial', title: 'Daily', playlist_type: 'daily',
+                    is_personalized: false})
+CREATE (p)-[:CONTAINS_TRACK]->(:Track {uid: 'sweeper-test-playlist-track', title: 'In playlist'})
+CREATE (:Track {uid: 'sweeper-test-orphan-track', title: 'Orphan'})
+CREATE (:Playlist {uid: 'sweeper-test-orphan-playlist', title: 'Mine', playlist_type: 'custom',
+                   is_personalized: true})
+"""
+
+REMAINING_QUERY = """
+MATCH (n) WHERE n.uid STARTS WITH 'sweeper-test-'
+RETURN collect(n.uid)
+"""
+
+CLEANUP_QUERY = """
+MATCH (n) WHERE n.uid STARTS WITH 'sweeper-test-' OR n.name = 'Sweeper Test Raag'
+DETACH DELETE n
+"""
+
+
+@pytest.fixture
+def seeded(neo4j):
+    neo4j.cypher_query(CLEANUP_QUERY)
+    neo4j.cypher_query(SEED_QUERY)
+    yield neo4j
+    neo4j.cypher_query(CLEANUP_QUERY)
+
+
+def test_sweep_keeps_catalog_tracks_and_editorial_playlists(seeded):
+    SweeperService.sweep(batch_size=1000, max_batches=1000)
+
+    results, _ = seeded.cypher_query(REMAINING_QUERY)
+    remaining = set(results[0][0])
+    assert remaining == {
+        'sweeper-test-catalog-track',
+        'sweeper-test-editorial',
+        'sweeper-test-playlist-track',
+    }
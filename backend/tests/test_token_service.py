@@ -0,0 +1,101 @@
+"""
+Token cache and revocation tests
+"""
+import time
+from datetime import timedelta
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from app.api.v1.dependencies.auth import get_current_principal
+from app.api.v1.endpoints.auth import refresh_token
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.user_neo4j import User
+from app.repositories.user_repository import UserRepository
+from app.schemas.auth import RefreshTokenRequest
+from app.schemas.user import UserUpdate
+from app.services import user_service
+from app.services.hash_executor import shutdown_hash_executor
+from app.services.token_service import TokenService
+from app.services.user_service import UserService
+from app.utils.cache import TTLCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_tables(monkeypatch):
+    monkeypatch.setattr(TokenService, "_cache", TTLCache(maxsize=100, ttl_seconds=3600))
+    monkeypatch.setattr(TokenService, "_revoked", {})
+    monkeypatch.setattr(settings, "CLAIMS_PRINCIPALS", True)
+
+
+@pytest.fixture
+def stored(monkeypatch):
+    """An active user whose repository writes are echoed back without a database"""
+    user = User(uid="token-user", email="asha@example.com", name="Asha", hashed_password="x",
+                is_active=True, token_version=0)
+
+    async def update(target, values):
+        for field, value in values.items():
+            setattr(target, field, value)
+        return target
+
+    async def delete(uid):
+        return []
+
+    monkeypatch.setattr(UserRepository, "update", staticmethod(update))
+    monkeypatch.setattr(UserRepository, "delete", staticmethod(delete))
+    monkeypatch.setattr(user_service, "get_password_hash", lambda password: f"hashed:{password}")
+    yield user
+    shutdown_hash_executor()
+
+
+def bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def test_cached_payload_expires_at_exp(monkeypatch):
+    token = create_access_token({"sub": "token-user", "active": True, "ver": 0}, timedelta(minutes=5))
+    payload = TokenService.decode_access(token)
+    assert TokenService.decode_access(token) is payload  # Served from the cache
+
+    monkeypatch.setattr(time, "time", lambda: payload["exp"] + 1)
+    assert TokenService.decode_access(token) is None
+    assert TokenService._cache.get(token) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("change", ["deactivate", "delete", "password"])
+async def test_changes_revoke_issued_tokens(stored, change):
+    old = bearer(TokenService.issue(stored).access_token)
+    assert (await get_current_principal(old)).uid == stored.uid
+
+    if change == "deactivate":
+        await UserService.set_active_async(stored, False)
+    elif change == "delete":
+        await UserService.delete_async(stored)
+    else:
+        await UserService.update_async(stored, UserUpdate(password="a new password"))
+        assert stored.token_version == 1
+
+    with pytest.raises(HTTPException) as rejected:
+        await get_current_principal(old)
+    assert rejected.value.status_code == 401
+
+    if change == "password":
+        renewed = bearer(TokenService.issue(stored).access_token)
+        assert (await get_current_principal(renewed)).token_version == 1
+
+
+def test_refresh_rejects_stale_version(monkeypatch):
+    user = User(uid="token-user", email="asha@example.com", name="Asha", hashed_password="x",
+                is_active=True, token_version=0)
+    stale = TokenService.issue(user).refresh_token
+    user.token_version = 1
+    monkeypatch.setattr(UserService, "get_by_id", classmethod(lambda cls, user_id: user))
+
+    with pytest.raises(HTTPException) as rejected:
+        refresh_token(RefreshTokenRequest(refresh_token=stale))
+    assert rejected.value.status_code == 401
+
+    current = TokenService.issue(user).refresh_token
+    assert refresh_token(RefreshTokenRequest(refresh_token=current)).access_token
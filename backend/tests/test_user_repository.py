@@ -0,0 +1,62 @@
+"""
+User repository tests (need Neo4j)
+"""
+import asyncio
+import pytest
+from app.db.neo4j_base import close_async_driver
+from app.repositories.user_repository import UserRepository
+
+SEED_QUERY = """
+CREATE (u:User {uid: 'userdel-test-user', email: 'userdel-test@example.com'})
+CREATE (other:User {uid: 'userdel-test-other', email: 'userdel-test-other@example.com'})
+CREATE (u)-[:HAS_BIRTH_CHART]->(c:BirthChart {uid: 'userdel-test-chart'})
+CREATE (c)-[:HAS_DETAIL]->(:BirthChartDetail {uid: 'userdel-test-detail', chart_uid: 'userdel-test-chart'})
+CREATE (u)-[:HAS_DAILY_INFLUENCE]->(:DailyInfluence {uid: 'userdel-test-influence'})
+CREATE (u)-[:CREATED_PLAYLIST]->(mine:Playlist {uid: 'userdel-test-playlist', is_personalized: true})
+CREATE (u)-[:HAS_TRACK]->(own:Track {uid: 'userdel-test-own-track'})
+CREATE (mine)-[:CONTAINS_TRACK]->(own)
+MERGE (r:Raag {name: 'User Delete Test Raag'})
+CREATE (u)-[:HAS_TRACK]->(catalog:Track {uid: 'userdel-test-catalog-track'})
+CREATE (r)-[:RAAG_OF_TRACK]->(catalog)
+CREATE (u)-[:HAS_TRACK]->(shared:Track {uid: 'userdel-test-shared-track'})
+CREATE (other)-[:HAS_TRACK]->(shared)
+CREATE (u)-[:HAS_TRACK]->(listed:Track {uid: 'userdel-test-listed-track'})
+CREATE (:Playlist {uid: 'userdel-test-editorial', is_personalized: false})-[:CONTAINS_TRACK]->(listed)
+"""
+
+REMAINING_QUERY = """
+MATCH (n) WHERE n.uid STARTS WITH 'userdel-test-'
+RETURN collect(n.uid)
+"""
+
+CLEANUP_QUERY = """
+MATCH (n) WHERE n.uid STARTS WITH 'userdel-test-' OR n.name = 'User Delete Test Raag'
+DETACH DELETE n
+"""
+
+
+@pytest.fixture
+def seeded(neo4j):
+    neo4j.cypher_query(CLEANUP_QUERY)
+    neo4j.cypher_query(SEED_QUERY)
+    yield neo4j
+    neo4j.cypher_query(CLEANUP_QUERY)
+
+
+def test_delete_removes_what_the_user_owns_and_keeps_shared_tracks(seeded):
+    async def delete():
+        try:
+            return await UserRepository.delete('userdel-test-user')
+        finally:
+            await close_async_driver()
+
+    assert asyncio.run(delete()) == ['userdel-test-chart']
+
+    results, _ = seeded.cypher_query(REMAINING_QUERY)
+    assert set(results[0][0]) == {
+        'userdel-test-other',
+        'userdel-test-catalog-track',
+        'userdel-test-shared-track',
+        'userdel-test-listed-track',
+        'userdel-test-editorial',
+    }
@@ -0,0 +1,66 @@
+"""
+Vector index tests against exact brute-force search
+"""
+import numpy as np
+import pytest
+from app.utils.vector_index import VectorIndex
+
+DIM = 8
+
+
+def unit_vectors(rng, count: int) -> np.ndarray:
+    vectors = rng.standard_normal((count, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def brute_force(stored: dict, query: np.ndarray, k: int, exclude=None) -> list:
+    scored = sorted(((float(vector @ query), key) for key, vector in stored.items() if key != exclude), reverse=True)
+    return [key for _, key in scored[:k]]
+
+
+def assert_matches(index: VectorIndex, stored: dict, rng) -> None:
+    assert len(index) == len(stored)
+    for key, vector in stored.items():
+        np.testing.assert_array_equal(index.get(key), vector)
+    for query in unit_vectors(rng, 20):
+        exclude = next(iter(stored), None)
+        assert [key for key, _ in index.search(query, 10, exclude=exclude)] == brute_force(stored, query, 10, exclude)
+
+
+@pytest.mark.parametrize("min_train_size", [10 ** 6, 64])  # One exact list; trained lists, all probed
+def test_add_replace_remove_match_brute_force(min_train_size):
+    rng = np.random.default_rng(1)
+    index = VectorIndex(dim=DIM, lists=8, probes=8, min_train_size=min_train_size)
+    stored = {}
+
+    for i, vector in enumerate(unit_vectors(rng, 300)):  # Grows past 4x the trained size: retrains
+        index.add(f"k{i}", vector)
+        stored[f"k{i}"] = vector
+    assert index.stats()['lists'] == (1 if min_train_size > 300 else 8)
+    assert_matches(index, stored, rng)
+
+    for i, vector in zip(range(0, 300, 7), unit_vectors(rng, 300)):
+        index.add(f"k{i}", vector)
+        stored[f"k{i}"] = vector
+    assert_matches(index, stored, rng)
+
+    # Removing from the middle of a list swaps its last entry into the gap
+    for i in range(0, 300, 3):
+        assert index.remove(f"k{i}")
+        del stored[f"k{i}"]
+    assert not index.remove("k0")
+    assert index.get("k0") is None
+    assert_matches(index, stored, rng)
+
+
+def test_build_replaces_contents():
+    rng = np.random.default_rng(2)
+    index = VectorIndex(dim=DIM, lists=4, probes=4, min_train_size=16)
+    index.add("old", unit_vectors(rng, 1)[0])
+
+    vectors = unit_vectors(rng, 100)
+    index.build([f"b{i}" for i in range(100)], vectors)
+
+    assert "old" not in index
+    assert index.stats() == {'size': 100, 'lists': 4, 'probes': 4}
+    assert_matches(index, {f"b{i}": vector for i, vector in enumerate(vectors)}, rng)